@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Analysis Cache - Persistent FileAnalysis Store
+Path: scripts/analysis_cache.py
+Purpose: Remember per-file analysis results between runs so unchanged files are not re-read
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# Bump when the table layout changes
+SCHEMA_VERSION = 1
+
+# Default location, relative to the project root
+DEFAULT_CACHE_DIR = Path(".cache") / "project_analyzer"
+
+def content_digest(data: bytes) -> str:
+    """Hash file contents the same way everywhere the cache is consulted"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def load_digests(cache_dir: Path) -> Dict[str, Tuple[int, int, str]]:
+    """Content hashes recorded by earlier runs, as {path: (size, mtime_ns, digest)}.
+
+    Digests depend only on file bytes, so they stay usable even when the
+    pattern fingerprint changed. Returns {} if there is no cache yet.
+    """
+    db_path = Path(cache_dir) / "analysis.sqlite3"
+    if not db_path.exists():
+        return {}
+    try:
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            rows = conn.execute("SELECT path, size, mtime_ns, digest FROM files WHERE digest IS NOT NULL").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    return {path: (size, mtime_ns, digest) for path, size, mtime_ns, digest in rows}
+
+class AnalysisCache:
+    """SQLite cache of compact analysis rows keyed by path, size, mtime and content hash.
+
+    A lookup whose size and mtime match is a hit without reading the file.
+    When only the metadata changed (touch, checkout), the caller re-reads the
+    file and a matching content hash still counts as a hit. The whole cache
+    is dropped when the analyzer's pattern fingerprint changes.
+    """
+
+    def __init__(self, cache_dir: Path, version: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "analysis.sqlite3"
+        self.version = f"{SCHEMA_VERSION}:{version}"
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT,"
+            " suggested TEXT, reason TEXT, confidence REAL, flags INTEGER)"
+        )
+
+        stored = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if stored is None or stored[0] != self.version:
+            # Patterns or layout changed: every cached classification is stale
+            self.conn.execute("DELETE FROM files")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+            self.conn.commit()
+
+    def lookup(self, path: str, size: int, mtime_ns: int) -> Tuple[Optional[tuple], Optional[str]]:
+        """Return (row, None) on a metadata hit, else (None, previously stored digest or None)"""
+        record = self.conn.execute(
+            "SELECT size, mtime_ns, digest, suggested, reason, confidence, flags FROM files WHERE path = ?",
+            (path,)
+        ).fetchone()
+        if record is None:
+            return None, None
+        if record[0] == size and record[1] == mtime_ns:
+            self.hits += 1
+            return tuple(record[3:]), None
+        return None, record[2]
+
+    def revalidate(self, path: str, size: int, mtime_ns: int) -> Optional[tuple]:
+        """Accept a stored row whose content hash matched; refresh its metadata"""
+        record = self.conn.execute(
+            "SELECT suggested, reason, confidence, flags FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if record is None:
+            return None
+        self.conn.execute(
+            "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (size, mtime_ns, path)
+        )
+        self.hits += 1
+        return tuple(record)
+
+    def store(self, path: str, size: int, mtime_ns: int, digest: str, row: tuple) -> None:
+        """Record a freshly computed analysis row"""
+        self.misses += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, digest, *row)
+        )
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Drop the rows of files that no longer exist"""
+        self.conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in paths))
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for the report"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        """Flush pending writes and release the database"""
+        self.conn.commit()
+        self.conn.close()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Analysis Session - One Analysis Per Invocation
+Path: scripts/analysis_session.py
+Purpose: Share one project report between run_analysis, the organizer and the auto-fixer, in memory or saved to disk
+"""
+
+import os
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+from project_analyzer import FileAnalysis, ProjectAnalyzer, json_default, report_from_json
+from analyzer_daemon import fetch_report
+from destination_rules import signals_from_analysis
+
+# Bump when the saved session layout changes
+SESSION_VERSION = 1
+
+class AnalysisSession:
+    """The report of one crawl, computed on first use and reused by every consumer.
+
+    The report comes from the running analyzer daemon when there is one,
+    else from an in-process ProjectAnalyzer. Consumers look files up in it
+    (analysis(), signals()) instead of reading sources again. A session can
+    be saved to disk and loaded by a later invocation; stale_files() tells
+    which analyzed files changed since, by their size and mtime.
+    """
+
+    def __init__(self, project_root: str = ".", use_daemon: bool = True,
+                 analyzer: Optional[ProjectAnalyzer] = None, **analyzer_options):
+        self.project_root = Path(project_root).resolve()
+        self.use_daemon = use_daemon
+        self.analyzer_options = analyzer_options
+        self._analyzer = analyzer
+        self._report: Optional[Dict] = None
+        self._index: Optional[Dict[str, FileAnalysis]] = None
+        self.file_stats: Dict[str, List[int]] = {}
+        # Where the report came from: 'daemon', 'analyzer' or the session file
+        self.source: Optional[str] = None
+
+    @property
+    def analyzer(self) -> ProjectAnalyzer:
+        if self._analyzer is None:
+            self._analyzer = ProjectAnalyzer(str(self.project_root), **self.analyzer_options)
+        return self._analyzer
+
+    def report(self) -> Dict:
+        """The project report, crawling the project only the first time it is asked for"""
+        if self._report is None:
+            report = None
+            if self.use_daemon:
+                report = fetch_report(self.project_root, self.analyzer.report_fingerprint())
+            if report is None:
+                report = self.analyzer.generate_report()
+                self.source = 'analyzer'
+            else:
+                print("⚡ Using analysis from the running analyzer daemon")
+                self.source = 'daemon'
+            self._report = report
+        return self._report
+
+    def invalidate(self) -> None:
+        """Forget the report, e.g. after files were moved; the next report() crawls again"""
+        self._report = None
+        self._index = None
+        self.file_stats = {}
+        self.source = None
+
+    def analyses(self) -> Dict[str, FileAnalysis]:
+        """Every FileAnalysis of the report by file path"""
+        if self._index is None:
+            self._index = {
+                analysis.filepath: analysis
+                for analyses in self.report()['detailed_analysis'].values()
+                for analysis in analyses
+            }
+        return self._index
+
+    def analysis(self, path) -> Optional[FileAnalysis]:
+        """The report's analysis of a file, or None if the crawl did not cover it"""
+        index = self.analyses()
+        return index.get(str(path)) or index.get(str(Path(path).resolve()))
+
+    def signals(self, path) -> Optional[Dict[str, bool]]:
+        """Content predicates for destination rules, without reading the file"""
+        analysis = self.analysis(path)
+        return signals_from_analysis(analysis) if analysis is not None else None
+
+    def stale_files(self) -> List[str]:
+        """Analyzed files whose size or mtime changed since the session was saved"""
+        stale = []
+        for filepath, (size, mtime_ns) in self.file_stats.items():
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                stale.append(filepath)
+                continue
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                stale.append(filepath)
+        return stale
+
+    def save(self, path) -> None:
+        """Write the report and the stats of every analyzed file (computing the report if needed)"""
+        report = self.report()
+        stats = {}
+        for filepath in self.analyses():
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+            stats[filepath] = [stat.st_size, stat.st_mtime_ns]
+        data = {
+            'version': SESSION_VERSION,
+            'project_root': str(self.project_root),
+            'saved_at': datetime.now().isoformat(),
+            'files': stats,
+            'report': report,
+        }
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, default=json_default)
+        os.replace(tmp_path, path)
+        self.file_stats = stats
+
+    @classmethod
+    def load(cls, path, project_root: Optional[str] = None) -> 'AnalysisSession':
+        """A session from a saved file; raises ValueError if it is for another project or version"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != SESSION_VERSION:
+            raise ValueError(f"{path}: unsupported session version {data.get('version')}")
+        session = cls(project_root or data['project_root'], use_daemon=False)
+        if str(session.project_root) != data['project_root']:
+            raise ValueError(f"{path}: session is for {data['project_root']}, not {session.project_root}")
+        session._report = report_from_json(data['report'])
+        session.file_stats = data['files']
+        session.source = str(path)
+        return session
+
+def open_session(path, project_root: str = ".") -> AnalysisSession:
+    """A saved session, warning when analyzed files changed since it was saved"""
+    session = AnalysisSession.load(path, project_root)
+    stale = session.stale_files()
+    if stale:
+        print(f"⚠️  {len(stale)} analyzed files changed since {path} was saved; re-run the analysis to refresh it")
+    else:
+        print(f"📦 Using saved analysis from {path}")
+    return session
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Analyze the project once and save the session for later tools')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--output', default='analysis-session.json', help='Session file to write')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes (0 = CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-analyze every file instead of using the analysis cache')
+    parser.add_argument('--no-daemon', action='store_true', help='Analyze in-process even if the analyzer daemon is running')
+
+    args = parser.parse_args()
+
+    session = AnalysisSession(args.project_root, use_daemon=not args.no_daemon,
+                              jobs=args.jobs, use_cache=not args.no_cache)
+    session.save(args.output)
+    print(f"💾 Session with {len(session.file_stats)} files saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Analyzer Daemon - Warm In-Memory Analysis Index
+Path: scripts/analyzer_daemon.py
+Purpose: Keep FileAnalysis results in memory and answer queries over a local Unix socket
+"""
+
+import os
+import sys
+import json
+import signal
+import socket
+import threading
+import socketserver
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from datetime import datetime
+from analysis_cache import DEFAULT_CACHE_DIR
+from project_analyzer import (
+    AnalysisStore, DETECTORS, ENUMERATORS, FileAnalysis, ProjectAnalyzer, json_default,
+    report_from_json,
+)
+
+SOCKET_NAME = "daemon.sock"
+
+def socket_path(project_root) -> Path:
+    """Where the daemon for a project listens"""
+    return Path(project_root).resolve() / DEFAULT_CACHE_DIR / SOCKET_NAME
+
+class IndexEntry(NamedTuple):
+    """One indexed file and the metadata it was analyzed at"""
+    category: str
+    size: int
+    mtime_ns: int
+    analysis: FileAnalysis
+
+class AnalyzerDaemon:
+    """In-memory index of FileAnalysis results, refreshed by polling mtimes.
+
+    A background thread re-walks the project every poll interval and only
+    re-analyzes files whose size or mtime changed. Queries refresh once more
+    before answering, so replies never lag behind the files on disk.
+    """
+
+    def __init__(self, project_root: str = ".", poll_interval: float = 2.0, **analyzer_options):
+        self.analyzer = ProjectAnalyzer(project_root, **analyzer_options)
+        self.project_root = self.analyzer.project_root
+        self.poll_interval = poll_interval
+        self.index: Dict[str, IndexEntry] = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.started = datetime.now().isoformat()
+        self.refreshes = 0
+
+    def refresh(self) -> int:
+        """Bring the index up to date; return the number of added, changed or removed files"""
+        with self.lock:
+            index = {}
+            changed = 0
+            self.analyzer.open_cache()
+            try:
+                for category, path in self.analyzer.iter_project_files():
+                    key = str(path)
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    entry = self.index.get(key)
+                    if (entry is not None and entry.category == category
+                            and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns):
+                        index[key] = entry
+                        continue
+                    analysis = self.analyzer.analyze_cached(path)
+                    index[key] = IndexEntry(category, stat.st_size, stat.st_mtime_ns, analysis)
+                    changed += 1
+            finally:
+                self.analyzer.close_cache()
+            changed += len(self.index.keys() - index.keys())
+            self.index = index
+            self.refreshes += 1
+            return changed
+
+    def poll(self) -> None:
+        """Background refresh loop"""
+        while not self.stopped.wait(self.poll_interval):
+            try:
+                changed = self.refresh()
+            except Exception as e:
+                print(f"⚠️  Refresh failed: {e}", file=sys.stderr)
+                continue
+            if changed:
+                print(f"🔄 Re-indexed {changed} changed files")
+
+    def store(self) -> AnalysisStore:
+        """The current index as the AnalysisStore crawl_project would return"""
+        store = AnalysisStore()
+        for entry in self.index.values():
+            store.add(entry.category, entry.analysis)
+        return store
+
+    def analyze_path(self, path: str) -> FileAnalysis:
+        """Analysis for one file, from the index when it is current"""
+        filepath = Path(path)
+        if not filepath.is_absolute():
+            filepath = self.project_root / filepath
+        entry = self.index.get(str(filepath))
+        stat = filepath.stat()
+        if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return entry.analysis
+        return self.analyzer.analyze_file_content(filepath)
+
+    def handle(self, request: Dict):
+        """Dispatch one decoded request and return its result"""
+        op = request.get('op')
+        if op == 'ping':
+            return {
+                'pid': os.getpid(),
+                'project_root': str(self.project_root),
+                'started': self.started,
+                'indexed_files': len(self.index),
+                'refreshes': self.refreshes,
+            }
+        if op == 'analyze':
+            return self.analyze_path(request['path'])
+        if op == 'shutdown':
+            self.stopped.set()
+            return {'stopping': True}
+
+        self.refresh()
+        if op == 'extension_issues':
+            return [
+                entry.analysis for entry in self.index.values()
+                if entry.analysis.suggested_extension != entry.analysis.current_extension
+            ]
+        if op == 'destinations':
+            downloads = [entry.analysis for entry in self.index.values() if entry.category == 'downloads']
+            return self.analyzer.suggest_file_destinations(downloads)
+        if op == 'report':
+            report = self.analyzer.build_report(self.store())
+            report['daemon'] = {'pid': os.getpid(), 'indexed_files': len(self.index),
+                                'fingerprint': self.analyzer.report_fingerprint()}
+            return report
+        raise ValueError(f"Unknown op: {op}")
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line, one JSON reply per line"""
+
+    def handle(self):
+        daemon = self.server.analyzer_daemon
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = {'ok': True, 'result': daemon.handle(json.loads(line))}
+            except Exception as e:
+                reply = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply, default=json_default).encode('utf-8') + b'\n')
+            self.wfile.flush()
+            if daemon.stopped.is_set():
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, daemon: AnalyzerDaemon):
+        self.analyzer_daemon = daemon
+        super().__init__(str(path), DaemonRequestHandler)
+
+def daemon_request(project_root, op: str, timeout: float = 60.0, **params):
+    """Send one request to the project's daemon.
+
+    Returns the result, or None when no daemon is listening (or it failed),
+    so callers can fall back to analyzing in-process.
+    """
+    path = socket_path(project_root)
+    if not hasattr(socket, 'AF_UNIX') or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(dict(params, op=op)).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    reply = json.loads(line)
+    if not reply.get('ok'):
+        print(f"⚠️  Analyzer daemon error: {reply.get('error')}", file=sys.stderr)
+        return None
+    return reply['result']
+
+def fetch_report(project_root, fingerprint: str) -> Optional[Dict]:
+    """generate_report() from a running daemon, or None to analyze in-process.
+
+    fingerprint is the caller's ProjectAnalyzer.report_fingerprint(); a daemon
+    started with other options (detector, rules, ...) is not used.
+    """
+    report = daemon_request(project_root, 'report')
+    if report is None or report.get('project_root') != str(Path(project_root).resolve()):
+        return None
+    if report.get('daemon', {}).get('fingerprint') != fingerprint:
+        print("⚠️  The running analyzer daemon uses other analysis options - analyzing in-process")
+        return None
+    return report_from_json(report)
+
+def serve(daemon: AnalyzerDaemon) -> None:
+    """Build the index, then answer queries until stopped"""
+    path = socket_path(daemon.project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        if daemon_request(daemon.project_root, 'ping', timeout=1.0) is not None:
+            print(f"❌ A daemon is already running for {daemon.project_root}")
+            sys.exit(1)
+        # Left behind by a daemon that did not exit cleanly
+        path.unlink()
+
+    print(f"🔍 Indexing {daemon.project_root}...")
+    daemon.refresh()
+    print(f"✅ Indexed {len(daemon.index)} files")
+
+    # Create the socket owner-only: a chmod after bind would leave a window where anyone could connect
+    previous_umask = os.umask(0o077)
+    try:
+        server = DaemonServer(path, daemon)
+    finally:
+        os.umask(previous_umask)
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    poller = threading.Thread(target=daemon.poll, daemon=True)
+    poller.start()
+    print(f"🔌 Listening on {path} (polling every {daemon.poll_interval}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stopped.set()
+        server.server_close()
+        if path.exists():
+            path.unlink()
+        print("👋 Daemon stopped")
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Serve project analysis from a warm in-memory index')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds between mtime polls')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Build the index without the on-disk analysis cache')
+    parser.add_argument('--detector', choices=DETECTORS, default='lexer', help='JSX/React detection method')
+    parser.add_argument('--enumerate', choices=ENUMERATORS, default='walk', help='How candidate files are found')
+    parser.add_argument('--status', action='store_true', help='Report whether a daemon is running and exit')
+    parser.add_argument('--stop', action='store_true', help='Stop the running daemon and exit')
+
+    args = parser.parse_args()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ Unix sockets are not available on this platform")
+        sys.exit(1)
+
+    if args.status or args.stop:
+        status = daemon_request(args.project_root, 'shutdown' if args.stop else 'ping', timeout=5.0)
+        if status is None:
+            print("💤 No analyzer daemon is running")
+            sys.exit(1)
+        print("🛑 Daemon stopping" if args.stop else json.dumps(status, indent=2))
+        return
+
+    daemon = AnalyzerDaemon(args.project_root, args.poll_interval, use_cache=not args.no_cache,
+                            detector=args.detector, enumeration=args.enumerate)
+    serve(daemon)
+
+if __name__ == "__main__":
+    main()
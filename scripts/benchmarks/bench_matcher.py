@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Pattern Matcher Microbenchmark
+Path: scripts/benchmarks/bench_matcher.py
+Purpose: Compare PatternMatcher and the TSX lexer against the original per-pattern re.search loop
+"""
+
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from project_analyzer import ProjectAnalyzer
+from tsx_lexer import scan_source
+
+# The pattern lists exactly as analyze_file_content used them before PatternMatcher
+LEGACY_PATTERNS = {
+    'jsx': [
+        r'<[A-Z][a-zA-Z0-9]*\s*[^>]*>',
+        r'<[a-z]+\s+[^>]*className\s*=',
+        r'<[a-z]+\s+[^>]*onClick\s*=',
+        r'React\.createElement',
+        r'jsx\s*\(',
+    ],
+    'react_imports': [
+        r'import\s+.*\s+from\s+[\'"]react[\'"]',
+        r'import\s+React\s+from',
+        r'import\s+\{.*\}\s+from\s+[\'"]react[\'"]',
+        r'import.*useState|useEffect|useContext',
+    ],
+    'components': [
+        r'export\s+default\s+function\s+[A-Z]',
+        r'export\s+function\s+[A-Z]',
+        r'const\s+[A-Z][a-zA-Z0-9]*\s*=\s*\(',
+        r'function\s+[A-Z][a-zA-Z0-9]*\s*\(',
+        r'export\s+default\s+[A-Z][a-zA-Z0-9]*',
+    ],
+}
+
+def legacy_scan(content: str) -> set:
+    """Run every pattern with its own re.search, as the analyzer used to"""
+    return {
+        name for name, patterns in LEGACY_PATTERNS.items()
+        if any(re.search(pattern, content, re.MULTILINE) for pattern in patterns)
+    }
+
+def generate_comparisons(size: int) -> str:
+    """Generate a minified bundle full of `a<b c` comparisons and no '>' at all"""
+    chunk = "for(i=0;i<n ;i++){if(a<Max b&&c<d e)total+=i}"
+    return chunk * (size // len(chunk)) + "\nexport default Screen;\n"
+
+def generate_tsx(size: int, rng: random.Random, minified: bool = False) -> str:
+    """Generate roughly `size` characters of TSX-like source"""
+    snippets = [
+        "const value{i} = compute({i}) < limit ? a{i} : b{i};",
+        "export const helper{i} = (x: number) => x * {i};",
+        "// <div> commented markup {i} without props",
+        "type Props{i} = {{ items: Array<string>; count: number }};",
+        "<div style={{{{ margin: {i} }}}} data-id=\"row{i}\"></div>",
+        "if (a{i} < b{i} && c{i} > d{i}) {{ total += {i}; }}",
+    ]
+    parts = []
+    length = 0
+    i = 0
+    separator = ' ' if minified else '\n'
+    while length < size:
+        line = rng.choice(snippets).format(i=i)
+        parts.append(line)
+        length += len(line) + 1
+        i += 1
+    body = separator.join(parts)
+    # Put the real signals at the end so every pattern has to scan the whole file
+    return body + separator + "import React from 'react';\nexport default function Screen() { return <View className=\"x\" />; }\n"
+
+def time_call(func, inputs, repeat: int) -> float:
+    """Best wall time in seconds for running func over every input"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in inputs:
+            func(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    """Main execution function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Benchmark analyze_file_content pattern matching')
+    parser.add_argument('--files', type=int, default=20, help='Generated files per shape')
+    parser.add_argument('--size', type=int, default=200_000, help='Characters per generated file')
+    parser.add_argument('--comparison-size', type=int, default=50_000,
+                        help='Characters per comparison-heavy file (the old patterns are quadratic here)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per matcher (best is reported)')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed')
+    
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    matcher = ProjectAnalyzer().matcher
+    
+    shapes = (
+        ('multi-line TSX', lambda: generate_tsx(args.size, rng, False)),
+        ('minified TSX', lambda: generate_tsx(args.size, rng, True)),
+        ('comparison-heavy bundle', lambda: generate_comparisons(args.comparison_size)),
+    )
+    for label, generate in shapes:
+        inputs = [generate() for _ in range(args.files)]
+        size = len(inputs[0])
+        
+        mismatches = sum(1 for content in inputs if legacy_scan(content) != matcher.scan(content))
+        legacy_time = time_call(legacy_scan, inputs, args.repeat)
+        matcher_time = time_call(matcher.scan, inputs, args.repeat)
+        lexer_time = time_call(scan_source, inputs, args.repeat)
+        
+        print(f"\n⏱️  {label.upper()} ({args.files} files × {size:,} chars, best of {args.repeat}):")
+        print(f"  • per-pattern re.search: {legacy_time * 1000:8.1f} ms")
+        print(f"  • PatternMatcher.scan:   {matcher_time * 1000:8.1f} ms")
+        print(f"  • tsx_lexer.scan_source: {lexer_time * 1000:8.1f} ms (strips literals, so it reads every file fully)")
+        if matcher_time > 0:
+            print(f"  • speedup: {legacy_time / matcher_time:.1f}x")
+        print(f"  • result mismatches: {mismatches}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Result Store Memory Benchmark
+Path: scripts/benchmarks/bench_memory.py
+Purpose: Compare memory held by AnalysisStore against the old dict of FileAnalysis lists
+"""
+
+import gc
+import sys
+import random
+import tracemalloc
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from project_analyzer import AnalysisStore, FileAnalysis
+
+CATEGORIES = ('downloads', 'src', 'scripts', 'other')
+
+VERDICTS = [
+    ('.tsx', 'No changes needed', 0.5),
+    ('.ts', 'No changes needed', 0.5),
+    ('.tsx', 'Contains JSX elements', 0.9),
+    ('.tsx', 'Contains React imports', 0.6),
+    ('.tsx', 'JavaScript with React should be TypeScript', 0.7),
+]
+
+def synthetic_analyses(count: int, seed: int):
+    """Yield (category, FileAnalysis) pairs shaped like a large React-Native tree"""
+    rng = random.Random(seed)
+    root = '/home/dev/lesson-plan-app'
+    for i in range(count):
+        category = CATEGORIES[1] if i % 10 else rng.choice(CATEGORIES)
+        folder = f"{root}/{category}/{rng.choice(('components', 'screens', 'services', 'utils'))}/group{i % 200}"
+        suggested, reason, confidence = rng.choice(VERDICTS)
+        current = '.ts' if suggested == '.tsx' and reason != 'No changes needed' else suggested
+        yield category, FileAnalysis(
+            filepath=f"{folder}/Module{i}{current}",
+            current_extension=current,
+            suggested_extension=suggested,
+            reason=reason,
+            confidence=confidence,
+            contains_jsx=rng.random() < 0.5,
+            contains_react_imports=rng.random() < 0.5,
+            contains_components=rng.random() < 0.3
+        )
+
+def measure(build) -> int:
+    """Bytes still allocated by the object build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+def build_dict(count: int, seed: int):
+    """The old crawl_project representation"""
+    results = {category: [] for category in CATEGORIES}
+    for category, analysis in synthetic_analyses(count, seed):
+        results[category].append(analysis)
+    return results
+
+def build_store(count: int, seed: int):
+    """The columnar AnalysisStore representation"""
+    store = AnalysisStore()
+    for category, analysis in synthetic_analyses(count, seed):
+        store.add(category, analysis)
+    return store
+
+def main():
+    """Main execution function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Benchmark analysis result memory usage')
+    parser.add_argument('--files', type=int, default=200_000, help='Synthetic analyses to hold')
+    parser.add_argument('--seed', type=int, default=11, help='Random seed')
+    
+    args = parser.parse_args()
+    
+    dict_bytes = measure(lambda: build_dict(args.files, args.seed))
+    store_bytes = measure(lambda: build_store(args.files, args.seed))
+    
+    # Sanity check that the store round-trips every field
+    assert build_store(1000, args.seed).to_dict() == build_dict(1000, args.seed)
+    
+    print(f"\n🧠 RESULT MEMORY ({args.files:,} files):")
+    print(f"  • dict of FileAnalysis lists: {dict_bytes / 1_048_576:8.1f} MiB ({dict_bytes / args.files:.0f} B/file)")
+    print(f"  • AnalysisStore columns:      {store_bytes / 1_048_576:8.1f} MiB ({store_bytes / args.files:.0f} B/file)")
+    if store_bytes:
+        print(f"  • reduction: {dict_bytes / store_bytes:.1f}x")
+
+if __name__ == "__main__":
+    main()
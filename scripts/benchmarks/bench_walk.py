@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tree Walk Benchmark
+Path: scripts/benchmarks/bench_walk.py
+Purpose: Compare the single-pass scandir walker against the old four-rglob crawl
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+benchmarks_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(benchmarks_dir.parent))
+sys.path.insert(0, str(benchmarks_dir))
+
+from project_analyzer import ProjectAnalyzer, TARGET_EXTENSIONS
+from synthetic_repo import generate_repo
+
+def legacy_rglob_walk(analyzer: ProjectAnalyzer):
+    """The original crawl_project enumeration: four rglob/glob passes"""
+    found = []
+    for category in ('downloads', 'src', 'scripts'):
+        directory = analyzer.project_root / category
+        if directory.exists():
+            for file in directory.rglob('*'):
+                if file.is_file() and file.suffix in TARGET_EXTENSIONS:
+                    found.append((category, file))
+    for file in analyzer.project_root.glob('*'):
+        if file.is_file() and file.suffix in TARGET_EXTENSIONS:
+            found.append(('other', file))
+    return found
+
+def scandir_walk(analyzer: ProjectAnalyzer):
+    """The current single-pass pruning walker"""
+    return list(analyzer.iter_project_files())
+
+def best_of(func, analyzer, repeat: int) -> float:
+    """Best wall time in seconds over several runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(analyzer)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    """Main execution function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Benchmark project tree enumeration')
+    parser.add_argument('--project-root', help='Benchmark an existing tree instead of a synthetic one')
+    parser.add_argument('--source-files', type=int, default=2000, help='Synthetic source files')
+    parser.add_argument('--vendored-files', type=int, default=20000, help='Synthetic node_modules files')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per walker (best is reported)')
+    
+    args = parser.parse_args()
+    
+    temp_dir = None
+    if args.project_root:
+        root = Path(args.project_root)
+    else:
+        temp_dir = tempfile.mkdtemp(prefix='bench_walk_')
+        root = Path(temp_dir)
+        print(f"🏗️  Building synthetic tree in {root}...")
+        generate_repo(root, files=args.source_files, file_size=200,
+                      node_modules_files=args.vendored_files, minified_files=0)
+    
+    try:
+        analyzer = ProjectAnalyzer(str(root))
+        legacy_time = best_of(legacy_rglob_walk, analyzer, args.repeat)
+        scandir_time = best_of(scandir_walk, analyzer, args.repeat)
+        
+        print(f"\n⏱️  WALK TIMES (best of {args.repeat}):")
+        print(f"  • four-rglob crawl:   {legacy_time * 1000:8.1f} ms ({len(legacy_rglob_walk(analyzer))} files)")
+        print(f"  • scandir single pass:{scandir_time * 1000:8.1f} ms ({len(scandir_walk(analyzer))} files)")
+        if scandir_time > 0:
+            print(f"  • speedup: {legacy_time / scandir_time:.1f}x")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
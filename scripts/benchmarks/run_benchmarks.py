@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite Runner
+Path: scripts/benchmarks/run_benchmarks.py
+Purpose: Time the analyzer, organizer and auto-fixer on synthetic trees and compare against JSON baselines
+"""
+
+import io
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import contextlib
+from pathlib import Path
+from datetime import datetime
+
+# Add scripts directory to path so we can import our modules
+benchmarks_dir = Path(__file__).resolve().parent
+scripts_dir = benchmarks_dir.parent
+sys.path.insert(0, str(scripts_dir))
+sys.path.insert(0, str(benchmarks_dir))
+
+from project_analyzer import ProjectAnalyzer
+from smart_file_organizer import SmartFileOrganizer
+from enhanced_auto_fix import EnhancedAutoFixer
+from synthetic_repo import generate_repo
+
+BASELINE_DIR = benchmarks_dir / "baselines"
+
+def timed(func, repeat: int, setup=None) -> float:
+    """Best wall time in seconds; setup() runs untimed before each repetition"""
+    best = float('inf')
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(argument)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best
+
+def bench_crawl(root: Path, repeat: int) -> float:
+    """Cold walk plus analysis of every file"""
+    return timed(lambda _: ProjectAnalyzer(str(root), use_cache=False).crawl_project(), repeat)
+
+def bench_analyze(root: Path, repeat: int) -> float:
+    """analyze_file_content over every candidate, excluding the walk"""
+    analyzer = ProjectAnalyzer(str(root), use_cache=False)
+    files = [file for _, file in analyzer.iter_project_files()]
+    return timed(lambda _: [analyzer.analyze_file_content(file) for file in files], repeat)
+
+def bench_organize_dry_run(root: Path, repeat: int) -> float:
+    """Full SmartFileOrganizer dry run, including its own analysis"""
+    return timed(lambda _: SmartFileOrganizer(str(root), use_cache=False).organize_project(dry_run=True), repeat)
+
+def bench_auto_fix(root: Path, repeat: int) -> float:
+    """EnhancedAutoFixer.run without the git commit"""
+    # The fixer moves files, so every repetition gets a fresh copy of the tree
+    scratch = Path(tempfile.mkdtemp(prefix='bench_fix_'))
+
+    def fresh_copy():
+        target = scratch / 'tree'
+        if target.exists():
+            shutil.rmtree(target)
+        shutil.copytree(root, target, symlinks=True)
+        return target
+
+    try:
+        return timed(lambda tree: EnhancedAutoFixer(str(tree)).run(commit=False), repeat, setup=fresh_copy)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+BENCHMARKS = {
+    'crawl_project': bench_crawl,
+    'analyze_file_content': bench_analyze,
+    'organize_project_dry_run': bench_organize_dry_run,
+    'auto_fix_run_no_commit': bench_auto_fix,
+}
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Print a comparison table; return False if any benchmark regressed beyond tolerance"""
+    ok = True
+    print(f"\n📏 COMPARED WITH BASELINE ({baseline.get('timestamp', 'unknown')}, tolerance {tolerance:.0%}):")
+    if baseline.get('params') != results['params']:
+        print("  ⚠️  Baseline was recorded with different parameters")
+    for name, seconds in results['timings'].items():
+        previous = baseline.get('timings', {}).get(name)
+        if previous is None:
+            print(f"  • {name}: {seconds * 1000:.1f} ms (no baseline)")
+            continue
+        change = (seconds - previous) / previous if previous else 0.0
+        regressed = change > tolerance
+        ok = ok and not regressed
+        emoji = "🔴" if regressed else "🟢" if change < -tolerance else "⚪"
+        print(f"  {emoji} {name}: {previous * 1000:.1f} → {seconds * 1000:.1f} ms ({change:+.0%})")
+    return ok
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run the analyzer/organizer benchmark suite')
+    parser.add_argument('--files', type=int, default=1000, help='Synthetic source files')
+    parser.add_argument('--file-size', type=int, default=2000, help='Approximate characters per source file')
+    parser.add_argument('--node-modules-files', type=int, default=5000, help='Synthetic node_modules files')
+    parser.add_argument('--minified-files', type=int, default=5, help='Long single-line bundles')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per benchmark (best is kept)')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Run a subset of benchmarks')
+    parser.add_argument('--output', help='Write results JSON to this path')
+    parser.add_argument('--save-baseline', metavar='NAME', help=f'Store results as {BASELINE_DIR.name}/NAME.json')
+    parser.add_argument('--baseline', metavar='NAME', help='Compare against a stored baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown before failing (0.25 = 25%%)')
+
+    args = parser.parse_args()
+
+    params = {
+        'files': args.files,
+        'file_size': args.file_size,
+        'node_modules_files': args.node_modules_files,
+        'minified_files': args.minified_files,
+        'repeat': args.repeat,
+    }
+
+    temp_dir = Path(tempfile.mkdtemp(prefix='bench_repo_'))
+    try:
+        root = temp_dir / 'repo'
+        print(f"🏗️  Generating synthetic repository ({args.files} files)...")
+        generate_repo(root, args.files, args.file_size, args.node_modules_files, args.minified_files)
+
+        timings = {}
+        for name in args.only or BENCHMARKS:
+            print(f"⏱️  {name}...")
+            timings[name] = BENCHMARKS[name](root, args.repeat)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'timings': timings,
+    }
+
+    print(f"\n📊 RESULTS (best of {args.repeat}):")
+    for name, seconds in timings.items():
+        print(f"  • {name}: {seconds * 1000:.1f} ms")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results saved to: {args.output}")
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        baseline_path = BASELINE_DIR / f"{args.save_baseline}.json"
+        baseline_path.write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Baseline saved to: {baseline_path}")
+
+    if args.baseline:
+        baseline_path = BASELINE_DIR / f"{args.baseline}.json"
+        if not baseline_path.exists():
+            print(f"❌ Baseline not found: {baseline_path}")
+            sys.exit(2)
+        if not compare(results, json.loads(baseline_path.read_text()), args.tolerance):
+            print("\n❌ Performance regression detected")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
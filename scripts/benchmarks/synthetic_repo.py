@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Synthetic Repository Generator
+Path: scripts/benchmarks/synthetic_repo.py
+Purpose: Build React-Native-shaped project trees of a chosen size for benchmarks
+"""
+
+import json
+import random
+from pathlib import Path
+
+COMPONENT_TEMPLATE = """import React, {{ useState }} from 'react';
+import {{ View, Text, TouchableOpacity }} from 'react-native';
+import {{ helper{index} }} from '../services/service{service}';
+
+interface Props{index} {{
+  title: string;
+  items: Array<string>;
+}}
+
+export default function Component{index}({{ title, items }}: Props{index}) {{
+  const [open, setOpen] = useState(false);
+  return (
+    <View style={{{{ padding: {index} }}}}>
+      <Text>{{title}}</Text>
+      <TouchableOpacity onPress={{() => setOpen(!open)}}>
+        <Text>{{items.length}} items</Text>
+      </TouchableOpacity>
+    </View>
+  );
+}}
+"""
+
+SCREEN_TEMPLATE = """import React from 'react';
+import {{ ScrollView }} from 'react-native';
+import Component{component} from '../components/Component{component}';
+
+export const Screen{index} = () => (
+  <ScrollView>
+    <Component{component} title="Screen {index}" items={{[]}} />
+  </ScrollView>
+);
+"""
+
+SERVICE_TEMPLATE = """import {{ createClient }} from '@supabase/supabase-js';
+
+export const helper{index} = (value: number): number => value * {index};
+
+export async function fetchLessons{index}(limit: number) {{
+  const rows: Array<Record<string, unknown>> = [];
+  for (let i = 0; i < limit; i++) {{
+    rows.push({{ id: i, weight: helper{index}(i) }});
+  }}
+  return rows;
+}}
+"""
+
+# Misnamed .ts files that really contain JSX, like the ones the analyzer hunts for
+MISNAMED_TEMPLATE = """import React from 'react';
+
+export function Badge{index}() {{
+  return <Text className="badge">{index}</Text>;
+}}
+"""
+
+FILLER_LINE = "export const filler{index}_{line} = (a: number, b: number) => (a < b ? a : b) + {line};\n"
+
+VENDOR_TEMPLATE = "module.exports = function vendor{index}(a, b) {{ return a + b + {index}; }};\n"
+
+# Downloaded files named like the ones the organizers know how to place
+DOWNLOAD_NAMES = [
+    ('App.ts', MISNAMED_TEMPLATE),
+    ('auth_service.ts', SERVICE_TEMPLATE),
+    ('encryption_service.ts', SERVICE_TEMPLATE),
+    ('storage_service.ts', SERVICE_TEMPLATE),
+    ('auth_types.ts', SERVICE_TEMPLATE),
+    ('accessible_login.ts', MISNAMED_TEMPLATE),
+    ('performing_arts_curriculum.ts', SERVICE_TEMPLATE),
+    ('lesson_templates.ts', SERVICE_TEMPLATE),
+]
+
+def pad(content: str, size: int, index: int) -> str:
+    """Append filler lines until content is roughly `size` characters"""
+    lines = []
+    length = len(content)
+    line = 0
+    while length < size:
+        text = FILLER_LINE.format(index=index, line=line)
+        lines.append(text)
+        length += len(text)
+        line += 1
+    return content + ''.join(lines)
+
+def minified_bundle(size: int, index: int) -> str:
+    """One long line of comparison-heavy minified code"""
+    chunk = f"function m{index}(a,b){{for(var i=0;i<a.length;i++)if(a[i]<b)return i;return-1}}"
+    return chunk * max(1, size // len(chunk)) + "\n"
+
+def generate_repo(root: Path, files: int = 1000, file_size: int = 2000,
+                  node_modules_files: int = 5000, minified_files: int = 5,
+                  minified_size: int = 200_000, downloads: bool = True, seed: int = 1) -> dict:
+    """Create a synthetic project under root and return a summary of what was written"""
+    rng = random.Random(seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    (root / 'package.json').write_text(json.dumps({'name': 'synthetic-lesson-app', 'private': True}, indent=2))
+    (root / 'App.tsx').write_text("import React from 'react';\nexport default function App() { return null; }\n")
+    (root / 'index.js').write_text("import { registerRootComponent } from 'expo';\nimport App from './App';\nregisterRootComponent(App);\n")
+
+    layout = {'components': 0, 'screens': 0, 'services': 0, 'misnamed': 0}
+    services = max(1, files // 4)
+    for index in range(files):
+        kind = rng.choices(['components', 'screens', 'services', 'misnamed'], weights=[4, 3, 2, 1])[0]
+        layout[kind] += 1
+        if kind == 'components':
+            path = root / 'src' / 'components' / f'Component{index}.tsx'
+            content = COMPONENT_TEMPLATE.format(index=index, service=rng.randrange(services))
+        elif kind == 'screens':
+            path = root / 'src' / 'screens' / f'Screen{index}.tsx'
+            content = SCREEN_TEMPLATE.format(index=index, component=rng.randrange(files))
+        elif kind == 'services':
+            path = root / 'src' / 'services' / f'service{index}.ts'
+            content = SERVICE_TEMPLATE.format(index=index)
+        else:
+            path = root / 'src' / 'utils' / f'badge{index}.ts'
+            content = MISNAMED_TEMPLATE.format(index=index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(pad(content, file_size, index))
+
+    for index in range(minified_files):
+        path = root / 'src' / 'vendor' / f'bundle{index}.min.js'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(minified_bundle(minified_size, index))
+
+    for index in range(node_modules_files):
+        path = root / 'node_modules' / f'pkg{index % 100}' / 'lib' / f'index{index}.js'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(VENDOR_TEMPLATE.format(index=index))
+        # Nested copies under src mimic hoisting leftovers the walker must prune
+        if index % 10 == 0:
+            nested = root / 'src' / 'node_modules' / f'pkg{index % 100}' / f'index{index}.js'
+            nested.parent.mkdir(parents=True, exist_ok=True)
+            nested.write_text(VENDOR_TEMPLATE.format(index=index))
+
+    download_count = 0
+    if downloads:
+        downloads_dir = root / 'downloads'
+        downloads_dir.mkdir(exist_ok=True)
+        for index, (name, template) in enumerate(DOWNLOAD_NAMES):
+            (downloads_dir / name).write_text(template.format(index=index, service=0, component=0))
+            download_count += 1
+        (downloads_dir / 'notes.md').write_text('# Notes\n')
+        (downloads_dir / 'setup.sh').write_text('#!/bin/sh\necho setup\n')
+        download_count += 2
+
+    return {
+        'root': str(root),
+        'source_files': files,
+        'layout': layout,
+        'minified_files': minified_files,
+        'node_modules_files': node_modules_files,
+        'download_files': download_count,
+    }
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate a synthetic React-Native project tree')
+    parser.add_argument('root', help='Directory to create the tree in')
+    parser.add_argument('--files', type=int, default=1000, help='Source files under src/')
+    parser.add_argument('--file-size', type=int, default=2000, help='Approximate characters per source file')
+    parser.add_argument('--node-modules-files', type=int, default=5000, help='Files under node_modules')
+    parser.add_argument('--minified-files', type=int, default=5, help='Long single-line bundles under src/vendor')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+
+    args = parser.parse_args()
+
+    summary = generate_repo(Path(args.root), args.files, args.file_size,
+                            args.node_modules_files, args.minified_files, seed=args.seed)
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
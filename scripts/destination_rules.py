@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Destination Rules - Where Downloaded Files Belong
+Path: scripts/destination_rules.py
+Purpose: Compile destination rules from JSON once and classify filenames through exact, token and glob indexes
+"""
+
+import re
+import json
+import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Shipped rule set, shared by ProjectAnalyzer and EnhancedAutoFixer
+DEFAULT_RULES_PATH = Path(__file__).resolve().with_name("destination_rules.json")
+
+# Content predicates a rule may require (names of SourceSignals fields)
+PREDICATES = ('jsx', 'react_imports', 'components')
+
+_TOKEN_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+
+def normalize_token(token: str) -> str:
+    """Lowercase and drop a plural 's' so 'templates' matches a 'template' rule"""
+    token = token.lower()
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        token = token[:-1]
+    return token
+
+def tokenize(stem: str) -> List[str]:
+    """Split a file stem on separators and camelCase boundaries"""
+    return sorted({normalize_token(token) for token in _TOKEN_RE.findall(stem)})
+
+class RuleMatch(NamedTuple):
+    """A classified file: where it goes and the rule that decided it"""
+    destination: str
+    rule: str
+
+class Rule(NamedTuple):
+    index: int
+    name: str
+    destination: str
+    exact: Optional[str]
+    glob: Optional[re.Pattern]
+    tokens: tuple
+    requires: tuple
+
+    def matches(self, filename: str, tokens: set, signals: Callable[[], Dict[str, bool]]) -> bool:
+        """Check every condition; content predicates are evaluated last, and only if needed"""
+        if self.exact is not None and filename != self.exact:
+            return False
+        if self.glob is not None and not self.glob.match(filename):
+            return False
+        if not tokens.issuperset(self.tokens):
+            return False
+        if self.requires:
+            found = signals()
+            return all(found.get(predicate) for predicate in self.requires)
+        return True
+
+class DestinationRules:
+    """Rules compiled into lookup indexes; the first matching rule in config order wins.
+
+    Exact names go in a hash map, extension-only globs ('*.sql') in a map
+    keyed by suffix, token rules in a trie over sorted tokens, and only the
+    remaining globs are tried one by one. A file gathers its candidate rules
+    from those indexes and the lowest-numbered one whose conditions hold is
+    used, so classification cost does not grow with the number of rules.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        self.rules: List[Rule] = []
+        self.exact: Dict[str, List[int]] = {}
+        self.by_suffix: Dict[str, List[int]] = {}
+        self.token_trie: Dict = {'rules': [], 'children': {}}
+        self.other: List[int] = []
+
+        for index, spec in enumerate(rules):
+            rule = self.compile_rule(index, spec)
+            self.rules.append(rule)
+            if rule.exact is not None:
+                self.exact.setdefault(rule.exact, []).append(index)
+            elif rule.tokens:
+                node = self.token_trie
+                for token in rule.tokens:
+                    node = node['children'].setdefault(token, {'rules': [], 'children': {}})
+                node['rules'].append(index)
+            elif spec.get('glob', '').startswith('*.') and not any(c in spec['glob'][1:] for c in '*?['):
+                self.by_suffix.setdefault(spec['glob'][1:].lower(), []).append(index)
+            else:
+                self.other.append(index)
+
+    @staticmethod
+    def compile_rule(index: int, spec: Dict) -> Rule:
+        name = spec.get('name') or f"rule-{index}"
+        if 'destination' not in spec:
+            raise ValueError(f"Destination rule '{name}' has no destination")
+        if not any(key in spec for key in ('exact', 'glob', 'tokens')):
+            raise ValueError(f"Destination rule '{name}' needs 'exact', 'glob' or 'tokens'")
+        requires = tuple(spec.get('requires', ()))
+        unknown = set(requires) - set(PREDICATES)
+        if unknown:
+            raise ValueError(f"Destination rule '{name}' requires unknown predicates: {sorted(unknown)}")
+        glob = re.compile(fnmatch.translate(spec['glob']), re.IGNORECASE) if 'glob' in spec else None
+        tokens = tuple(sorted({normalize_token(token) for token in spec.get('tokens', ())}))
+        return Rule(index, name, spec['destination'], spec.get('exact'), glob, tokens, requires)
+
+    @classmethod
+    def load(cls, path=None) -> 'DestinationRules':
+        """Compile the rules in a JSON config file"""
+        path = Path(path) if path else DEFAULT_RULES_PATH
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        return cls(config.get('rules', []))
+
+    def _token_candidates(self, node: Dict, tokens: List[str], start: int, found: List[int]) -> None:
+        """Collect rules whose token set is a subset of the (sorted) file tokens"""
+        found.extend(node['rules'])
+        children = node['children']
+        if not children:
+            return
+        for position in range(start, len(tokens)):
+            child = children.get(tokens[position])
+            if child is not None:
+                self._token_candidates(child, tokens, position + 1, found)
+
+    def candidates(self, filename: str, tokens: List[str]) -> List[int]:
+        """Indexes of rules that may match, before conditions are checked"""
+        found = list(self.exact.get(filename, ()))
+        suffix = Path(filename).suffix.lower()
+        if suffix:
+            found.extend(self.by_suffix.get(suffix, ()))
+        self._token_candidates(self.token_trie, tokens, 0, found)
+        found.extend(self.other)
+        return sorted(set(found))
+
+    def match(self, filename: str, signals: Optional[Dict[str, bool]] = None,
+              load_signals: Optional[Callable[[], Dict[str, bool]]] = None) -> Optional[RuleMatch]:
+        """Classify a filename.
+
+        Content predicates read `signals`, or call `load_signals()` once the
+        first rule that needs them is reached, so files decided by name are
+        never opened.
+        """
+        token_list = tokenize(Path(filename).stem)
+        tokens = set(token_list)
+        cached = [signals]
+
+        def get_signals() -> Dict[str, bool]:
+            if cached[0] is None:
+                cached[0] = load_signals() if load_signals else {}
+            return cached[0]
+
+        path = Path(filename)
+        for index in self.candidates(filename, token_list):
+            rule = self.rules[index]
+            if rule.matches(filename, tokens, get_signals):
+                destination = rule.destination.format(name=filename, stem=path.stem, ext=path.suffix)
+                return RuleMatch(destination, rule.name)
+        return None
+
+def signals_from_analysis(analysis) -> Dict[str, bool]:
+    """Content predicates from a FileAnalysis"""
+    return {
+        'jsx': analysis.contains_jsx,
+        'react_imports': analysis.contains_react_imports,
+        'components': analysis.contains_components,
+    }
+
+_loaded: Dict[str, DestinationRules] = {}
+
+def load_rules(path=None) -> DestinationRules:
+    """Compiled rules for a config file, compiled once per process"""
+    key = str(Path(path).resolve() if path else DEFAULT_RULES_PATH)
+    if key not in _loaded:
+        _loaded[key] = DestinationRules.load(key)
+    return _loaded[key]
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Show where files would be placed by the destination rules')
+    parser.add_argument('files', nargs='+', help='Filenames (or paths) to classify')
+    parser.add_argument('--rules', help=f'Rule config (default: {DEFAULT_RULES_PATH.name})')
+
+    args = parser.parse_args()
+
+    rules = load_rules(args.rules)
+    for file in args.files:
+        path = Path(file)
+
+        def read_signals(path=path):
+            from tsx_lexer import scan_source
+            try:
+                return scan_source(path.read_text(encoding='utf-8'))._asdict()
+            except (OSError, UnicodeDecodeError):
+                return {}
+
+        result = rules.match(path.name, load_signals=read_signals)
+        if result is None:
+            print(f"  • {path.name}: no rule matched")
+        else:
+            print(f"  • {path.name} → {result.destination}  [{result.rule}]")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Duplicate Finder - Identical File Detector
+Path: scripts/duplicate_finder.py
+Purpose: Find byte-identical copies (backups, mirrored folders, conflict files) and the space they waste
+"""
+
+import os
+import json
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from analysis_cache import DEFAULT_CACHE_DIR, load_digests
+from project_analyzer import PRUNE_DIRS, scan_source_tree
+
+# Bytes read from each end of a file for the partial hash
+BLOCK_SIZE = 4096
+
+# Read size while fully hashing large files
+CHUNK_SIZE = 1 << 20
+
+@dataclass
+class DuplicateGroup:
+    """Files with identical contents"""
+    size: int
+    digest: str
+    files: List[str] = field(default_factory=list)
+
+    @property
+    def reclaimable(self) -> int:
+        """Bytes freed by keeping a single copy"""
+        return self.size * (len(self.files) - 1)
+
+def full_digest(path: str) -> str:
+    """Streaming blake2b, identical to analysis_cache.content_digest of the whole file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def partial_digest(path: str, size: int) -> Tuple[bool, str]:
+    """Hash the first and last blocks; returns (is_full_digest, digest).
+
+    Files no larger than two blocks are read whole, so their partial hash
+    already is the full content digest and they skip the final stage.
+    """
+    with open(path, 'rb') as f:
+        if size <= 2 * BLOCK_SIZE:
+            return True, hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        head = f.read(BLOCK_SIZE)
+        f.seek(-BLOCK_SIZE, os.SEEK_END)
+        tail = f.read(BLOCK_SIZE)
+    return False, hashlib.blake2b(head + tail, digest_size=16).hexdigest()
+
+class DuplicateFinder:
+    """Three-stage duplicate search: size buckets, partial hashes, full hashes.
+
+    Each stage only looks at files that still collide after the previous
+    one, and hashing runs on a thread pool (hashlib releases the GIL).
+    Digests the analysis cache already recorded for an unchanged file are
+    reused instead of reading the file again.
+    """
+
+    def __init__(self, project_root: str = ".", prune_dirs=PRUNE_DIRS, min_size: int = 1,
+                 workers: Optional[int] = None, digests: Optional[Dict[str, Tuple[int, int, str]]] = None):
+        self.project_root = Path(project_root).resolve()
+        self.prune_dirs = set(prune_dirs)
+        self.min_size = min_size
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        if digests is None:
+            digests = load_digests(self.project_root / DEFAULT_CACHE_DIR)
+        self.digests = digests
+        self.stats = {'files': 0, 'size_collisions': 0, 'partial_hashed': 0, 'full_hashed': 0, 'cache_reused': 0}
+
+    def iter_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """(path, stat) for every regular file outside the pruned directories"""
+        for path in scan_source_tree(str(self.project_root), None, self.prune_dirs):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield path, stat
+
+    def hash_all(self, executor: ThreadPoolExecutor, func, items: list) -> list:
+        """Run func over items on the pool, dropping files that could not be read"""
+        def guarded(item):
+            try:
+                return item, func(*item)
+            except OSError:
+                return item, None
+        return [(item, result) for item, result in executor.map(guarded, items) if result is not None]
+
+    def find(self) -> List[DuplicateGroup]:
+        """Return duplicate groups, largest reclaimable space first"""
+        by_size = defaultdict(list)
+        for path, stat in self.iter_files():
+            self.stats['files'] += 1
+            if stat.st_size >= self.min_size:
+                by_size[stat.st_size].append((path, stat))
+
+        full = {}           # path -> content digest
+        sizes = {}          # path -> size, for files still in the running
+        need_partial = []   # (path, size)
+        need_full = []      # (path,)
+        for size, group in by_size.items():
+            if len(group) < 2:
+                continue
+            self.stats['size_collisions'] += len(group)
+            uncached = []
+            for path, stat in group:
+                sizes[path] = size
+                cached = self.digests.get(path)
+                if cached is not None and cached[0] == size and cached[1] == stat.st_mtime_ns:
+                    full[path] = cached[2]
+                    self.stats['cache_reused'] += 1
+                else:
+                    uncached.append(path)
+            if len(uncached) < len(group):
+                # A partial hash cannot be compared with a cached full digest
+                need_full.extend((path,) for path in uncached)
+            else:
+                need_partial.extend((path, size) for path in uncached)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            by_partial = defaultdict(list)
+            for (path, size), (is_full, digest) in self.hash_all(executor, partial_digest, need_partial):
+                self.stats['partial_hashed'] += 1
+                if is_full:
+                    full[path] = digest
+                else:
+                    by_partial[(size, digest)].append(path)
+            for paths in by_partial.values():
+                if len(paths) > 1:
+                    need_full.extend((path,) for path in paths)
+
+            for (path,), digest in self.hash_all(executor, full_digest, need_full):
+                self.stats['full_hashed'] += 1
+                full[path] = digest
+
+        groups = {}
+        for path, digest in full.items():
+            size = sizes[path]
+            group = groups.setdefault((size, digest), DuplicateGroup(size, digest))
+            group.files.append(Path(path).relative_to(self.project_root).as_posix())
+        duplicates = [group for group in groups.values() if len(group.files) > 1]
+        for group in duplicates:
+            group.files.sort()
+        duplicates.sort(key=lambda group: (-group.reclaimable, group.files[0]))
+        return duplicates
+
+    def report(self) -> Dict:
+        """Report section: groups plus totals"""
+        groups = self.find()
+        return {
+            'groups': [dict(asdict(group), reclaimable=group.reclaimable) for group in groups],
+            'duplicate_files': sum(len(group.files) - 1 for group in groups),
+            'reclaimable_bytes': sum(group.reclaimable for group in groups),
+            'stats': dict(self.stats),
+        }
+
+def print_duplicates(section: Dict, limit: int = 10) -> None:
+    """Console summary of a duplicates report section"""
+    groups = section['groups']
+    print(f"\n🗂️  DUPLICATES: {len(groups)} groups, {section['duplicate_files']} redundant files, "
+          f"{section['reclaimable_bytes'] / 1024:.1f} KiB reclaimable")
+    for group in groups[:limit]:
+        print(f"  • {len(group['files'])} × {group['size']:,} bytes ({group['reclaimable']:,} reclaimable)")
+        for path in group['files']:
+            print(f"      {path}")
+    if len(groups) > limit:
+        print(f"  … {len(groups) - limit} more groups")
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Find byte-identical duplicate files')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--min-size', type=int, default=1, help='Ignore files smaller than this many bytes')
+    parser.add_argument('--workers', type=int, help='Hashing threads')
+    parser.add_argument('--limit', type=int, default=10, help='Groups to print')
+    parser.add_argument('--output', help='Write the duplicates report as JSON to this path')
+
+    args = parser.parse_args()
+
+    finder = DuplicateFinder(args.project_root, min_size=args.min_size, workers=args.workers)
+    section = finder.report()
+    print_duplicates(section, args.limit)
+    stats = section['stats']
+    print(f"\n📊 {stats['files']} files, {stats['size_collisions']} same-size, "
+          f"{stats['partial_hashed']} partial hashes, {stats['full_hashed']} full hashes, "
+          f"{stats['cache_reused']} digests reused from the analysis cache")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(section, f, indent=2)
+        print(f"\n💾 Report saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
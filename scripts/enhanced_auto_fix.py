@@ -6,20 +6,40 @@ File: scripts/enhanced_auto_fix.py
 """
 
 import os
-import shutil
 import subprocess
 import json
 from pathlib import Path
 from datetime import datetime
 import re
+from tsx_lexer import scan_source
+from rename_propagator import RenamePropagator
+from destination_rules import load_rules, signals_from_analysis
+from analysis_session import open_session
+from git_staging import commit_paths
+from move_plan import MoveJournal, MovePlan, apply_plan, rollback
 
 class EnhancedAutoFixer:
-    def __init__(self, project_root=None):
-        self.project_root = Path(project_root) if project_root else Path.cwd()
+    def __init__(self, project_root=None, rules_path=None, session=None):
+        self.project_root = Path(project_root).resolve() if project_root else Path.cwd()
+        # Optional AnalysisSession: content checks come from its report instead of re-reading files
+        self.session = session
+        # Moved or renamed path -> the path the session analyzed it under
+        self.origins = {}
+        # Files written besides those in changes_made (backups), staged with them
+        self.extra_paths = []
         self.downloads_dir = self.project_root / "downloads"
         self.src_dir = self.project_root / "src"
         self.scripts_dir = self.project_root / "scripts"
         self.changes_made = []
+        self.propagator = None
+        # Moves are planned first, then applied in one journaled batch
+        self.plan = MovePlan(str(self.project_root), tool='fixer')
+        self.journal = None
+        self.edited = []
+        # Set by run(); messages then say what would happen, not what did
+        self.dry_run = False
+        self.destination_rules = load_rules(rules_path)
+        self.destination_rules_fired = {}
         
     def log_change(self, action, old_path, new_path=None):
         """Log changes for commit message"""
@@ -31,90 +51,69 @@ class EnhancedAutoFixer:
         }
         self.changes_made.append(change)
         
+    def session_analysis(self, file_path):
+        """The session's analysis of a file, followed back through this run's moves"""
+        if self.session is None:
+            return None
+        return self.session.analysis(self.origins.get(file_path, file_path))
+    
     def has_jsx_content(self, file_path):
         """Check if file contains JSX elements"""
+        analysis = self.session_analysis(file_path)
+        if analysis is not None:
+            return analysis.contains_jsx
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # Planned moves have not happened yet: read the file where it still is
+            with open(self.origins.get(file_path, file_path), 'r', encoding='utf-8') as f:
                 content = f.read()
-                
-            # JSX patterns
-            jsx_patterns = [
-                r'<\w+[^>]*>',  # Opening tags
-                r'<\/\w+>',     # Closing tags
-                r'<\w+\s*\/>', # Self-closing tags
-                r'return\s*\(',  # React return statements
-                r'React\.',     # React usage
-                r'jsx',         # JSX in comments
-                r'\.jsx',       # JSX extensions
-            ]
             
-            for pattern in jsx_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return True
-            return False
+            # Same lexer as ProjectAnalyzer: ignores strings, comments and generics
+            return scan_source(content).jsx
             
         except Exception as e:
             print(f"⚠️  Error reading {file_path}: {e}")
             return False
     
     def fix_file_extension(self, file_path):
-        """Fix .ts to .tsx if file contains JSX"""
+        """Plan .ts to .tsx if file contains JSX"""
         if not file_path.suffix == '.ts':
             return file_path
             
         if self.has_jsx_content(file_path):
             new_path = file_path.with_suffix('.tsx')
-            if file_path.exists():
-                shutil.move(str(file_path), str(new_path))
-                self.log_change("extension_fix", file_path, new_path)
-                print(f"🔧 Fixed: {file_path.name} → {new_path.name}")
+            if self.plan.move(file_path, new_path, reason='extension_fix'):
+                self.origins[new_path] = self.origins.get(file_path, file_path)
+                print(f"🔧 {'Would fix' if self.dry_run else 'Fixed'}: {file_path.name} → {new_path.name}")
                 return new_path
         
         return file_path
     
-    def get_destination_path(self, filename):
-        """Smart destination mapping based on filename"""
-        mapping = {
-            # Main app files
-            'app_with_auth.ts': 'src/App.tsx',
-            'App.ts': 'src/App.tsx',
-            
-            # Services
-            'auth_service.ts': 'src/services/authService.ts',
-            'encryption_service.ts': 'src/services/encryptionService.ts',
-            'storage_service.ts': 'src/services/storageService.ts',
-            'auth.ts': 'src/services/auth.ts',
-            
-            # Types
-            'auth_types.ts': 'src/types/auth.ts',
-            'types.ts': 'src/types/index.ts',
-            
-            # Utils
-            'accessibility_constants.ts': 'src/utils/accessibilityConstants.ts',
-            'accessible_login.ts': 'src/utils/accessibleLogin.ts',
-            'essential_components.ts': 'src/utils/essentialComponents.ts',
-            'database-test.ts': 'src/utils/databaseTest.ts',
-            
-            # Scripts
-            'enhanced_setup_auto-fixer.sh': 'scripts/enhanced_setup_auto_fixer.sh',
-            'smart_test_runner.sh': 'scripts/smart_test_runner.sh',
-            'test_runner.sh': 'scripts/test_runner.sh',
-            
-            # Data
-            'sample_curriculum_data.json': 'src/data/sampleCurriculumData.json',
-            'supabase_schema.sql': 'database/schema.sql',
-            
-            # Curriculum files
-            'performing_arts_curriculum.ts': 'src/data/curriculums/performingArts.ts',
-            'performing_arts_templates.ts': 'src/data/templates/performingArts.ts',
-        }
+    def get_destination_path(self, filename, file_path=None):
+        """Destination from the shared rule config (scripts/destination_rules.json)"""
+        def read_signals():
+            # Only opened when a content rule (e.g. "requires": ["jsx"]) is reached
+            analysis = self.session_analysis(Path(file_path))
+            if analysis is not None:
+                return signals_from_analysis(analysis)
+            try:
+                return scan_source(Path(file_path).read_text(encoding='utf-8'))._asdict()
+            except (OSError, UnicodeDecodeError):
+                return {}
         
-        return mapping.get(filename, f'src/utils/{filename}')
+        match = self.destination_rules.match(filename, load_signals=read_signals if file_path else None)
+        if match is None:
+            return f'src/utils/{filename}'
+        self.destination_rules_fired[filename] = match.rule
+        return match.destination
     
     def compare_files(self, source_path, dest_path):
         """Compare file timestamps and content to determine action"""
-        if not dest_path.exists():
+        if not self.plan.exists(self.plan.relative(dest_path)):
             return "move"  # Destination doesn't exist, safe to move
+        
+        # The decision depends on the destination as it is now
+        self.plan.require(dest_path)
+        dest_path = self.origins.get(dest_path, dest_path)
             
         source_time = source_path.stat().st_mtime
         dest_time = dest_path.stat().st_mtime
@@ -136,11 +135,10 @@ class EnhancedAutoFixer:
             return "conflict"  # Same timestamp, different content
     
     def move_file_to_destination(self, source_path, destination_path):
-        """Move file to destination with smart conflict resolution"""
+        """Plan the move of a file to its destination with smart conflict resolution"""
         dest_path = self.project_root / destination_path
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
         
-        if not source_path.exists():
+        if not self.plan.exists(self.plan.relative(source_path)):
             return None
             
         # Check for conflicts
@@ -148,42 +146,71 @@ class EnhancedAutoFixer:
         
         if action == "move":
             # Safe to move - no destination file
-            shutil.move(str(source_path), str(dest_path))
-            self.log_change("file_move", source_path, dest_path)
-            print(f"📁 Moved: {source_path.name} → {destination_path}")
+            self.plan.move(source_path, dest_path, reason='file_move')
+            self.origins[dest_path] = source_path
+            print(f"📁 {'Would move' if self.dry_run else 'Moved'}: {source_path.name} → {destination_path}")
             return dest_path
             
         elif action == "update":
             # Source is newer - backup and update
             backup_path = dest_path.with_suffix(f'.backup.{datetime.now().strftime("%Y%m%d_%H%M%S")}{dest_path.suffix}')
-            shutil.copy2(str(dest_path), str(backup_path))
-            shutil.move(str(source_path), str(dest_path))
-            self.log_change("file_update", source_path, dest_path)
-            print(f"🔄 Updated: {source_path.name} → {destination_path} (backup created)")
+            self.plan.move(dest_path, backup_path, reason='backup')
+            self.plan.move(source_path, dest_path, reason='file_update')
+            self.origins[dest_path] = source_path
+            if self.dry_run:
+                print(f"🔄 Would update: {source_path.name} → {destination_path} (with a backup)")
+            else:
+                print(f"🔄 Updated: {source_path.name} → {destination_path} (backup created)")
             return dest_path
             
         elif action == "skip":
             # Destination is newer - keep existing, remove source
-            source_path.unlink()
-            self.log_change("file_skip", source_path, dest_path)
-            print(f"⏭️  Skipped: {source_path.name} (destination newer)")
+            self.plan.remove(source_path, reason='file_skip', replaced_by=dest_path)
+            print(f"⏭️  {'Would skip' if self.dry_run else 'Skipped'}: {source_path.name} (destination newer)")
             return dest_path
             
         elif action == "identical":
             # Files are identical - remove source
-            source_path.unlink()
-            self.log_change("file_identical", source_path, dest_path)
-            print(f"♻️  Identical: {source_path.name} (source removed)")
+            self.plan.remove(source_path, reason='file_identical', replaced_by=dest_path)
+            print(f"♻️  Identical: {source_path.name} (source {'would be ' if self.dry_run else ''}removed)")
             return dest_path
             
         else:  # conflict
             # Same timestamp, different content - manual resolution needed
             conflict_path = dest_path.with_suffix(f'.conflict.{datetime.now().strftime("%Y%m%d_%H%M%S")}{dest_path.suffix}')
-            shutil.move(str(source_path), str(conflict_path))
-            self.log_change("file_conflict", source_path, conflict_path)
+            self.plan.move(source_path, conflict_path, reason='file_conflict')
+            self.origins[conflict_path] = source_path
             print(f"⚠️  Conflict: {source_path.name} → {conflict_path.name} (manual review needed)")
             return conflict_path
     
+    def plan_changes(self):
+        """Log the plan's moves and removals (backups are staged with them)"""
+        for step in self.plan.steps:
+            if step.op == 'move' and step.reason == 'backup':
+                self.extra_paths.append(self.project_root / step.target)
+            elif step.op in ('move', 'remove'):
+                new_path = self.project_root / step.target if step.target else None
+                self.log_change(step.reason, self.project_root / step.source, new_path)
+    
+    def save_original(self, relpath):
+        """Keep a file's contents in the journal before rewriting it"""
+        self.journal.save_original(relpath)
+        self.edited.append(relpath)
+    
+    def record_moves(self):
+        """Queue the plan's moves so every importer of the files is updated in update_imports()"""
+        if self.propagator is None:
+            return
+        for step in self.plan.relocations():
+            self.propagator.record_move(self.project_root / step.source, self.project_root / step.target)
+    
+    def update_imports(self):
+        """Rewrite the imports affected by this run's moves, one write per file"""
+        if self.propagator is None:
+            return
+        for relpath, count in self.propagator.flush().items():
+            self.log_change("import_fix", self.project_root / relpath)
+    
     def fix_imports_in_file(self, file_path):
         """Update import statements to match new file locations"""
         if not file_path.exists() or file_path.suffix not in ['.ts', '.tsx', '.js', '.jsx']:
@@ -206,6 +233,8 @@ class EnhancedAutoFixer:
                 content = re.sub(pattern, replacement, content)
             
             if content != original_content:
+                if self.journal is not None:
+                    self.save_original(file_path.relative_to(self.project_root).as_posix())
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
                 self.log_change("import_fix", file_path)
@@ -225,23 +254,32 @@ class EnhancedAutoFixer:
         for file_path in self.downloads_dir.iterdir():
             if file_path.is_file():
                 # Get destination
-                destination = self.get_destination_path(file_path.name)
+                destination = self.get_destination_path(file_path.name, file_path)
+                print(f"🧭 {file_path.name}: rule '{self.destination_rules_fired.get(file_path.name, 'default')}'")
                 
                 # Move file
                 new_path = self.move_file_to_destination(file_path, destination)
                 
-                # Fix extension if needed
+                # Fix extension if needed (imports are fixed once the plan is applied)
                 if new_path:
-                    fixed_path = self.fix_file_extension(new_path)
-                    # Fix imports
-                    self.fix_imports_in_file(fixed_path)
+                    self.fix_file_extension(new_path)
+    
+    def fix_downloaded_imports(self):
+        """Fix imports in the files that came from (or replaced a file in) downloads"""
+        relocations = self.plan.relocations()
+        for index, step in enumerate(self.plan.steps):
+            if step in relocations and step.source.startswith('downloads/'):
+                # Follow the file placed at target from here on, not the one backed up before
+                final = self.plan.final_location(step.target, start=index + 1)
+                if final is not None:
+                    self.fix_imports_in_file(self.project_root / final)
     
     def fix_existing_extensions(self):
         """Fix extensions in existing src files"""
         print("🔧 Fixing extensions in src directory...")
         
         for file_path in self.src_dir.rglob("*.ts"):
-            if file_path.exists():
+            if self.plan.exists(self.plan.relative(file_path)):
                 self.fix_file_extension(file_path)
     
     def create_commit_message(self):
@@ -280,43 +318,106 @@ class EnhancedAutoFixer:
                 
         return message
     
+    def changed_paths(self):
+        """Every path this run created, removed or rewrote, as absolute paths"""
+        paths = [os.path.abspath(path) for path in self.extra_paths]
+        for change in self.changes_made:
+            paths.append(os.path.abspath(change["old_path"]))
+            if change["new_path"]:
+                paths.append(os.path.abspath(change["new_path"]))
+        return paths
+    
     def commit_changes(self):
         """Commit changes to git"""
         try:
-            # Add all changes
-            subprocess.run(["git", "add", "."], cwd=self.project_root, check=True)
-            
-            # Create commit message
+            # Stage and commit exactly the changed paths (moves keep both ends, so git records renames)
             commit_msg = self.create_commit_message()
+            committed = commit_paths(self.project_root, self.changed_paths(), commit_msg)
+            if not committed:
+                print("📭 Nothing to commit")
+                return False
             
-            # Commit
-            subprocess.run(["git", "commit", "-m", commit_msg], cwd=self.project_root, check=True)
-            
-            print(f"✅ Changes committed to git")
+            print(f"✅ Changes committed to git ({len(committed)} paths)")
             return True
             
         except subprocess.CalledProcessError as e:
-            print(f"⚠️  Git commit failed: {e}")
+            print(f"⚠️  Git commit failed: {e.stderr.decode(errors='replace').strip() if e.stderr else e}")
+            return False
+        except FileNotFoundError:
+            print("⚠️  Git not found - skipping commit")
             return False
     
-    def run(self, commit=True):
-        """Run the complete auto-fix process"""
+    def run(self, commit=True, dry_run=False, plan_out=None):
+        """Run the complete auto-fix process; plan_out (dry runs only) saves the plan for a later apply_saved_plan()"""
         print("🚀 ENHANCED AUTO-FIX STARTING")
         print("=" * 50)
+        self.dry_run = dry_run
+        if dry_run:
+            print("🔍 DRY RUN MODE - No changes will be made")
         
-        # Step 1: Organize downloads
+        # Step 1: Organize downloads (planned, not yet applied)
+        self.plan = MovePlan(str(self.project_root), tool='fixer')
         self.organize_downloads()
         
         # Step 2: Fix existing extensions
         self.fix_existing_extensions()
         
+        if plan_out:
+            self.plan.save(plan_out)
+            print(f"💾 Plan saved to: {plan_out} ({len(self.plan.preconditions)} input files hashed)")
+        
+        self.execute_plan(commit=commit, dry_run=dry_run)
+    
+    def apply_saved_plan(self, plan_path, commit=True):
+        """Apply a plan saved by run(plan_out=...) without re-reading or re-deciding anything"""
+        print(f"🚀 APPLYING SAVED PLAN: {plan_path}")
+        print("=" * 50)
+        self.dry_run = False
+        try:
+            self.plan = MovePlan.load(plan_path, 'fixer', str(self.project_root))
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot use plan: {e}")
+            return False
+        stale = self.plan.stale_inputs()
+        if stale:
+            print(f"❌ {len(stale)} files changed since the plan was made; create a new plan:")
+            for relpath in stale[:10]:
+                print(f"    {relpath}")
+            return False
+        print(f"✅ All {len(self.plan.preconditions)} input files match the plan")
+        for step in self.plan.steps:
+            print(f"  {step.describe()}")
+        return self.execute_plan(commit=commit)
+    
+    def execute_plan(self, commit=True, dry_run=False):
+        """Apply the plan as one journaled batch, fix imports, summarize and commit"""
+        if not dry_run and self.plan.steps:
+            # Snapshot the import graph before anything moves
+            self.propagator = RenamePropagator(str(self.project_root))
+            self.journal = MoveJournal.create(self.project_root)
+            try:
+                apply_plan(self.plan, self.journal)
+            except (OSError, RuntimeError) as e:
+                print(f"❌ Auto-fix aborted, tree left as it was: {e}")
+                return False
+            print(f"\n✅ Applied {len(self.plan.steps)} steps (journal {self.journal.journal_id})")
+        self.plan_changes()
+        
+        if self.journal is not None:
+            # Point importers of moved files at their new locations
+            self.fix_downloaded_imports()
+            self.record_moves()
+            self.propagator.before_write = self.save_original
+            self.update_imports()
+            self.journal.commit(self.plan, self.edited)
+        
         # Step 3: Summary
         print("\n" + "=" * 50)
         print(f"✅ SMART AUTO-FIX COMPLETE")
         print(f"📊 Total changes: {len(self.changes_made)}")
         
         if self.changes_made:
-            print("\n🔍 CHANGES MADE:")
+            print("\n🔍 CHANGES PLANNED (dry run):" if dry_run else "\n🔍 CHANGES MADE:")
             action_counts = {}
             for change in self.changes_made:
                 action_counts[change["action"]] = action_counts.get(change["action"], 0) + 1
@@ -330,6 +431,12 @@ class EnhancedAutoFixer:
                 "extension_fix": "🔧 Extensions", 
                 "import_fix": "🔗 Imports"
             }
+            if dry_run:
+                action_emoji.update({
+                    "file_move": "📁 Would move",
+                    "file_update": "🔄 Would update",
+                    "file_skip": "⏭️ Would skip",
+                })
             
             for action, count in action_counts.items():
                 emoji_text = action_emoji.get(action, f"📝 {action}")
@@ -343,7 +450,7 @@ class EnhancedAutoFixer:
                     print(f"   📄 {Path(conflict['new_path']).name}")
         
         # Step 4: Commit changes
-        if commit and self.changes_made:
+        if commit and not dry_run and self.changes_made:
             conflicts = [c for c in self.changes_made if c["action"] == "file_conflict"]
             if conflicts:
                 print(f"\n⚠️  Cannot auto-commit: {len(conflicts)} conflicts need manual resolution")
@@ -351,6 +458,7 @@ class EnhancedAutoFixer:
                 self.commit_changes()
         
         print("\n🎉 Ready to run: npm start")
+        return True
 
 def main():
     """Main execution"""
@@ -359,11 +467,31 @@ def main():
     parser = argparse.ArgumentParser(description="Enhanced Auto-Fix for Lesson Plan App")
     parser.add_argument("--no-commit", action="store_true", help="Don't commit changes")
     parser.add_argument("--project-root", help="Project root directory")
+    parser.add_argument("--rules", help="Destination rule config (default: scripts/destination_rules.json)")
+    parser.add_argument("--session", help="Use an analysis saved by analysis_session.py instead of reading sources")
+    parser.add_argument("--dry-run", action="store_true", help="Show the plan without changing anything")
+    parser.add_argument("--plan-out", help="With --dry-run, save the plan with content hashes of its inputs, to apply later with --apply")
+    parser.add_argument("--apply", help="Apply a saved plan without reading or analyzing sources again")
+    parser.add_argument("--rollback", nargs="?", const="", metavar="JOURNAL",
+                        help="Undo a run from its journal (default: the newest not rolled back)")
     
     args = parser.parse_args()
+    if args.apply and (args.dry_run or args.plan_out):
+        parser.error("--apply cannot be combined with --dry-run or --plan-out")
+    if args.plan_out and not args.dry_run:
+        # Applying the plan right away would change the very inputs it hashed
+        parser.error("--plan-out requires --dry-run")
+    
+    if args.rollback is not None:
+        rollback(args.project_root or ".", args.rollback or None)
+        return
     
-    fixer = EnhancedAutoFixer(args.project_root)
-    fixer.run(commit=not args.no_commit)
+    session = open_session(args.session, args.project_root or ".") if args.session else None
+    fixer = EnhancedAutoFixer(args.project_root, rules_path=args.rules, session=session)
+    if args.apply:
+        fixer.apply_saved_plan(args.apply, commit=not args.no_commit)
+    else:
+        fixer.run(commit=not args.no_commit, dry_run=args.dry_run, plan_out=args.plan_out)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Git Staging - Path-Scoped Staging and Commits
+Path: scripts/git_staging.py
+Purpose: Stage and commit exactly the paths a run touched, in batched git calls, instead of `git add .`
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable, List
+
+def relative_paths(project_root: Path, paths: Iterable) -> List[str]:
+    """Unique root-relative paths (relative input is taken as root-relative), dropping any outside the project"""
+    seen = {}
+    for path in paths:
+        try:
+            relpath = Path(os.path.abspath(project_root / path)).relative_to(project_root).as_posix()
+        except ValueError:
+            continue
+        if relpath != '.':
+            seen.setdefault(relpath, None)
+    return list(seen)
+
+def pathspec_input(paths: List[str]) -> bytes:
+    return b''.join(os.fsencode(path) + b'\0' for path in paths)
+
+def git_paths(project_root: Path, args: List[str], paths: List[str], check: bool = True) -> subprocess.CompletedProcess:
+    """Run `git <args>` over paths passed as a NUL-separated pathspec file on stdin, taken literally"""
+    return subprocess.run(['git', '--literal-pathspecs', *args, '--pathspec-from-file=-', '--pathspec-file-nul'],
+                          cwd=project_root, input=pathspec_input(paths), capture_output=True, check=check,
+                          env=dict(os.environ, LC_ALL='C'))
+
+def stage_paths(project_root, paths: Iterable) -> List[str]:
+    """Stage the given paths: contents of those that exist, deletions of those that are gone.
+
+    Existing paths go to one `git add -A`; vanished ones to one
+    `git rm --cached --ignore-unmatch`, which skips paths git never
+    tracked (a file moved out of an untracked downloads/ directory). The
+    old and new path of a move are staged together, so the commit records
+    a rename and git's rename detection only compares the staged paths.
+    Returns the paths that now have staged changes to commit.
+    """
+    project_root = Path(project_root).resolve()
+    relpaths = relative_paths(project_root, paths)
+    present = [path for path in relpaths if os.path.lexists(project_root / path)]
+    missing = [path for path in relpaths if not os.path.lexists(project_root / path)]
+
+    staged = list(present)
+    if present:
+        git_paths(project_root, ['add', '-A'], present)
+    if missing:
+        result = git_paths(project_root, ['rm', '-r', '--cached', '--ignore-unmatch'], missing)
+        for line in os.fsdecode(result.stdout).splitlines():
+            # git rm prints "rm '<path>'" for each path it removed from the index
+            if line.startswith("rm '") and line.endswith("'"):
+                staged.append(line[4:-1])
+    return staged
+
+def commit_paths(project_root, paths: Iterable, message: str) -> List[str]:
+    """Stage the paths and commit only them, leaving anything else in the index alone.
+
+    Returns the committed paths (empty when they match HEAD already).
+    Raises subprocess.CalledProcessError if git fails (e.g. outside a
+    repository) and FileNotFoundError if git is not installed.
+    """
+    project_root = Path(project_root).resolve()
+    staged = stage_paths(project_root, paths)
+    if not staged:
+        return []
+    result = git_paths(project_root, ['commit', '-q', '-m', message], staged, check=False)
+    if result.returncode != 0:
+        if b'nothing to commit' in result.stdout or b'no changes added' in result.stdout:
+            return []
+        raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+    return staged
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Import Graph - Cross-File Import Index
+Path: scripts/import_graph.py
+Purpose: Record who imports what across src/, App.tsx and index.js, with forward and reverse edges
+"""
+
+import os
+import re
+import json
+import posixpath
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from analysis_cache import DEFAULT_CACHE_DIR, content_digest
+from project_analyzer import PRUNE_DIRS, TARGET_EXTENSIONS, scan_source_tree
+
+# Bump when parsing or resolution rules change so cached graphs are rebuilt
+GRAPH_VERSION = 1
+
+# Directories and root files whose imports are indexed
+DEFAULT_ROOTS = ('src', 'App.tsx', 'index.js')
+
+# Extensions tried, in order, for extensionless specifiers (TypeScript, then Metro)
+RESOLVE_EXTENSIONS = ('.ts', '.tsx', '.d.ts', '.js', '.jsx')
+
+# import x from '...', import '...', export ... from '...', require('...'), import('...')
+SPECIFIER_RE = re.compile(r"""
+    (?<![\w$.])
+    (?: import\s*(?:type\s+)?(?:[\w$*{}\s,]+?\s*from\s*)?
+      | export\s*(?:type\s+)?(?:\*(?:\s*as\s+[\w$]+)?|\{[^}]*\})\s*from\s*
+      | (?:require|import)\s*\(\s*
+    )
+    (?P<quote>['"])(?P<specifier>[^'"\n]+)(?P=quote)
+""", re.VERBOSE)
+
+class ImportEdge(NamedTuple):
+    """One import statement: the specifier as written and the file it resolves to"""
+    specifier: str
+    target: Optional[str]  # root-relative path; None for packages and unresolvable specifiers
+
+def iter_specifiers(text: str) -> Iterator[re.Match]:
+    """Yield one match per module specifier; group 'specifier' holds the text and its span"""
+    return SPECIFIER_RE.finditer(text)
+
+def module_bases(relpath: str) -> List[str]:
+    """Specifier base paths (extension stripped) that could resolve to relpath"""
+    bases = [relpath]
+    for extension in RESOLVE_EXTENSIONS:
+        if relpath.endswith(extension):
+            stem = relpath[:-len(extension)]
+            bases.append(stem)
+            if posixpath.basename(stem) == 'index':
+                bases.append(posixpath.dirname(stem) or '.')
+            break
+    return bases
+
+def load_path_aliases(project_root: Path) -> List[Tuple[str, List[str]]]:
+    """tsconfig.json "paths" as (prefix, [root-relative target prefixes]), longest prefix first"""
+    try:
+        config = json.loads((project_root / 'tsconfig.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return []
+    options = config.get('compilerOptions', {})
+    base_url = posixpath.normpath(options.get('baseUrl', '.'))
+    aliases = []
+    for pattern, targets in options.get('paths', {}).items():
+        prefix = pattern[:-1] if pattern.endswith('*') else pattern
+        resolved = [
+            posixpath.normpath(posixpath.join(base_url, target[:-1] if target.endswith('*') else target))
+            + ('/' if target.endswith('/*') else '')
+            for target in targets
+        ]
+        aliases.append((prefix, resolved))
+    aliases.sort(key=lambda alias: len(alias[0]), reverse=True)
+    return aliases
+
+class ImportGraph:
+    """Forward and reverse import adjacency for the project's TS/JS sources.
+
+    The graph is persisted to .cache and updated incrementally: only files
+    whose size or mtime changed are re-parsed, and only importers whose
+    specifiers could point at an added or removed file are re-resolved.
+    """
+
+    def __init__(self, project_root: str = ".", roots: Iterable[str] = DEFAULT_ROOTS,
+                 cache_dir: Optional[Path] = None):
+        self.project_root = Path(project_root).resolve()
+        self.roots = tuple(roots)
+        self.cache_path = (Path(cache_dir) if cache_dir else self.project_root / DEFAULT_CACHE_DIR) / "import_graph.json"
+        self.aliases = load_path_aliases(self.project_root)
+
+        self.meta: Dict[str, Tuple[int, int]] = {}        # path -> (size, mtime_ns)
+        self.specifiers: Dict[str, List[str]] = {}        # path -> specifiers as written
+        self.forward: Dict[str, List[ImportEdge]] = {}    # importer -> edges
+        self.reverse: Dict[str, Set[str]] = {}            # target -> importers
+        self.by_base: Dict[str, Set[str]] = {}            # candidate base path -> importers
+
+    # -- enumeration ---------------------------------------------------------
+
+    def iter_source_files(self) -> Iterator[str]:
+        """Root-relative paths of every indexed file"""
+        for root in self.roots:
+            path = self.project_root / root
+            if path.is_dir():
+                for found in scan_source_tree(str(path), TARGET_EXTENSIONS, PRUNE_DIRS):
+                    yield Path(found).relative_to(self.project_root).as_posix()
+            elif path.is_file():
+                yield root
+
+    def relative(self, path) -> str:
+        """Root-relative '/'-separated form of a path"""
+        path = Path(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.project_root)
+        return path.as_posix()
+
+    # -- resolution ----------------------------------------------------------
+
+    def specifier_bases(self, importer: str, specifier: str) -> List[str]:
+        """Root-relative base paths a specifier may refer to, in resolution order"""
+        if specifier.startswith('./') or specifier.startswith('../') or specifier in ('.', '..'):
+            return [posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))]
+        for prefix, targets in self.aliases:
+            if specifier == prefix or (prefix.endswith('/') and specifier.startswith(prefix)):
+                rest = specifier[len(prefix):]
+                return [posixpath.normpath(target + rest) for target in targets]
+        return []
+
+    def resolve(self, importer: str, specifier: str) -> Tuple[Optional[str], List[str]]:
+        """Return (target, bases) for one specifier; bases are kept for incremental updates"""
+        bases = self.specifier_bases(importer, specifier)
+        for base in bases:
+            if base in self.meta or (posixpath.splitext(base)[1] and (self.project_root / base).is_file()):
+                return base, bases
+            for extension in RESOLVE_EXTENSIONS:
+                if base + extension in self.meta:
+                    return base + extension, bases
+            for extension in RESOLVE_EXTENSIONS:
+                candidate = f"{base}/index{extension}"
+                if candidate in self.meta:
+                    return candidate, bases
+        return None, bases
+
+    def resolve_text(self, importer: str, text: str) -> List[ImportEdge]:
+        """Edges for a file outside the graph's roots, resolved as if it lived at importer"""
+        return [
+            ImportEdge(match.group('specifier'), self.resolve(importer, match.group('specifier'))[0])
+            for match in iter_specifiers(text)
+        ]
+
+    def link(self, importer: str) -> None:
+        """(Re)resolve every specifier of one file and update the reverse indexes"""
+        self.unlink(importer)
+        edges = []
+        for specifier in self.specifiers.get(importer, ()):
+            target, bases = self.resolve(importer, specifier)
+            edges.append(ImportEdge(specifier, target))
+            if target is not None:
+                self.reverse.setdefault(target, set()).add(importer)
+            for base in bases:
+                self.by_base.setdefault(base, set()).add(importer)
+        self.forward[importer] = edges
+
+    def unlink(self, importer: str) -> None:
+        """Remove one file's outgoing edges from the reverse indexes"""
+        for edge in self.forward.pop(importer, ()):
+            if edge.target is not None:
+                importers = self.reverse.get(edge.target)
+                if importers is not None:
+                    importers.discard(importer)
+                    if not importers:
+                        del self.reverse[edge.target]
+            for base in self.specifier_bases(importer, edge.specifier):
+                importers = self.by_base.get(base)
+                if importers is not None:
+                    importers.discard(importer)
+                    if not importers:
+                        del self.by_base[base]
+
+    # -- building and updating -----------------------------------------------
+
+    def parse(self, relpath: str) -> Optional[Tuple[int, int]]:
+        """Read one file's specifiers; return its (size, mtime_ns) or None if it is gone"""
+        path = self.project_root / relpath
+        try:
+            stat = path.stat()
+            text = path.read_bytes().decode('utf-8', 'replace')
+        except OSError:
+            return None
+        self.specifiers[relpath] = [match.group('specifier') for match in iter_specifiers(text)]
+        return stat.st_size, stat.st_mtime_ns
+
+    def update(self, paths: Optional[Iterable] = None) -> Dict[str, List[str]]:
+        """Bring the graph up to date and return the added/modified/removed paths.
+
+        With `paths`, only those files are checked, so callers that know what
+        they changed (a move, an edit) pay for the edges they touched rather
+        than a stat of every source file.
+        """
+        if paths is None:
+            current = set(self.iter_source_files())
+            candidates = current | set(self.meta)
+        else:
+            candidates = {self.relative(path) for path in paths}
+            current = {path for path in candidates if self.indexed(path) and (self.project_root / path).is_file()}
+
+        added, modified, removed = [], [], []
+        for relpath in sorted(candidates):
+            if relpath not in current:
+                if relpath in self.meta:
+                    removed.append(relpath)
+                continue
+            try:
+                stat = (self.project_root / relpath).stat()
+            except OSError:
+                if relpath in self.meta:
+                    removed.append(relpath)
+                continue
+            known = self.meta.get(relpath)
+            if known is None:
+                added.append(relpath)
+            elif known != (stat.st_size, stat.st_mtime_ns):
+                modified.append(relpath)
+
+        for relpath in removed:
+            self.unlink(relpath)
+            del self.meta[relpath]
+            self.specifiers.pop(relpath, None)
+        for relpath in added + modified:
+            meta = self.parse(relpath)
+            if meta is None:
+                continue
+            self.meta[relpath] = meta
+
+        # Importers whose specifiers could now resolve differently
+        relink = set(added) | set(modified)
+        for relpath in added + removed:
+            for base in module_bases(relpath):
+                relink.update(self.by_base.get(base, ()))
+        for importer in sorted(relink):
+            if importer in self.meta:
+                self.link(importer)
+
+        return {'added': added, 'modified': modified, 'removed': removed}
+
+    def indexed(self, relpath: str) -> bool:
+        """True if a root-relative path falls under one of the graph's roots"""
+        if os.path.splitext(relpath)[1] not in TARGET_EXTENSIONS:
+            return False
+        parts = relpath.split('/')
+        if not PRUNE_DIRS.isdisjoint(parts[:-1]):
+            return False
+        return any(relpath == root or relpath.startswith(root + '/') for root in self.roots)
+
+    # -- persistence ---------------------------------------------------------
+
+    def fingerprint(self) -> str:
+        """Identify resolution settings so a cached graph is dropped when they change"""
+        source = json.dumps({'version': GRAPH_VERSION, 'roots': self.roots, 'aliases': self.aliases})
+        return content_digest(source.encode('utf-8'))
+
+    def load(self) -> bool:
+        """Restore the cached graph; False if there is none or it is stale"""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return False
+        if data.get('fingerprint') != self.fingerprint():
+            return False
+        for relpath, (size, mtime_ns, edges) in data['files'].items():
+            self.meta[relpath] = (size, mtime_ns)
+            self.specifiers[relpath] = [specifier for specifier, _ in edges]
+            self.forward[relpath] = [ImportEdge(specifier, target) for specifier, target in edges]
+        for importer, edges in self.forward.items():
+            for edge in edges:
+                if edge.target is not None:
+                    self.reverse.setdefault(edge.target, set()).add(importer)
+                for base in self.specifier_bases(importer, edge.specifier):
+                    self.by_base.setdefault(base, set()).add(importer)
+        return True
+
+    def save(self) -> None:
+        """Write the graph to the cache file"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        files = {
+            relpath: [size, mtime_ns, [list(edge) for edge in self.forward.get(relpath, ())]]
+            for relpath, (size, mtime_ns) in self.meta.items()
+        }
+        temp_path = self.cache_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps({'fingerprint': self.fingerprint(), 'files': files}), encoding='utf-8')
+        os.replace(temp_path, self.cache_path)
+
+    # -- queries -------------------------------------------------------------
+
+    def importers(self, path) -> List[str]:
+        """Files that import `path`"""
+        return sorted(self.reverse.get(self.relative(path), ()))
+
+    def imports(self, path) -> List[ImportEdge]:
+        """Specifiers `path` imports and what they resolved to"""
+        return list(self.forward.get(self.relative(path), ()))
+
+    def unresolved(self) -> Dict[str, List[str]]:
+        """Relative and aliased specifiers that point at no file"""
+        broken = {}
+        for importer, edges in self.forward.items():
+            missing = [edge.specifier for edge in edges
+                       if edge.target is None and self.specifier_bases(importer, edge.specifier)]
+            if missing:
+                broken[importer] = missing
+        return broken
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'files': len(self.meta),
+            'edges': sum(len(edges) for edges in self.forward.values()),
+            'internal_edges': sum(len(importers) for importers in self.reverse.values()),
+        }
+
+def load_graph(project_root: str = ".", use_cache: bool = True) -> ImportGraph:
+    """Load the cached graph (if any), bring it up to date and save it back"""
+    graph = ImportGraph(project_root)
+    if use_cache:
+        graph.load()
+    graph.update()
+    if use_cache:
+        graph.save()
+    return graph
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build and query the project import graph')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--who-imports', metavar='PATH', help='List files that import PATH')
+    parser.add_argument('--imports', metavar='PATH', help='List what PATH imports')
+    parser.add_argument('--unresolved', action='store_true', help='List relative imports that resolve to no file')
+    parser.add_argument('--no-cache', action='store_true', help='Rebuild from scratch and do not save')
+    parser.add_argument('--output', help='Write the forward graph as JSON to this path')
+
+    args = parser.parse_args()
+
+    graph = load_graph(args.project_root, use_cache=not args.no_cache)
+    stats = graph.stats()
+    print(f"🕸️  {stats['files']} files, {stats['edges']} imports ({stats['internal_edges']} within the project)")
+
+    if args.who_imports:
+        importers = graph.importers(args.who_imports)
+        print(f"\n⬅️  {len(importers)} files import {args.who_imports}:")
+        for importer in importers:
+            print(f"  • {importer}")
+
+    if args.imports:
+        print(f"\n➡️  {args.imports} imports:")
+        for edge in graph.imports(args.imports):
+            print(f"  • {edge.specifier} → {edge.target or '(package / unresolved)'}")
+
+    if args.unresolved:
+        broken = graph.unresolved()
+        print(f"\n🚨 {sum(len(specs) for specs in broken.values())} unresolved imports:")
+        for importer, specifiers in sorted(broken.items()):
+            for specifier in specifiers:
+                print(f"  • {importer}: {specifier}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({relpath: [edge._asdict() for edge in edges] for relpath, edges in graph.forward.items()}, f, indent=2)
+        print(f"\n💾 Graph saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
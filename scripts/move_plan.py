@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Move Plan - Two-Phase, Journaled File Reorganization
+Path: scripts/move_plan.py
+Purpose: Plan moves/renames/mkdirs as data, apply them in one batch with a write-ahead journal, and roll them back
+"""
+
+import os
+import sys
+import json
+import errno
+import shutil
+import posixpath
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from analysis_cache import DEFAULT_CACHE_DIR
+from duplicate_finder import full_digest
+
+# Append-only journals of applied plans, relative to the project root
+JOURNAL_DIR = DEFAULT_CACHE_DIR / "journals"
+
+# Bump when the saved plan layout changes
+PLAN_VERSION = 1
+
+@dataclass
+class PlanStep:
+    """One filesystem operation, with root-relative '/'-separated paths"""
+    op: str                         # 'mkdir', 'move', 'remove' or 'chmod'
+    target: str                     # remove: the file replacing it for importers, or ''; it goes to the trash
+    source: Optional[str] = None    # move and remove
+    mode: Optional[int] = None      # chmod: new permission bits
+    previous_mode: Optional[int] = None
+    reason: str = ''
+
+    def describe(self) -> str:
+        if self.op == 'mkdir':
+            return f"📁 mkdir {self.target}"
+        if self.op == 'chmod':
+            return f"🔧 chmod {self.mode:o} {self.target}"
+        if self.op == 'remove':
+            return f"🗑️  remove {self.source}" + (f" (keeping {self.target})" if self.target else "")
+        emoji = "⚠️ " if self.reason == 'backup' else "🔧" if self.reason in ('extension', 'extension_fix') else "✅"
+        return f"{emoji} {self.source} → {self.target}"
+
+class MovePlan:
+    """Phase one: the complete list of operations, computed without touching the tree.
+
+    Planning keeps a virtual view of which paths exist once the earlier
+    steps have run, so a later step sees the effect of an earlier one (a
+    file already moved away is not moved again, an occupied destination is
+    backed up first, each missing parent directory is created once).
+    """
+
+    def __init__(self, project_root: str = ".", tool: str = 'organizer'):
+        self.project_root = Path(project_root).resolve()
+        self.tool = tool
+        self.steps: List[PlanStep] = []
+        self._exists: Dict[str, bool] = {}
+        # Files the plan was computed from, as {relpath: {'size', 'digest'}}; see record_preconditions()
+        self.preconditions: Dict[str, Dict] = {}
+        self._inputs: Dict[str, None] = {}
+
+    def relative(self, path) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.project_root)
+        return path.as_posix()
+
+    def exists(self, relpath: str) -> bool:
+        """Whether relpath will exist after the steps planned so far"""
+        if relpath in self._exists:
+            return self._exists[relpath]
+        return (self.project_root / relpath).exists()
+
+    def require(self, path) -> None:
+        """Note a file whose contents the plan depends on (move and remove sources are noted automatically)"""
+        relpath = self.relative(path)
+        if relpath not in self._exists:
+            self._inputs.setdefault(relpath, None)
+
+    def mkdir(self, relpath: str, reason: str = '') -> None:
+        """Plan creation of a directory and each missing parent"""
+        missing = []
+        while relpath not in ('', '.') and not self.exists(relpath):
+            missing.append(relpath)
+            relpath = posixpath.dirname(relpath)
+        for path in reversed(missing):
+            self.steps.append(PlanStep('mkdir', path, reason=reason))
+            self._exists[path] = True
+
+    def move(self, source, target, reason: str = 'move') -> bool:
+        """Plan a move; an occupied target is first moved aside to a .backup name"""
+        source, target = self.relative(source), self.relative(target)
+        if source == target or not self.exists(source):
+            return False
+        self.require(source)
+        self.mkdir(posixpath.dirname(target))
+        if self.exists(target):
+            self.require(target)
+            backup = target + '.backup'
+            counter = 1
+            while self.exists(backup):
+                backup = f"{target}.backup.{counter}"
+                counter += 1
+            self.steps.append(PlanStep('move', backup, source=target, reason='backup'))
+            self._exists[target], self._exists[backup] = False, True
+        self.steps.append(PlanStep('move', target, source=source, reason=reason))
+        self._exists[source], self._exists[target] = False, True
+        return True
+
+    def remove(self, source, reason: str = 'remove', replaced_by=None) -> bool:
+        """Plan removal of a file; it is kept in the journal's trash so rollback can restore it.
+
+        replaced_by names the file its importers should use instead.
+        """
+        source = self.relative(source)
+        if not self.exists(source):
+            return False
+        self.require(source)
+        target = self.relative(replaced_by) if replaced_by is not None else ''
+        self.steps.append(PlanStep('remove', target, source=source, reason=reason))
+        self._exists[source] = False
+        return True
+
+    def relocations(self) -> List[PlanStep]:
+        """Steps after which importers of source should import target instead"""
+        return [step for step in self.steps
+                if (step.op == 'move' and step.reason != 'backup') or (step.op == 'remove' and step.target)]
+
+    def final_location(self, relpath: str, start: int = 0) -> Optional[str]:
+        """Where the file at relpath after step start-1 ends up once the plan ran (None if it is removed).
+
+        Pass the index just past the step that put a file at relpath, so
+        earlier steps moving a previous occupant away are not followed.
+        """
+        for step in self.steps[start:]:
+            if step.source == relpath:
+                if step.op == 'remove':
+                    return None
+                relpath = step.target
+        return relpath
+
+    def chmod(self, target, mode: int, previous_mode: int) -> None:
+        self.steps.append(PlanStep('chmod', self.relative(target), mode=mode, previous_mode=previous_mode))
+
+    def moves(self, include_backups: bool = False) -> List[PlanStep]:
+        return [step for step in self.steps
+                if step.op == 'move' and (include_backups or step.reason != 'backup')]
+
+    def check(self) -> List[str]:
+        """Problems that would make applying the plan fail, checked against the tree as it is now"""
+        problems = []
+        exists: Dict[str, bool] = {}
+        def present(relpath):
+            return exists[relpath] if relpath in exists else (self.project_root / relpath).exists()
+        for step in self.steps:
+            if step.op == 'mkdir':
+                if present(step.target) and not (self.project_root / step.target).is_dir():
+                    problems.append(f"{step.target} exists and is not a directory")
+                exists[step.target] = True
+            elif step.op == 'move':
+                if not present(step.source):
+                    problems.append(f"{step.source} no longer exists")
+                if present(step.target):
+                    problems.append(f"{step.target} already exists")
+                exists[step.source], exists[step.target] = False, True
+            elif step.op == 'remove':
+                if not present(step.source):
+                    problems.append(f"{step.source} no longer exists")
+                exists[step.source] = False
+            elif not present(step.target):
+                problems.append(f"{step.target} will not exist to chmod")
+        return problems
+
+    def existing_directories(self) -> List[int]:
+        """Indices of mkdir steps whose directory already exists, e.g. one made by hand since a dry run"""
+        return [index for index, step in enumerate(self.steps)
+                if step.op == 'mkdir' and (self.project_root / step.target).is_dir()]
+
+    def record_preconditions(self) -> None:
+        """Hash every input file as it is now, so a saved plan can tell when the tree moved on"""
+        self.preconditions = {}
+        for relpath in self._inputs:
+            path = self.project_root / relpath
+            try:
+                self.preconditions[relpath] = {'size': path.stat().st_size, 'digest': full_digest(str(path))}
+            except OSError:
+                continue
+
+    def stale_inputs(self) -> List[str]:
+        """Inputs that changed since record_preconditions(): a size check first, a hash only when sizes match"""
+        stale = []
+        for relpath, expected in self.preconditions.items():
+            path = self.project_root / relpath
+            try:
+                if path.stat().st_size != expected['size'] or full_digest(str(path)) != expected['digest']:
+                    stale.append(relpath)
+            except OSError:
+                stale.append(relpath)
+        return stale
+
+    def to_dict(self) -> Dict:
+        return {'project_root': str(self.project_root), 'steps': [asdict(step) for step in self.steps]}
+
+    @classmethod
+    def from_dict(cls, data: Dict, project_root: Optional[str] = None) -> 'MovePlan':
+        plan = cls(project_root or data['project_root'], data.get('tool', 'organizer'))
+        plan.steps = [PlanStep(**step) for step in data['steps']]
+        plan.preconditions = data.get('preconditions', {})
+        return plan
+
+    def save(self, path) -> None:
+        """Write the plan with the content hashes of its inputs, for review and a later --apply"""
+        self.record_preconditions()
+        data = {'version': PLAN_VERSION, 'tool': self.tool, 'created': datetime.now().isoformat(),
+                **self.to_dict(), 'preconditions': self.preconditions}
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, tool: str, project_root: Optional[str] = None) -> 'MovePlan':
+        """A saved plan; raises ValueError if it was made by another tool or plan version"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != PLAN_VERSION:
+            raise ValueError(f"{path}: unsupported plan version {data.get('version')}")
+        if data.get('tool') != tool:
+            raise ValueError(f"{path}: plan was made by {data.get('tool')}, not {tool}")
+        return cls.from_dict(data, project_root)
+
+def rename(source: Path, target: Path) -> bool:
+    """os.rename, falling back to a copying move across filesystems; True if the fast path worked"""
+    try:
+        os.rename(source, target)
+        return True
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    shutil.move(str(source), str(target))
+    return False
+
+def fsync_path(path: Path) -> None:
+    """Flush a file or directory entry to disk (directories cannot be opened on every platform)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class MoveJournal:
+    """Append-only JSON-lines journal of one applied plan.
+
+    The whole plan is written (and fsync'ed) before the first operation,
+    so an interrupted run can still be rolled back: undo looks at the tree
+    to see which steps took effect. Files rewritten after the moves (import
+    updates) are copied into the journal's trash directory first. Records:
+    begin (with the plan), edit, commit, rollback.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.journal_id = self.path.stem
+        self.trash_dir = self.path.with_suffix('.trash')
+        self.project_root: Optional[Path] = None
+        self.saved = set()
+
+    @classmethod
+    def create(cls, project_root) -> 'MoveJournal':
+        journal_dir = Path(project_root).resolve() / JOURNAL_DIR
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        return cls(journal_dir / f"{stamp}-{os.getpid()}.jsonl")
+
+    def append(self, record: Dict, sync: bool = False) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+
+    def records(self) -> List[Dict]:
+        with open(self.path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def begin(self, plan: MovePlan, skipped: Iterable[int] = ()) -> None:
+        """Journal the plan; skipped are step indices that will not run and must not be undone"""
+        self.project_root = plan.project_root
+        self.append({'type': 'begin', 'timestamp': datetime.now().isoformat(), **plan.to_dict(),
+                     'skipped': sorted(skipped)}, sync=True)
+
+    def save_original(self, relpath: str) -> None:
+        """Keep a copy of a file about to be rewritten (once per run) so rollback can restore it"""
+        if relpath in self.saved:
+            return
+        self.saved.add(relpath)
+        source = self.project_root / relpath
+        copy = self.trash_dir / 'edits' / relpath
+        copy.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, copy)
+        self.append({'type': 'edit', 'path': relpath, 'copy': copy.relative_to(self.trash_dir).as_posix()})
+
+    def commit(self, plan: MovePlan, edited: Iterable[str] = ()) -> None:
+        """One fsync pass over every touched file and directory, then the commit record"""
+        root = plan.project_root
+        directories = set()
+        for step in plan.steps:
+            directories.add(posixpath.dirname(step.target))
+            if step.source is not None:
+                directories.add(posixpath.dirname(step.source))
+        for relpath in edited:
+            fsync_path(root / relpath)
+        for relpath in sorted(directories):
+            fsync_path(root / relpath if relpath else root)
+        self.append({'type': 'commit', 'timestamp': datetime.now().isoformat()}, sync=True)
+
+def apply_plan(plan: MovePlan, journal: MoveJournal) -> Dict[str, int]:
+    """Phase two: journal the plan, then run every step. On failure the applied steps are undone.
+
+    Returns counts of renames, cross-device fallbacks, directories created, removals and chmods.
+    """
+    problems = plan.check()
+    if problems:
+        raise RuntimeError("Plan no longer matches the tree: " + "; ".join(problems[:5]))
+
+    # A directory that exists already is not ours to create, nor to remove on rollback
+    skipped = set(plan.existing_directories())
+    journal.begin(plan, skipped)
+    root = plan.project_root
+    counts = {'renamed': 0, 'copied': 0, 'mkdir': 0, 'chmod': 0, 'removed': 0}
+    applied = 0
+    try:
+        for index, step in enumerate(plan.steps):
+            target = root / step.target
+            if index in skipped:
+                pass
+            elif step.op == 'mkdir':
+                os.mkdir(target)
+                counts['mkdir'] += 1
+            elif step.op == 'move':
+                counts['renamed' if rename(root / step.source, target) else 'copied'] += 1
+            elif step.op == 'remove':
+                trashed = journal.trash_dir / 'removed' / step.source
+                trashed.parent.mkdir(parents=True, exist_ok=True)
+                counts['renamed' if rename(root / step.source, trashed) else 'copied'] += 1
+                counts['removed'] += 1
+            else:
+                os.chmod(target, step.mode)
+                counts['chmod'] += 1
+            applied += 1
+    except OSError as e:
+        print(f"❌ Step {applied + 1}/{len(plan.steps)} failed ({plan.steps[applied].describe()}): {e}")
+        print("↩️  Undoing the steps already applied...")
+        undo_steps(root, [step for index, step in enumerate(plan.steps[:applied]) if index not in skipped],
+                   journal.trash_dir)
+        journal.append({'type': 'rollback', 'timestamp': datetime.now().isoformat(), 'reason': str(e)}, sync=True)
+        raise
+    return counts
+
+def undo_steps(root: Path, steps: List[PlanStep], trash_dir: Path) -> List[str]:
+    """Reverse the given steps, last first, skipping any that did not take effect"""
+    notes = []
+    for step in reversed(steps):
+        target = root / step.target
+        if step.op == 'remove':
+            trashed = trash_dir / 'removed' / step.source
+            if trashed.exists() and not (root / step.source).exists():
+                (root / step.source).parent.mkdir(parents=True, exist_ok=True)
+                rename(trashed, root / step.source)
+        elif step.op == 'move':
+            source = root / step.source
+            if not target.exists():
+                continue
+            if source.exists():
+                # Something new took the old path; keep it in the trash rather than overwrite it
+                parked = trash_dir / 'displaced' / step.source
+                parked.parent.mkdir(parents=True, exist_ok=True)
+                rename(source, parked)
+                notes.append(f"{step.source} was occupied; moved the occupant to {parked}")
+            source.parent.mkdir(parents=True, exist_ok=True)
+            rename(target, source)
+        elif step.op == 'mkdir':
+            try:
+                os.rmdir(target)
+            except OSError:
+                if target.exists():
+                    notes.append(f"{step.target} is not empty; left in place")
+        elif step.op == 'chmod' and target.exists() and step.previous_mode is not None:
+            os.chmod(target, step.previous_mode)
+    return notes
+
+def list_journals(project_root) -> List[MoveJournal]:
+    """Journals of this project, oldest first"""
+    journal_dir = Path(project_root).resolve() / JOURNAL_DIR
+    if not journal_dir.is_dir():
+        return []
+    return [MoveJournal(path) for path in sorted(journal_dir.glob('*.jsonl'))]
+
+def find_journal(project_root, journal_id: Optional[str] = None) -> Optional[MoveJournal]:
+    """A journal by id, or the newest one not rolled back yet"""
+    for journal in reversed(list_journals(project_root)):
+        if journal_id is not None:
+            if journal.journal_id == journal_id:
+                return journal
+        elif not any(record['type'] == 'rollback' for record in journal.records()):
+            return journal
+    return None
+
+def rollback(project_root, journal_id: Optional[str] = None) -> bool:
+    """Undo a journaled run: restore rewritten files, then reverse the moves, last first"""
+    journal = find_journal(project_root, journal_id)
+    if journal is None:
+        print("📭 No journal to roll back" if journal_id is None else f"❌ Unknown journal: {journal_id}")
+        return False
+    records = journal.records()
+    if any(record['type'] == 'rollback' for record in records):
+        print(f"⚠️  Journal {journal.journal_id} was already rolled back")
+        return False
+    begin = records[0]
+    plan = MovePlan.from_dict(begin, project_root)
+    state = 'committed' if any(record['type'] == 'commit' for record in records) else 'interrupted'
+    print(f"↩️  Rolling back {journal.journal_id} ({state}, {len(plan.steps)} steps)")
+
+    for record in reversed(records):
+        if record['type'] == 'edit':
+            shutil.copy2(journal.trash_dir / record['copy'], plan.project_root / record['path'])
+    skipped = set(begin.get('skipped', ()))
+    steps = [step for index, step in enumerate(plan.steps) if index not in skipped]
+    notes = undo_steps(plan.project_root, steps, journal.trash_dir)
+    for note in notes:
+        print(f"⚠️  {note}")
+    journal.append({'type': 'rollback', 'timestamp': datetime.now().isoformat()}, sync=True)
+    print(f"✅ Rolled back {len(plan.moves())} moves")
+    return True
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect and roll back journaled file reorganizations')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--list', action='store_true', help='List journals')
+    parser.add_argument('--rollback', nargs='?', const='', metavar='JOURNAL',
+                        help='Undo a run (default: the newest one not rolled back)')
+
+    args = parser.parse_args()
+
+    if args.rollback is not None:
+        sys.exit(0 if rollback(args.project_root, args.rollback or None) else 1)
+
+    for journal in list_journals(args.project_root):
+        records = journal.records()
+        kinds = {record['type'] for record in records}
+        state = 'rolled back' if 'rollback' in kinds else 'committed' if 'commit' in kinds else 'interrupted'
+        steps = len(records[0].get('steps', [])) if records else 0
+        print(f"  • {journal.journal_id}: {steps} steps, {state}")
+
+if __name__ == "__main__":
+    main()
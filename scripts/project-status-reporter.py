@@ -22,6 +22,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 import re
+from tree_snapshot import TreeSnapshot
 
 class ProjectAnalyzer:
     def __init__(self, project_root="."):
@@ -31,6 +32,7 @@ class ProjectAnalyzer:
             "project_root": str(self.project_root),
             "sections": {}
         }
+        self.snapshot = TreeSnapshot(self.project_root, 'status')
         
     def check_git_status(self):
         """Check git repository status and sync"""
@@ -189,6 +191,14 @@ class ProjectAnalyzer:
             
         return doc_status
 
+    def check_changes(self):
+        """Files added, modified or removed since the last status report"""
+        # Scanned once per run: analyze() may be called more than once
+        if self.snapshot.diff is None:
+            self.snapshot.scan()
+            self.snapshot.save()
+        return dict(self.snapshot.diff.summary(limit=20), first_report=self.snapshot.previous is None)
+
     def generate_recommendations(self):
         """Generate next steps based on analysis"""
         recommendations = []
@@ -233,6 +243,7 @@ class ProjectAnalyzer:
         self.report["sections"]["environment"] = self.check_env_config()
         self.report["sections"]["components"] = self.check_components()
         self.report["sections"]["documentation"] = self.check_documentation()
+        self.report["sections"]["changes"] = self.check_changes()
         
         # Generate recommendations
         self.report["recommendations"] = self.generate_recommendations()
@@ -297,6 +308,17 @@ Project: Lesson Plan App
             size = f" ({status.get('size', 0)} bytes)" if status.get("exists") else ""
             md_content += f"  - {emoji} {name}{size}\n"
         
+        # Changes since the previous report
+        changes = report["sections"]["changes"]
+        if not changes.get("first_report"):
+            md_content += f"""
+### Changes Since Last Report
+- Added: {changes['added']}, Modified: {changes['modified']}, Removed: {changes['removed']}
+"""
+            for kind in ("added", "modified", "removed"):
+                for path in changes["paths"][kind]:
+                    md_content += f"  - {kind}: `{path}`\n"
+        
         # Recommendations
         md_content += f"""
 ## 🎯 Next Steps
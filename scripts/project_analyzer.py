@@ -7,11 +7,248 @@ Purpose: Crawl project and detect React/TypeScript file extension mismatches
 
 import os
 import re
+import sys
 import json
+import sqlite3
+import subprocess
+import time
+from array import array
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Set, TextIO, Tuple, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime
+from analysis_cache import AnalysisCache, DEFAULT_CACHE_DIR, content_digest, load_digests
+from tsx_lexer import LEXER_VERSION, LiteralStripper, scan_source
+from destination_rules import RuleMatch, load_rules, signals_from_analysis
+from read_pipeline import iter_pipelined
+from source_reader import BINARY, DEFAULT_BYTE_BUDGET, SNIFF_SIZE, TEXT, WINDOW_SIZE, WindowReader, sniff
+
+# Bump when the classification rules in analyze_content change
+ANALYSIS_VERSION = 2
+
+# JSX/React detectors: the literal-aware lexer, or the original regex heuristics
+DETECTORS = ('lexer', 'regex')
+
+# Where candidate files come from: a directory walk or the git index
+ENUMERATORS = ('walk', 'git')
+
+# File extensions the analyzer classifies
+TARGET_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx'}
+
+# Heavy directories that never contain project sources worth analyzing
+PRUNE_DIRS = {
+    'node_modules', 'Pods', 'build', 'dist', '.git', '.expo',
+    '.gradle', '.cache', '__pycache__', '.docusaurus',
+}
+
+def scan_source_tree(top: str, suffixes=TARGET_EXTENSIONS, prune_dirs=PRUNE_DIRS) -> Iterator[str]:
+    """Walk a directory with os.scandir, pruning heavy dirs and filtering by suffix.
+
+    The suffix check happens on the entry name, so only matching files ever
+    reach is_file(); on most platforms that uses the cached d_type and never
+    issues a stat call. suffixes=None yields every file. Symlinked
+    directories are not followed.
+    """
+    stack = [top]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in prune_dirs:
+                            subdirs.append(entry.path)
+                    elif (suffixes is None or os.path.splitext(name)[1] in suffixes) and entry.is_file():
+                        yield entry.path
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue
+        # Reverse so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+def iter_git_paths(args: List[str], cwd) -> Iterator[str]:
+    """Stream the NUL-separated paths printed by one git command.
+
+    Output is read in chunks while git is still running, so the first paths
+    are available immediately and memory does not grow with the repository.
+    Consecutive duplicates (one entry per conflict stage) are dropped.
+    """
+    try:
+        process = subprocess.Popen(['git', *args], cwd=cwd,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise RuntimeError("git is not installed or not on PATH")
+    pending = b''
+    previous = None
+    try:
+        for chunk in iter(lambda: process.stdout.read(1 << 16), b''):
+            parts = (pending + chunk).split(b'\0')
+            pending = parts.pop()
+            for raw in parts:
+                if raw and raw != previous:
+                    yield os.fsdecode(raw)
+                previous = raw
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode != 0:
+        message = stderr.decode('utf-8', 'replace').strip()
+        raise RuntimeError(f"git {args[0]} failed: {message or f'exit status {returncode}'}")
+
+class BarrierPattern:
+    """A regex of the form PREFIX[^BARRIER]*ANCHOR, searched anchor-first.
+
+    Searching such a regex directly re-scans up to the next barrier from every
+    candidate prefix, which goes quadratic on long minified lines with few '>'
+    characters. Finding the rare anchor first and then looking for the prefix
+    only between the previous barrier and the anchor gives the same answer
+    without the repeated scans.
+    """
+    
+    def __init__(self, prefix: str, barrier: str, anchor: str, flags: int = re.MULTILINE):
+        self.pattern = f'{prefix}[^{re.escape(barrier)}]*{anchor}'
+        self.barrier = barrier
+        self.prefix_re = re.compile(prefix, flags)
+        self.anchor_re = re.compile(anchor, flags)
+    
+    def search(self, text: str) -> bool:
+        """Return True if the equivalent regex matches anywhere in text"""
+        for anchor in self.anchor_re.finditer(text):
+            end = anchor.start()
+            start = text.rfind(self.barrier, 0, end) + 1
+            if self.prefix_re.search(text, start, end):
+                return True
+        return False
+    
+    def __str__(self) -> str:
+        return self.pattern
+
+class PatternMatcher:
+    """Precompiled category matcher used by analyze_file_content.
+
+    Every pattern is compiled once up front and a category stops at its
+    first hit. Entries may be regex strings or objects with a search() method
+    such as BarrierPattern.
+    """
+    
+    def __init__(self, categories: Dict[str, list], flags: int = re.MULTILINE):
+        self.categories = {}
+        for name, patterns in categories.items():
+            self.categories[name] = [
+                re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+                for pattern in patterns
+            ]
+    
+    def scan(self, text: str, profile: Optional['AnalyzerProfile'] = None) -> Set[str]:
+        """Return the names of all categories with at least one match"""
+        if profile is None:
+            return {
+                name for name, patterns in self.categories.items()
+                if any(pattern.search(text) for pattern in patterns)
+            }
+        
+        found = set()
+        for name, patterns in self.categories.items():
+            for pattern in patterns:
+                start = time.perf_counter()
+                hit = bool(pattern.search(text))
+                profile.add_pattern(name, getattr(pattern, 'pattern', str(pattern)), time.perf_counter() - start, hit)
+                if hit:
+                    found.add(name)
+                    break
+        return found
+
+class AnalyzerProfile:
+    """Opt-in --profile instrumentation: per-phase wall time and per-pattern cost"""
+    
+    def __init__(self):
+        self.phases = {}    # phase -> [seconds, calls]
+        self.patterns = {}  # (category, pattern) -> [seconds, calls, hits]
+    
+    def add_phase(self, name: str, seconds: float, calls: int = 1) -> None:
+        entry = self.phases.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block of code as one call of a phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+    
+    def add_pattern(self, category: str, pattern: str, seconds: float, hit: bool) -> None:
+        entry = self.patterns.setdefault((category, pattern), [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+        entry[2] += int(hit)
+    
+    def timed_iter(self, iterator, name: str):
+        """Wrap an iterator so the time spent producing items counts toward a phase"""
+        iterator = iter(iterator)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_phase(name, time.perf_counter() - start, 0)
+                return
+            self.add_phase(name, time.perf_counter() - start)
+            yield item
+    
+    def merge(self, data: Dict) -> None:
+        """Fold in a to_dict() snapshot, e.g. from a --jobs worker"""
+        for name, entry in data['phases'].items():
+            self.add_phase(name, entry['seconds'], entry['calls'])
+        for entry in data['patterns']:
+            total = self.patterns.setdefault((entry['category'], entry['pattern']), [0.0, 0, 0])
+            total[0] += entry['seconds']
+            total[1] += entry['calls']
+            total[2] += entry['hits']
+    
+    def drain(self) -> Dict:
+        """Return a snapshot and reset the counters"""
+        data = self.to_dict()
+        self.phases = {}
+        self.patterns = {}
+        return data
+    
+    def to_dict(self) -> Dict:
+        """Machine-readable form for the JSON report, slowest patterns first"""
+        return {
+            'phases': {
+                name: {'seconds': round(seconds, 6), 'calls': calls}
+                for name, (seconds, calls) in self.phases.items()
+            },
+            'patterns': [
+                {'category': category, 'pattern': pattern, 'seconds': round(seconds, 6),
+                 'calls': calls, 'hits': hits}
+                for (category, pattern), (seconds, calls, hits)
+                in sorted(self.patterns.items(), key=lambda item: -item[1][0])
+            ],
+        }
+    
+    @staticmethod
+    def print_table(data: Dict) -> None:
+        """Print a to_dict() snapshot as console tables"""
+        print(f"\n⏱️  PROFILE - PHASES:")
+        print(f"  {'phase':<10} {'seconds':>10} {'calls':>8}")
+        for name, entry in data['phases'].items():
+            print(f"  {name:<10} {entry['seconds']:>10.4f} {entry['calls']:>8}")
+        if data['patterns']:
+            print(f"\n⏱️  PROFILE - PATTERNS (slowest first):")
+            print(f"  {'seconds':>10} {'calls':>7} {'hits':>6}  category / pattern")
+            for entry in data['patterns']:
+                print(f"  {entry['seconds']:>10.4f} {entry['calls']:>7} {entry['hits']:>6}  "
+                      f"{entry['category']} / {entry['pattern']}")
 
 @dataclass
 class FileAnalysis:
@@ -25,19 +262,234 @@ class FileAnalysis:
     contains_react_imports: bool
     contains_components: bool
 
+def json_default(obj):
+    """json.dump hook so reports containing FileAnalysis objects serialize"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Sequence):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def report_from_json(report: Dict) -> Dict:
+    """Turn a report read back from JSON into the shape generate_report() returns"""
+    report['detailed_analysis'] = {
+        category: [FileAnalysis(**analysis) for analysis in analyses]
+        for category, analyses in report['detailed_analysis'].items()
+    }
+    return report
+
+# Bit flags packed into compact analysis rows
+FLAG_JSX = 1
+FLAG_REACT_IMPORTS = 2
+FLAG_COMPONENTS = 4
+
+def analysis_to_row(analysis: FileAnalysis) -> Tuple[str, str, float, int]:
+    """Pack the parts of a FileAnalysis not derivable from its path into a tuple"""
+    flags = (
+        (FLAG_JSX if analysis.contains_jsx else 0)
+        | (FLAG_REACT_IMPORTS if analysis.contains_react_imports else 0)
+        | (FLAG_COMPONENTS if analysis.contains_components else 0)
+    )
+    return (analysis.suggested_extension, analysis.reason, analysis.confidence, flags)
+
+def analysis_from_row(filepath: str, row: Tuple[str, str, float, int]) -> FileAnalysis:
+    """Rebuild a FileAnalysis from its path and a row made by analysis_to_row"""
+    suggested_extension, reason, confidence, flags = row
+    return FileAnalysis(
+        filepath=filepath,
+        current_extension=os.path.splitext(filepath)[1],
+        suggested_extension=suggested_extension,
+        reason=reason,
+        confidence=confidence,
+        contains_jsx=bool(flags & FLAG_JSX),
+        contains_react_imports=bool(flags & FLAG_REACT_IMPORTS),
+        contains_components=bool(flags & FLAG_COMPONENTS)
+    )
+
+class InternTable:
+    """Maps repeated values to small integer codes"""
+    __slots__ = ('values', 'codes')
+    
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+    
+    def intern(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+class CategoryColumns(Sequence):
+    """Column-oriented list of FileAnalysis results for one report category.
+
+    Directory prefixes and (suggested, reason, confidence) verdicts are
+    interned in tables shared by the whole store, the three content flags
+    are packed into one byte, and FileAnalysis objects are only built while
+    iterating or indexing.
+    """
+    __slots__ = ('_dir_table', '_verdict_table', '_dirs', '_names', '_verdicts', '_flags')
+    
+    def __init__(self, dir_table: InternTable, verdict_table: InternTable):
+        self._dir_table = dir_table
+        self._verdict_table = verdict_table
+        self._dirs = array('I')
+        self._names = []
+        self._verdicts = array('I')
+        self._flags = array('B')
+    
+    def append(self, analysis: FileAnalysis) -> None:
+        directory, name = os.path.split(analysis.filepath)
+        suggested, reason, confidence, flags = analysis_to_row(analysis)
+        self._dirs.append(self._dir_table.intern(directory))
+        self._names.append(name)
+        self._verdicts.append(self._verdict_table.intern((suggested, reason, confidence)))
+        self._flags.append(flags)
+    
+    def _build(self, index: int) -> FileAnalysis:
+        filepath = os.path.join(self._dir_table.values[self._dirs[index]], self._names[index])
+        return analysis_from_row(filepath, self._verdict_table.values[self._verdicts[index]] + (self._flags[index],))
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('CategoryColumns index out of range')
+        return self._build(index)
+    
+    def __iter__(self) -> Iterator[FileAnalysis]:
+        for index in range(len(self._names)):
+            yield self._build(index)
+    
+    def extension_issues(self) -> Iterator[FileAnalysis]:
+        """Iterate only analyses whose suggested extension differs from the current one"""
+        verdicts = self._verdict_table.values
+        for index, code in enumerate(self._verdicts):
+            if verdicts[code][0] != os.path.splitext(self._names[index])[1]:
+                yield self._build(index)
+
+class AnalysisStore(Mapping):
+    """Compact replacement for the dict of FileAnalysis lists crawl_project used to return.
+
+    Behaves like a read-only mapping of category name to a sequence of
+    FileAnalysis, so report code can keep using items(), len() and iteration.
+    """
+    
+    def __init__(self, categories=('downloads', 'src', 'scripts', 'other')):
+        self._dir_table = InternTable()
+        self._verdict_table = InternTable()
+        self._columns = {}
+        for category in categories:
+            self._new_category(category)
+    
+    def _new_category(self, category: str) -> CategoryColumns:
+        columns = self._columns[category] = CategoryColumns(self._dir_table, self._verdict_table)
+        return columns
+    
+    def add(self, category: str, analysis: FileAnalysis) -> None:
+        columns = self._columns.get(category) or self._new_category(category)
+        columns.append(analysis)
+    
+    def __getitem__(self, category: str) -> CategoryColumns:
+        return self._columns[category]
+    
+    def __iter__(self):
+        return iter(self._columns)
+    
+    def __len__(self) -> int:
+        return len(self._columns)
+    
+    def to_dict(self) -> Dict[str, List[FileAnalysis]]:
+        """Materialize the plain dict-of-lists form"""
+        return {category: list(columns) for category, columns in self._columns.items()}
+
+# Per-process analyzer used by --jobs workers
+_worker_analyzer = None
+
+def _init_worker(project_root: str, profile: bool = False, detector: str = 'lexer',
+                 byte_budget: int = DEFAULT_BYTE_BUDGET) -> None:
+    """Build one analyzer per worker process so patterns compile once"""
+    global _worker_analyzer
+    _worker_analyzer = ProjectAnalyzer(project_root, profile=profile, detector=detector,
+                                       byte_budget=byte_budget)
+
+def _analyze_batch(items: List[Tuple[str, Optional[str]]]) -> Tuple[List[Tuple[Optional[str], Optional[tuple]]], Optional[Dict]]:
+    """Analyze a chunk of (path, cached digest) pairs in a worker.
+
+    Returns (digest, row) per path, plus the worker's profile snapshot when
+    profiling. A row is None when the content hash matched the cached digest
+    and the parent can reuse its stored result.
+    """
+    analyzer = _worker_analyzer
+    results = []
+    for path, known_digest in items:
+        digest, analysis = analyzer.examine(Path(path), known_digest)
+        results.append((digest, None if analysis is None else analysis_to_row(analysis)))
+    return results, (analyzer.profile.drain() if analyzer.profile else None)
+
 class ProjectAnalyzer:
     """Smart analyzer for React/TypeScript project files"""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", jobs: int = 1, use_cache: bool = True,
+                 profile: bool = False, detector: str = 'lexer', enumeration: str = 'walk',
+                 since: Optional[str] = None, staged: bool = False, find_duplicates: bool = False,
+                 rules_path: Optional[str] = None, byte_budget: int = DEFAULT_BYTE_BUDGET,
+                 category_dirs: Optional[Dict[str, str]] = None, snapshot=None,
+                 io_concurrency: int = 1):
+        if detector not in DETECTORS:
+            raise ValueError(f"Unknown detector: {detector}")
+        if enumeration not in ENUMERATORS:
+            raise ValueError(f"Unknown enumeration mode: {enumeration}")
+        self.enumeration = enumeration
+        # Limit analysis to files changed since a ref and/or staged in the index
+        self.since = since
+        self.staged = staged
+        self.find_duplicates = find_duplicates
+        # Optional TreeSnapshot: files come from its scan and its stats replace per-file stat calls
+        self.snapshot = snapshot
+        # Stats already known for upcoming cache lookups (from the snapshot or the read pipeline)
+        self.known_stats = {}
+        # Concurrent reads for serial (--jobs 1) runs on high-latency filesystems; 1 = off
+        self.io_concurrency = max(1, io_concurrency)
+        # Bytes scanned per file before giving up on finding more signals (0 = no cap)
+        self.byte_budget = max(0, byte_budget)
+        # Compiled once per process and shared with EnhancedAutoFixer
+        self.rules_path = rules_path
+        self.destination_rules = load_rules(rules_path)
         self.project_root = Path(project_root).resolve()
+        self.detector = detector
+        self.profile = AnalyzerProfile() if profile else None
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.use_cache = use_cache
+        self.cache = None
+        self.cache_stats = None
         self.downloads_dir = self.project_root / "downloads"
         self.src_dir = self.project_root / "src"
         
-        # Patterns to detect React/JSX content
+        # Top-level directories mapped to report categories; root files go to 'other'
+        self.category_dirs = dict(category_dirs) if category_dirs is not None else {
+            'downloads': 'downloads',
+            'src': 'src',
+            'scripts': 'scripts',
+        }
+        self.target_extensions = set(TARGET_EXTENSIONS)
+        self.prune_dirs = set(PRUNE_DIRS)
+        
+        # Regex heuristics used by --detector regex. The tag patterns are written so
+        # they cannot backtrack across long minified lines; each matches exactly
+        # the same text as the original greedy regex.
         self.jsx_patterns = [
-            r'<[A-Z][a-zA-Z0-9]*\s*[^>]*>',  # JSX tags with capital letters
-            r'<[a-z]+\s+[^>]*className\s*=',  # HTML with className
-            r'<[a-z]+\s+[^>]*onClick\s*=',    # HTML with onClick
+            r'<[A-Z][^>]*+>',                                     # JSX tags with capital letters
+            BarrierPattern(r'<[a-z]++\s', '>', r'className\s*='),  # HTML with className
+            BarrierPattern(r'<[a-z]++\s', '>', r'onClick\s*='),    # HTML with onClick
             r'React\.createElement',           # React.createElement calls
             r'jsx\s*\(',                      # jsx() calls
         ]
@@ -56,32 +508,187 @@ class ProjectAnalyzer:
             r'function\s+[A-Z][a-zA-Z0-9]*\s*\(',
             r'export\s+default\s+[A-Z][a-zA-Z0-9]*',
         ]
+        
+        self.matcher = PatternMatcher({
+            'jsx': self.jsx_patterns,
+            'react_imports': self.react_import_patterns,
+            'components': self.component_patterns,
+        })
+
+    def pattern_fingerprint(self) -> str:
+        """Identify the pattern set so cached results are dropped when it changes"""
+        patterns = {
+            name: [getattr(pattern, 'pattern', str(pattern)) for pattern in compiled]
+            for name, compiled in self.matcher.categories.items()
+        }
+        if self.detector == 'lexer':
+            patterns = {'lexer': LEXER_VERSION}
+        source = json.dumps({'version': ANALYSIS_VERSION, 'patterns': patterns,
+                             'byte_budget': self.byte_budget, 'window': WINDOW_SIZE}, sort_keys=True)
+        return content_digest(source.encode('utf-8'))
+
+    def report_fingerprint(self) -> str:
+        """Identify every option that shapes generate_report(), so a report made elsewhere is reused only if it matches"""
+        source = json.dumps({
+            'patterns': self.pattern_fingerprint(),
+            'enumeration': self.enumeration,
+            'since': self.since,
+            'staged': self.staged,
+            'find_duplicates': self.find_duplicates,
+            'snapshot': self.snapshot is not None,
+            'rules': str(Path(self.rules_path).resolve()) if self.rules_path else None,
+            'category_dirs': self.category_dirs,
+        }, sort_keys=True)
+        return content_digest(source.encode('utf-8'))
+
+    def unreadable(self, filepath: Path) -> FileAnalysis:
+        """Result for files that cannot be read or decoded"""
+        return FileAnalysis(
+            filepath=str(filepath),
+            current_extension=filepath.suffix,
+            suggested_extension=filepath.suffix,
+            reason="Cannot read file",
+            confidence=0.0,
+            contains_jsx=False,
+            contains_react_imports=False,
+            contains_components=False
+        )
+
+    def skipped(self, filepath: Path, kind: str) -> FileAnalysis:
+        """Result for binary or minified files, which are not scanned"""
+        return FileAnalysis(
+            filepath=str(filepath),
+            current_extension=filepath.suffix,
+            suggested_extension=filepath.suffix,
+            reason=f"{kind.capitalize()} file (not scanned)",
+            confidence=0.0,
+            contains_jsx=False,
+            contains_react_imports=False,
+            contains_components=False
+        )
+
+    def read_file(self, f) -> bytes:
+        """Read the rest of an open file, timed as the 'read' phase when profiling"""
+        if self.profile is None:
+            return f.read()
+        with self.profile.phase('read'):
+            return f.read()
+
+    def digest(self, data: bytes) -> str:
+        """Content hash used by the cache, timed as the 'hash' phase when profiling"""
+        if self.profile is None:
+            return content_digest(data)
+        with self.profile.phase('hash'):
+            return content_digest(data)
+
+    def finish_digest(self, reader: WindowReader) -> str:
+        """Hash the unread tail of a streamed file, timed as the 'hash' phase when profiling"""
+        if self.profile is None:
+            return reader.finish()
+        with self.profile.phase('hash'):
+            return reader.finish()
+
+    def whole_read_limit(self) -> int:
+        """Largest file read in one piece; anything bigger is streamed in windows"""
+        return min(WINDOW_SIZE, self.byte_budget) if self.byte_budget else WINDOW_SIZE
+
+    def examine(self, filepath: Path, known_digest: Optional[str] = None) -> Tuple[Optional[str], Optional[FileAnalysis]]:
+        """Read, hash and classify one file with bounded memory.
+
+        Returns (digest, analysis). The analysis is None when the digest
+        equals known_digest (the caller's cached result still holds); the
+        digest is None when the file cannot be read. Files larger than one
+        window (or the byte budget) are streamed: a hash-only pass first
+        when there is a digest to compare against, then a scan that stops
+        once every signal is found or the budget is spent.
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= self.whole_read_limit():
+                    data = self.read_file(f)
+                    digest = self.digest(data)
+                    if digest == known_digest:
+                        return digest, None
+                    return digest, self.analyze_content(filepath, data)
+                
+                if known_digest is not None:
+                    digest = self.finish_digest(WindowReader(f))
+                    if digest == known_digest:
+                        return digest, None
+                    f.seek(0)
+                reader = WindowReader(f, WINDOW_SIZE, self.byte_budget)
+                analysis = self.analyze_stream(filepath, reader)
+                return self.finish_digest(reader), analysis
+        except PermissionError:
+            return None, self.unreadable(filepath)
 
     def analyze_file_content(self, filepath: Path) -> FileAnalysis:
         """Analyze a single file to determine correct extension"""
+        return self.examine(filepath)[1]
+
+    def detect(self, content: str, stripper: Optional[LiteralStripper] = None) -> Tuple[bool, bool, bool]:
+        """Return (contains_jsx, contains_react_imports, contains_components).
+
+        stripper carries the lexer's literal state from the previous window of a streamed file.
+        """
+        if self.detector == 'lexer':
+            return scan_source(content, self.profile, stripper)
+        found = self.matcher.scan(content, self.profile)
+        return 'jsx' in found, 'react_imports' in found, 'components' in found
+
+    def detect_timed(self, content: str, stripper: Optional[LiteralStripper] = None) -> Tuple[bool, bool, bool]:
+        """detect(), timed as the 'match' phase when profiling"""
+        if self.profile is None:
+            return self.detect(content, stripper)
+        with self.profile.phase('match'):
+            return self.detect(content, stripper)
+
+    def analyze_content(self, filepath: Path, data: bytes) -> FileAnalysis:
+        """Classify the already-read bytes of a file"""
+        kind = sniff(data[:SNIFF_SIZE])
+        if kind != TEXT:
+            return self.skipped(filepath, kind)
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Invalid UTF-8 past the sniffed block
+            return self.skipped(filepath, BINARY)
+        if '\r' in content:
+            # Same universal-newline translation read_text() applies
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        # Check for JSX content, React imports and components in one scan
+        return self.classify(filepath, *self.detect_timed(content))
+
+    def analyze_stream(self, filepath: Path, reader: WindowReader) -> FileAnalysis:
+        """Classify a large file window by window, stopping once nothing more can be learned"""
+        kind = reader.sniff()
+        if kind != TEXT:
+            return self.skipped(filepath, kind)
+        
+        windows = reader.windows()
+        if self.profile is not None:
+            windows = self.profile.timed_iter(windows, 'read')
+        # A literal or comment crossing a window boundary must stay a literal (the regexes keep no state)
+        stripper = LiteralStripper() if self.detector == 'lexer' else None
+        found = [False, False, False]
         try:
-            content = filepath.read_text(encoding='utf-8')
-        except (UnicodeDecodeError, PermissionError):
-            return FileAnalysis(
-                filepath=str(filepath),
-                current_extension=filepath.suffix,
-                suggested_extension=filepath.suffix,
-                reason="Cannot read file",
-                confidence=0.0,
-                contains_jsx=False,
-                contains_react_imports=False,
-                contains_components=False
-            )
-        
-        # Check for JSX content
-        contains_jsx = any(re.search(pattern, content, re.MULTILINE) for pattern in self.jsx_patterns)
-        
-        # Check for React imports
-        contains_react_imports = any(re.search(pattern, content, re.MULTILINE) for pattern in self.react_import_patterns)
-        
-        # Check for React components
-        contains_components = any(re.search(pattern, content, re.MULTILINE) for pattern in self.component_patterns)
+            for text in windows:
+                found = [old or new for old, new in zip(found, self.detect_timed(text, stripper))]
+                if all(found):
+                    break
+        except UnicodeDecodeError:
+            return self.skipped(filepath, BINARY)
         
+        analysis = self.classify(filepath, *found)
+        if reader.truncated and not all(found):
+            analysis.reason += f" (first {self.byte_budget // 1024} KiB scanned)"
+        return analysis
+
+    def classify(self, filepath: Path, contains_jsx: bool, contains_react_imports: bool,
+                 contains_components: bool) -> FileAnalysis:
+        """Turn the detected signals into an extension verdict"""
         # Determine suggested extension
         current_ext = filepath.suffix
         suggested_ext = current_ext
@@ -118,105 +725,283 @@ class ProjectAnalyzer:
             contains_components=contains_components
         )
 
-    def crawl_project(self) -> Dict[str, List[FileAnalysis]]:
+    def iter_project_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (category, path) for every analyzable file in one tree walk"""
+        if self.since or self.staged:
+            yield from self.iter_changed_files()
+            return
+        if self.snapshot is not None:
+            yield from self.iter_snapshot_files()
+            return
+        if self.enumeration == 'git':
+            yield from self.iter_git_files()
+            return
+        with os.scandir(self.project_root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in self.category_dirs:
+                        category = self.category_dirs[entry.name]
+                        for path in scan_source_tree(entry.path, self.target_extensions, self.prune_dirs):
+                            yield category, Path(path)
+                elif os.path.splitext(entry.name)[1] in self.target_extensions and entry.is_file():
+                    yield 'other', Path(entry.path)
+
+    def categorize(self, relpath: str) -> Optional[str]:
+        """Report category for a root-relative '/'-separated path, None if it is not analyzed"""
+        if os.path.splitext(relpath)[1] not in self.target_extensions:
+            return None
+        parts = relpath.split('/')
+        if len(parts) == 1:
+            return 'other'
+        category = self.category_dirs.get(parts[0])
+        if category is None or not self.prune_dirs.isdisjoint(parts[1:-1]):
+            return None
+        return category
+
+    def iter_git_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (category, path) for tracked and untracked-but-not-ignored files.
+
+        One `git ls-files` stream replaces the directory walk, so ignored
+        trees are never touched and the result respects .gitignore.
+        """
+        paths = iter_git_paths(['ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+                               self.project_root)
+        yield from self.bucket_paths(paths)
+
+    def iter_changed_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (category, path) for files added, modified or renamed since --since / in --staged.
+
+        Paths come from one `git diff --name-only` stream. Rename detection
+        reports a moved file under its new name; deletions are filtered out
+        by git since there is nothing left to analyze.
+        """
+        args = ['diff', '--name-only', '-z', '-M', '--diff-filter=d', '--relative']
+        if self.staged:
+            args.append('--cached')
+        if self.since:
+            args.append(self.since)
+        args.append('--')
+        yield from self.bucket_paths(iter_git_paths(args, self.project_root))
+
+    def iter_snapshot_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (category, path) from the tree snapshot instead of walking the tree.
+
+        The snapshot already holds every file's size and mtime, so the cache
+        lookups that follow need no stat call of their own. Cache rows of
+        files the snapshot saw removed are dropped.
+        """
+        snapshot = self.snapshot
+        if snapshot.tree is None:
+            snapshot.scan()
+        if self.cache is not None and snapshot.diff.removed:
+            self.cache.forget(str(self.project_root / relpath) for relpath in snapshot.diff.removed)
+        for relpath, stat in snapshot.files():
+            category = self.categorize(relpath)
+            if category is None:
+                continue
+            path = self.project_root / relpath
+            self.known_stats[str(path)] = stat
+            yield category, path
+
+    def snapshot_section(self) -> Optional[Dict]:
+        """Added/modified/removed counts and paths since the last saved snapshot"""
+        if self.snapshot is None or self.snapshot.diff is None:
+            return None
+        return dict(self.snapshot.diff.summary(), first_run=self.snapshot.previous is None,
+                    root_hash=self.snapshot.root_hash, stats=dict(self.snapshot.stats))
+
+    def bucket_paths(self, relpaths: Iterator[str]) -> Iterator[Tuple[str, Path]]:
+        """Apply the crawl_project category bucketing to root-relative paths from git"""
+        for relpath in relpaths:
+            category = self.categorize(relpath)
+            if category is None:
+                continue
+            path = self.project_root / relpath
+            # Index entries can outlive the file (deleted, not yet staged)
+            if path.is_file():
+                yield category, path
+
+    def open_cache(self) -> None:
+        """Open the on-disk analysis cache if caching is enabled"""
+        if not self.use_cache or self.cache is not None:
+            return
+        try:
+            self.cache = AnalysisCache(self.project_root / DEFAULT_CACHE_DIR, self.pattern_fingerprint())
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Analysis cache unavailable: {e}", file=sys.stderr)
+            self.cache = None
+
+    def close_cache(self) -> None:
+        """Flush the cache and keep its hit/miss counts for the report"""
+        if self.cache is not None:
+            self.cache_stats = self.cache.stats()
+            self.cache.close()
+            self.cache = None
+
+    def cache_lookup(self, filepath: Path) -> Tuple[Optional[FileAnalysis], Optional[os.stat_result], Optional[str]]:
+        """Return (cached analysis, stat, stored digest); the analysis is None on a miss"""
+        key = str(filepath)
+        stat = self.known_stats.pop(key, None)
+        if self.cache is None:
+            return None, None, None
+        start = time.perf_counter() if self.profile is not None else None
+        if stat is None:
+            try:
+                stat = filepath.stat()
+            except OSError:
+                return None, None, None
+        row, stored_digest = self.cache.lookup(key, stat.st_size, stat.st_mtime_ns)
+        if start is not None:
+            self.profile.add_phase('cache', time.perf_counter() - start)
+        if row is not None:
+            return analysis_from_row(key, row), stat, None
+        return None, stat, stored_digest
+
+    def cache_resolve(self, filepath: Path, stat, stored_digest: Optional[str],
+                      digest: Optional[str], row: Optional[tuple]) -> FileAnalysis:
+        """Turn a (digest, row) result into a FileAnalysis, updating the cache"""
+        key = str(filepath)
+        if self.cache is not None and stat is not None and digest is not None:
+            if row is None and digest == stored_digest:
+                row = self.cache.revalidate(key, stat.st_size, stat.st_mtime_ns)
+            else:
+                self.cache.store(key, stat.st_size, stat.st_mtime_ns, digest, row)
+        return analysis_from_row(key, row)
+
+    def analyze_cached(self, filepath: Path) -> FileAnalysis:
+        """Analyze one file, reusing the cached result when it is still valid"""
+        cached, stat, stored_digest = self.cache_lookup(filepath)
+        if cached is not None:
+            return cached
+        if stat is None:
+            return self.analyze_file_content(filepath)
+        digest, analysis = self.examine(filepath, stored_digest)
+        return self.resolve_examined(filepath, stat, stored_digest, digest, analysis)
+
+    def resolve_examined(self, filepath: Path, stat, stored_digest: Optional[str],
+                         digest: Optional[str], analysis: Optional[FileAnalysis]) -> FileAnalysis:
+        """Final result for an examine() outcome: cached, freshly stored, or uncached"""
+        if stat is None or digest is None:
+            return analysis
+        return self.cache_resolve(filepath, stat, stored_digest, digest,
+                                  None if analysis is None else analysis_to_row(analysis))
+
+    def analyze_parallel(self, items: List[Tuple[Path, Optional[str]]],
+                         executor: ProcessPoolExecutor) -> Iterator[Tuple[Optional[str], Optional[tuple]]]:
+        """Analyze (path, cached digest) pairs on a process pool, yielding (digest, row) in input order"""
+        if not items:
+            return
+        # A few chunks per worker keeps the pool busy without per-file IPC
+        chunk_size = max(1, min(256, -(-len(items) // (self.jobs * 4))))
+        chunks = [
+            [(str(path), digest) for path, digest in items[start:start + chunk_size]]
+            for start in range(0, len(items), chunk_size)
+        ]
+        for rows, profile in executor.map(_analyze_batch, chunks):
+            if profile is not None:
+                self.profile.merge(profile)
+            yield from rows
+
+    def analyze_window(self, window: List[Tuple[str, Path]],
+                       executor: ProcessPoolExecutor) -> Iterator[Tuple[str, FileAnalysis]]:
+        """Resolve one window of candidates from the cache and the pool, keeping walk order"""
+        results = [None] * len(window)
+        pending = []
+        for index, (category, file) in enumerate(window):
+            cached, stat, stored_digest = self.cache_lookup(file)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, stat, stored_digest))
+        
+        work = [(window[index][1], stored_digest) for index, _, stored_digest in pending]
+        for (index, stat, stored_digest), (digest, row) in zip(pending, self.analyze_parallel(work, executor)):
+            results[index] = self.cache_resolve(window[index][1], stat, stored_digest, digest, row)
+        
+        for (category, _), analysis in zip(window, results):
+            yield category, analysis
+
+    def iter_analyses(self, candidates: Optional[Iterator[Tuple[str, Path]]] = None) -> Iterator[Tuple[str, FileAnalysis]]:
+        """Yield (category, FileAnalysis) in walk order, serially or over --jobs workers.
+
+        In --jobs mode candidates are processed in fixed-size windows, so memory
+        stays bounded by the window rather than by the size of the tree.
+        """
+        if candidates is None:
+            candidates = self.iter_project_files()
+        if self.profile is not None:
+            candidates = self.profile.timed_iter(candidates, 'walk')
+        self.open_cache()
+        try:
+            if self.jobs <= 1 and self.io_concurrency > 1:
+                yield from iter_pipelined(self, candidates, self.io_concurrency)
+                return
+            if self.jobs <= 1:
+                for category, file in candidates:
+                    yield category, self.analyze_cached(file)
+                return
+            
+            window_size = self.jobs * 4 * 256
+            with ProcessPoolExecutor(max_workers=self.jobs,
+                                     initializer=_init_worker,
+                                     initargs=(str(self.project_root), self.profile is not None,
+                                               self.detector, self.byte_budget)) as executor:
+                window = []
+                for candidate in candidates:
+                    window.append(candidate)
+                    if len(window) == window_size:
+                        yield from self.analyze_window(window, executor)
+                        window = []
+                yield from self.analyze_window(window, executor)
+        finally:
+            self.close_cache()
+
+    def crawl_project(self) -> AnalysisStore:
         """Crawl the entire project and analyze files"""
-        results = {
-            'downloads': [],
-            'src': [],
-            'scripts': [],
-            'other': []
-        }
+        results = AnalysisStore()
         
-        # Define file extensions to analyze
-        target_extensions = {'.ts', '.tsx', '.js', '.jsx'}
-        
-        # Analyze downloads directory
-        if self.downloads_dir.exists():
-            for file in self.downloads_dir.rglob('*'):
-                if file.is_file() and file.suffix in target_extensions:
-                    analysis = self.analyze_file_content(file)
-                    results['downloads'].append(analysis)
-        
-        # Analyze src directory
-        if self.src_dir.exists():
-            for file in self.src_dir.rglob('*'):
-                if file.is_file() and file.suffix in target_extensions:
-                    analysis = self.analyze_file_content(file)
-                    results['src'].append(analysis)
-        
-        # Analyze scripts directory
-        scripts_dir = self.project_root / "scripts"
-        if scripts_dir.exists():
-            for file in scripts_dir.rglob('*'):
-                if file.is_file() and file.suffix in target_extensions:
-                    analysis = self.analyze_file_content(file)
-                    results['scripts'].append(analysis)
-        
-        # Analyze root level files
-        for file in self.project_root.glob('*'):
-            if file.is_file() and file.suffix in target_extensions:
-                analysis = self.analyze_file_content(file)
-                results['other'].append(analysis)
+        for category, analysis in self.iter_analyses():
+            results.add(category, analysis)
         
         return results
 
-    def suggest_file_destinations(self, downloads_analyses: List[FileAnalysis]) -> Dict[str, str]:
-        """Suggest where downloaded files should go"""
-        suggestions = {}
+    def match_destinations(self, downloads_analyses: List[FileAnalysis]) -> Dict[str, RuleMatch]:
+        """Classify downloaded files with the destination rules, keeping the rule that fired"""
+        matches = {}
         
         for analysis in downloads_analyses:
-            filepath = Path(analysis.filepath)
-            filename = filepath.name
-            
-            # Remove file extension for pattern matching
-            base_name = filepath.stem.lower()
-            
-            # Suggest destinations based on filename patterns
-            if 'app' in base_name and analysis.contains_jsx:
-                suggestions[filename] = 'src/App.tsx'
-            elif 'auth' in base_name and 'context' in base_name:
-                suggestions[filename] = 'src/components/AuthContext.tsx'
-            elif 'auth' in base_name and 'service' in base_name:
-                suggestions[filename] = 'src/services/auth.ts'
-            elif 'encryption' in base_name:
-                suggestions[filename] = 'src/services/encryption.ts'
-            elif 'storage' in base_name:
-                suggestions[filename] = 'src/services/storage.ts'
-            elif 'curriculum' in base_name:
-                suggestions[filename] = 'src/data/curriculum/' + filename.replace('.ts', '.ts')
-            elif 'template' in base_name:
-                suggestions[filename] = 'src/data/templates/' + filename.replace('.ts', '.ts')
-            elif filename.endswith('.json'):
-                suggestions[filename] = 'src/data/samples/' + filename
-            elif filename.endswith('.sql'):
-                suggestions[filename] = 'database/' + filename
-            elif filename.endswith('.sh'):
-                suggestions[filename] = 'scripts/' + filename
-            elif filename.endswith('.md'):
-                suggestions[filename] = 'docs/' + filename
-            else:
-                suggestions[filename] = 'src/utils/' + filename
+            filename = Path(analysis.filepath).name
+            match = self.destination_rules.match(filename, signals_from_analysis(analysis))
+            if match is not None:
+                matches[filename] = match
         
-        return suggestions
+        return matches
+
+    def suggest_file_destinations(self, downloads_analyses: List[FileAnalysis]) -> Dict[str, str]:
+        """Suggest where downloaded files should go"""
+        return {filename: match.destination
+                for filename, match in self.match_destinations(downloads_analyses).items()}
 
     def generate_report(self) -> Dict:
         """Generate comprehensive analysis report"""
         print("🔍 Analyzing project structure...")
         
-        analyses = self.crawl_project()
+        return self.build_report(self.crawl_project())
+
+    def build_report(self, analyses: AnalysisStore) -> Dict:
+        """Assemble the report dict from already-computed analyses"""
+        report_start = time.perf_counter()
         
         # Count issues by category
         extension_issues = []
-        destination_suggestions = {}
+        destination_matches = {}
         
         for category, file_analyses in analyses.items():
-            for analysis in file_analyses:
-                if analysis.suggested_extension != analysis.current_extension:
-                    extension_issues.append(analysis)
+            extension_issues.extend(file_analyses.extension_issues())
         
         # Get destination suggestions for downloads
         if analyses['downloads']:
-            destination_suggestions = self.suggest_file_destinations(analyses['downloads'])
+            destination_matches = self.match_destinations(analyses['downloads'])
         
         # Generate summary statistics
         total_files = sum(len(files) for files in analyses.values())
@@ -241,12 +1026,86 @@ class ProjectAnalyzer:
                 }
                 for issue in extension_issues
             ],
-            'destination_suggestions': destination_suggestions,
+            'destination_suggestions': {name: match.destination for name, match in destination_matches.items()},
+            'destination_rules': {name: match.rule for name, match in destination_matches.items()},
+            'cache': dict(self.cache_stats or {'hits': 0, 'misses': 0}, enabled=self.use_cache),
             'detailed_analysis': analyses
         }
         
+        if self.snapshot is not None:
+            report['snapshot'] = self.snapshot_section()
+        
+        if self.find_duplicates:
+            report['duplicates'] = self.duplicates_section()
+        
+        if self.profile is not None:
+            self.profile.add_phase('report', time.perf_counter() - report_start)
+            report['profile'] = self.profile.to_dict()
+        
         return report
 
+    def duplicates_section(self) -> Dict:
+        """Duplicate-file groups, reusing content hashes this run stored in the cache"""
+        # Imported here: duplicate_finder builds on this module's walker
+        from duplicate_finder import DuplicateFinder
+        
+        digests = load_digests(self.project_root / DEFAULT_CACHE_DIR) if self.use_cache else {}
+        finder = DuplicateFinder(str(self.project_root), self.prune_dirs, digests=digests)
+        if self.profile is None:
+            return finder.report()
+        with self.profile.phase('duplicates'):
+            return finder.report()
+
+    def stream_report(self, out: TextIO) -> Dict:
+        """Write one NDJSON record per file as it is classified, then a summary record.
+
+        Nothing but counters and the (small) downloads suggestions is kept in
+        memory, and every line is flushed so consumers can start reading
+        before the crawl finishes. Returns the summary record.
+        """
+        counts = {'downloads': 0, 'src': 0}
+        total_files = 0
+        files_with_issues = 0
+        destination_matches = {}
+        
+        for category, analysis in self.iter_analyses():
+            record = {'type': 'file', 'category': category}
+            record.update(asdict(analysis))
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+            
+            total_files += 1
+            if category in counts:
+                counts[category] += 1
+            if analysis.suggested_extension != analysis.current_extension:
+                files_with_issues += 1
+            if category == 'downloads':
+                destination_matches.update(self.match_destinations([analysis]))
+        
+        summary = {
+            'type': 'summary',
+            'timestamp': datetime.now().isoformat(),
+            'project_root': str(self.project_root),
+            'summary': {
+                'total_files_analyzed': total_files,
+                'files_with_extension_issues': files_with_issues,
+                'downloads_files': counts['downloads'],
+                'src_files': counts['src']
+            },
+            'destination_suggestions': {name: match.destination for name, match in destination_matches.items()},
+            'destination_rules': {name: match.rule for name, match in destination_matches.items()},
+            'cache': dict(self.cache_stats or {'hits': 0, 'misses': 0}, enabled=self.use_cache)
+        }
+        if self.snapshot is not None:
+            summary['snapshot'] = self.snapshot_section()
+        if self.find_duplicates:
+            summary['duplicates'] = self.duplicates_section()
+        if self.profile is not None:
+            summary['profile'] = self.profile.to_dict()
+        out.write(json.dumps(summary) + '\n')
+        out.flush()
+        return summary
+
     def print_report(self, report: Dict):
         """Print formatted report to console"""
         print("\n" + "="*60)
@@ -260,6 +1119,13 @@ class ProjectAnalyzer:
         print(f"  • Files with extension issues: {summary['files_with_extension_issues']}")
         print(f"  • Files in downloads: {summary['downloads_files']}")
         print(f"  • Files in src: {summary['src_files']}")
+        cache = report.get('cache')
+        if cache and cache.get('enabled'):
+            print(f"  • Cache: {cache['hits']} hits, {cache['misses']} misses")
+        snapshot = report.get('snapshot')
+        if snapshot and not snapshot['first_run']:
+            print(f"  • Since last run: {snapshot['added']} added, {snapshot['modified']} modified, "
+                  f"{snapshot['removed']} removed")
         
         # Extension issues
         if report['extension_issues']:
@@ -272,8 +1138,17 @@ class ProjectAnalyzer:
         # Destination suggestions
         if report['destination_suggestions']:
             print(f"\n📁 DESTINATION SUGGESTIONS:")
+            rules = report.get('destination_rules', {})
             for filename, destination in report['destination_suggestions'].items():
-                print(f"  • {filename} → {destination}")
+                rule = f"  [{rules[filename]}]" if filename in rules else ""
+                print(f"  • {filename} → {destination}{rule}")
+        
+        if report.get('duplicates'):
+            from duplicate_finder import print_duplicates
+            print_duplicates(report['duplicates'])
+        
+        if report.get('profile'):
+            AnalyzerProfile.print_table(report['profile'])
         
         print(f"\n✅ Report generated at: {report['timestamp']}")
         print("="*60)
@@ -286,10 +1161,88 @@ def main():
     parser.add_argument('--project-root', default='.', help='Project root directory')
     parser.add_argument('--output', help='Output JSON file path')
     parser.add_argument('--quiet', action='store_true', help='Suppress console output')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for file analysis (0 = one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-analyze every file instead of using .cache/project_analyzer')
+    
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase and per-pattern timings in the report')
+    parser.add_argument('--detector', choices=DETECTORS, default='lexer',
+                        help='JSX/React detection: literal-aware lexer or the legacy regex heuristics')
+    parser.add_argument('--enumerate', choices=ENUMERATORS, default='walk',
+                        help='Find candidates by walking directories or from git ls-files (respects .gitignore)')
+    parser.add_argument('--since', metavar='REF',
+                        help='Only analyze files changed between REF and the working tree')
+    parser.add_argument('--staged', action='store_true',
+                        help='Only analyze files staged in the index (with --since, staged relative to REF)')
+    parser.add_argument('--duplicates', action='store_true',
+                        help='Add a section listing byte-identical files and reclaimable space')
+    parser.add_argument('--format', choices=['json', 'ndjson'], default='json',
+                        help='Report format; ndjson streams one line per file to --output (- for stdout)')
+    parser.add_argument('--io-concurrency', type=int, default=1, metavar='N',
+                        help='With --jobs 1, overlap up to N file reads (helps on NFS and other high-latency mounts)')
+    parser.add_argument('--byte-budget', type=int, default=DEFAULT_BYTE_BUDGET, metavar='BYTES',
+                        help='Stop scanning a file after this many bytes (0 = no limit; hashing still reads it all)')
+    parser.add_argument('--snapshot', action='store_true',
+                        help='Enumerate files from a persisted Merkle snapshot and report what changed since the last run')
+    parser.add_argument('--trust-dir-mtime', action='store_true',
+                        help='With --snapshot, skip listing directories whose mtime is unchanged (misses in-place edits)')
+    parser.add_argument('--all-packages', action='store_true',
+                        help='Analyze every package.json root under --project-root in one run, merged by package')
+    parser.add_argument('--rules', metavar='PATH',
+                        help='Destination rule config (default: scripts/destination_rules.json)')
     
     args = parser.parse_args()
+    if args.since and args.since.startswith('-'):
+        parser.error('--since expects a git revision, not an option')
+    
+    options = dict(jobs=args.jobs, use_cache=not args.no_cache, profile=args.profile,
+                   detector=args.detector, enumeration=args.enumerate, since=args.since,
+                   staged=args.staged, rules_path=args.rules, byte_budget=args.byte_budget,
+                   io_concurrency=args.io_concurrency)
+    snapshot = None
+    if args.snapshot:
+        if args.all_packages or args.since or args.staged:
+            parser.error('--snapshot cannot be combined with --all-packages, --since or --staged')
+        # Imported here: tree_snapshot builds on this module
+        from tree_snapshot import TreeSnapshot
+        snapshot = TreeSnapshot(args.project_root, 'analyzer', trust_dir_mtime=args.trust_dir_mtime)
+    if args.all_packages:
+        if args.format == 'ndjson':
+            parser.error('--all-packages produces a merged JSON report; --format ndjson is not supported')
+        # Imported here: workspace_analyzer builds on this module
+        from workspace_analyzer import WorkspaceAnalyzer
+        analyzer = WorkspaceAnalyzer(args.project_root, find_duplicates=args.duplicates, **options)
+    else:
+        analyzer = ProjectAnalyzer(args.project_root, find_duplicates=args.duplicates,
+                                   snapshot=snapshot, **options)
+    
+    try:
+        write_report(parser, args, analyzer)
+    except RuntimeError as e:
+        # git enumeration failed (not a repository, unknown ref, git missing)
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    if snapshot is not None:
+        snapshot.save()
+
+def write_report(parser, args, analyzer: ProjectAnalyzer) -> None:
+    """Produce the report in the format requested on the command line"""
+    if args.format == 'ndjson':
+        if not args.output:
+            parser.error('--format ndjson requires --output (use - for stdout)')
+        if args.output == '-':
+            analyzer.stream_report(sys.stdout)
+            return
+        with open(args.output, 'w') as f:
+            summary = analyzer.stream_report(f)
+        if not args.quiet:
+            print(f"📊 {summary['summary']['total_files_analyzed']} files analyzed, "
+                  f"{summary['summary']['files_with_extension_issues']} with extension issues")
+            print(f"💾 NDJSON report saved to: {args.output}")
+        return
     
-    analyzer = ProjectAnalyzer(args.project_root)
     report = analyzer.generate_report()
     
     if not args.quiet:
@@ -297,7 +1250,7 @@ def main():
     
     if args.output:
         with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+            json.dump(report, f, indent=2, default=json_default)
         print(f"\n💾 Report saved to: {args.output}")
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Read Pipeline - Overlapped File Reads for the Project Analyzer
+Path: scripts/read_pipeline.py
+Purpose: Hide per-file open/stat latency (NFS checkouts) behind bounded concurrent reads feeding one CPU stage
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+def read_if_small(path: Path, limit: int) -> Optional[bytes]:
+    """Whole contents of a file no larger than limit, else None (it will be streamed)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > limit:
+            return None
+        return f.read()
+
+class ReadPipeline:
+    """Two-stage asyncio pipeline: concurrent I/O on a thread pool, then a single CPU stage.
+
+    Up to `concurrency` files are being stat'ed and read at any time. Loaded
+    files wait in an asyncio.Queue of `queue_size` entries; when the CPU
+    stage (hashing, lexing, cache writes) falls behind, the queue fills,
+    loaders block on put() while holding their slots, and no new reads are
+    started. Results are handed out in candidate order, and the loaders
+    may only run a bounded distance ahead of the next result owed, so
+    memory stays bounded by the in-flight window.
+
+    Everything that touches the SQLite cache runs on the event loop thread;
+    only stat, open and read (plus the streaming path for files larger than
+    one window) run on the pool.
+    """
+
+    def __init__(self, analyzer, candidates: Iterator[Tuple[str, Path]], concurrency: int,
+                 queue_size: Optional[int] = None):
+        self.analyzer = analyzer
+        self.candidates = candidates
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size or 2 * self.concurrency
+        self.lookahead = 4 * (self.concurrency + self.queue_size)
+        self.limit = analyzer.whole_read_limit()
+        self.pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='analyzer-io')
+        self.results = {}
+        self.next_index = 0
+        self.finished = False
+        self.error: Optional[BaseException] = None
+        self.tasks = []
+
+    async def start(self) -> None:
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.slots = asyncio.Semaphore(self.concurrency)
+        self.ready = asyncio.Event()
+        self.advanced = asyncio.Event()
+        self.loaders = set()
+        self.tasks = [asyncio.create_task(self.produce()), asyncio.create_task(self.consume())]
+
+    async def io(self, func, *args):
+        """Run a blocking call on the I/O pool, counted as the 'read' phase when profiling"""
+        loop = asyncio.get_running_loop()
+        if self.analyzer.profile is None:
+            return await loop.run_in_executor(self.pool, func, *args)
+        start = loop.time()
+        try:
+            return await loop.run_in_executor(self.pool, func, *args)
+        finally:
+            self.analyzer.profile.add_phase('read', loop.time() - start)
+
+    async def produce(self) -> None:
+        """Start one loader per candidate, within the concurrency and lookahead limits"""
+        try:
+            for index, (category, path) in enumerate(self.candidates):
+                while index - self.next_index >= self.lookahead:
+                    self.advanced.clear()
+                    await self.advanced.wait()
+                await self.slots.acquire()
+                task = asyncio.create_task(self.load(index, category, path))
+                self.loaders.add(task)
+                task.add_done_callback(self.loaders.discard)
+            if self.loaders:
+                await asyncio.gather(*self.loaders)
+        except Exception as e:
+            self.error = e
+        finally:
+            await self.queue.put(None)
+
+    async def load(self, index: int, category: str, path: Path) -> None:
+        """I/O stage: stat, cache lookup and read of one file"""
+        analyzer = self.analyzer
+        try:
+            key = str(path)
+            if analyzer.cache is not None and key not in analyzer.known_stats:
+                try:
+                    analyzer.known_stats[key] = await self.io(os.stat, path)
+                except OSError:
+                    pass
+            cached, stat, stored_digest = analyzer.cache_lookup(path)
+            if cached is not None:
+                payload = ('done', cached)
+            else:
+                try:
+                    data = await self.io(read_if_small, path, self.limit)
+                except PermissionError:
+                    payload = ('done', analyzer.unreadable(path))
+                else:
+                    if data is None:
+                        # Larger than one window: stream it on the pool with bounded memory
+                        known = stored_digest if stat is not None else None
+                        payload = ('examined', stat, stored_digest, await self.io(analyzer.examine, path, known))
+                    else:
+                        payload = ('bytes', stat, stored_digest, data)
+        except Exception as e:
+            payload = ('error', e)
+        try:
+            await self.queue.put((index, category, path, payload))
+        finally:
+            self.slots.release()
+
+    async def consume(self) -> None:
+        """CPU stage: hash, classify and record results in arrival order"""
+        analyzer = self.analyzer
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                break
+            index, category, path, payload = item
+            kind = payload[0]
+            try:
+                if kind == 'done':
+                    result = payload[1]
+                elif kind == 'error':
+                    result = payload[1]
+                else:
+                    _, stat, stored_digest, value = payload
+                    if kind == 'examined':
+                        digest, analysis = value
+                    elif stat is None:
+                        # No cache entry to write: skip hashing
+                        digest, analysis = None, analyzer.analyze_content(path, value)
+                    else:
+                        digest = analyzer.digest(value)
+                        analysis = None if digest == stored_digest else analyzer.analyze_content(path, value)
+                    result = analyzer.resolve_examined(path, stat, stored_digest, digest, analysis)
+            except Exception as e:
+                result = e
+            self.results[index] = (category, result)
+            self.ready.set()
+        self.finished = True
+        self.ready.set()
+
+    async def next(self) -> Optional[Tuple[str, object]]:
+        """The next (category, FileAnalysis) in candidate order, or None when done"""
+        while self.next_index not in self.results:
+            if self.finished:
+                if self.error is not None:
+                    raise self.error
+                return None
+            self.ready.clear()
+            await self.ready.wait()
+        category, result = self.results.pop(self.next_index)
+        self.next_index += 1
+        self.advanced.set()
+        if isinstance(result, BaseException):
+            raise result
+        return category, result
+
+    async def close(self) -> None:
+        for task in [*self.tasks, *self.loaders]:
+            task.cancel()
+        await asyncio.gather(*self.tasks, *self.loaders, return_exceptions=True)
+        self.pool.shutdown(wait=True)
+
+def iter_pipelined(analyzer, candidates: Iterator[Tuple[str, Path]], concurrency: int,
+                   queue_size: Optional[int] = None) -> Iterator[Tuple[str, object]]:
+    """Yield (category, FileAnalysis) like ProjectAnalyzer.iter_analyses, reading through a ReadPipeline.
+
+    The event loop only runs while the caller asks for the next result, so
+    consumers of this generator pace the pipeline like any other iterator.
+    """
+    pipeline = ReadPipeline(analyzer, candidates, concurrency, queue_size)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(pipeline.start())
+        while True:
+            item = loop.run_until_complete(pipeline.next())
+            if item is None:
+                return
+            yield item
+    finally:
+        loop.run_until_complete(pipeline.close())
+        loop.close()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Rename Propagator - Import Rewrites for Moved Files
+Path: scripts/rename_propagator.py
+Purpose: Rewrite exactly the import specifiers affected by file moves, one write per file
+"""
+
+import sys
+import posixpath
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from import_graph import RESOLVE_EXTENSIONS, ImportEdge, ImportGraph, iter_specifiers, load_graph
+
+def strip_resolved_extension(relpath: str) -> str:
+    """Drop the extension module resolution would have added"""
+    for extension in RESOLVE_EXTENSIONS:
+        if relpath.endswith(extension):
+            return relpath[:-len(extension)]
+    return relpath
+
+class RenamePropagator:
+    """Collect file moves, then fix every affected import in one batched pass.
+
+    Importers of a moved file are found through the import graph's reverse
+    index, so no file that does not import a moved path is read. A moved
+    file's own relative imports are rewritten too, but only those that
+    resolved from its old location. Each affected file is read and written
+    once, however many of its imports changed.
+
+    Create the propagator before moving anything: it loads the graph of the
+    tree as it was before the moves.
+    """
+
+    def __init__(self, project_root: str = ".", dry_run: bool = False,
+                 graph: Optional[ImportGraph] = None):
+        self.project_root = Path(project_root).resolve()
+        self.dry_run = dry_run
+        self.graph = graph if graph is not None else load_graph(str(self.project_root))
+        self.moves: Dict[str, str] = {}
+        # Called with a root-relative path just before that file is rewritten
+        self.before_write: Optional[Callable[[str], None]] = None
+
+    def relative(self, path) -> Optional[str]:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.project_root / path
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def record_move(self, old_path, new_path) -> None:
+        """Note that old_path now lives (or, in a dry run, would live) at new_path"""
+        old, new = self.relative(old_path), self.relative(new_path)
+        if old is None or new is None or old == new:
+            return
+        for source, destination in self.moves.items():
+            if destination == old:
+                # A file moved twice: keep one hop from its original location
+                self.moves[source] = new
+                return
+        self.moves[old] = new
+
+    def new_location(self, relpath: str) -> str:
+        return self.moves.get(relpath, relpath)
+
+    def format_specifier(self, importer: str, target: str, old_specifier: str, old_target: str) -> str:
+        """Specifier from importer to target, written in the style of old_specifier"""
+        if posixpath.splitext(old_specifier)[1] and old_target.endswith(posixpath.splitext(old_specifier)[1]):
+            module = target  # the extension was written out
+        else:
+            module = strip_resolved_extension(target)
+            old_module = strip_resolved_extension(old_target)
+            if posixpath.basename(old_module) == 'index' and not old_specifier.rstrip('/').endswith('index'):
+                module = posixpath.dirname(module)  # directory import of index.*
+
+        if not old_specifier.startswith('.'):
+            for prefix, targets in self.graph.aliases:
+                for alias_target in targets:
+                    if alias_target.endswith('/') and module.startswith(alias_target):
+                        return prefix + module[len(alias_target):]
+
+        specifier = posixpath.relpath(module, posixpath.dirname(importer) or '.')
+        return specifier if specifier.startswith('.') else './' + specifier
+
+    def plan(self) -> Dict[str, Dict[str, str]]:
+        """Map each file to rewrite (at its new location) to {old specifier: new specifier}"""
+        graph = self.graph
+        affected = set(self.moves)
+        for old in self.moves:
+            affected.update(graph.importers(old))
+
+        rewrites = {}
+        for importer in sorted(affected):
+            new_importer = self.new_location(importer)
+            replacements = {}
+            for edge in self.edges(importer):
+                if edge.target is None or (importer not in self.moves and edge.target not in self.moves):
+                    continue
+                new_target = self.new_location(edge.target)
+                specifier = self.format_specifier(new_importer, new_target, edge.specifier, edge.target)
+                if specifier != edge.specifier:
+                    replacements[edge.specifier] = specifier
+            if replacements:
+                rewrites[new_importer] = replacements
+        return rewrites
+
+    def edges(self, importer: str) -> List[ImportEdge]:
+        """Pre-move import edges of a file, parsing moved files the graph does not index"""
+        if importer in self.graph.forward:
+            return self.graph.imports(importer)
+        text = self.read(self.new_location(importer))
+        return self.graph.resolve_text(importer, text) if text is not None else []
+
+    def read(self, relpath: str) -> Optional[str]:
+        """Text of a file by its post-move path (its pre-move path in a dry run)"""
+        path = self.project_root / relpath
+        if self.dry_run and not path.exists():
+            # Nothing has moved in a dry run; read the file where it still is
+            originals = [old for old, new in self.moves.items() if new == relpath]
+            path = self.project_root / (originals[0] if originals else relpath)
+        try:
+            return path.read_bytes().decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠️  Cannot update imports in {relpath}: {e}")
+            return None
+
+    def rewrite(self, relpath: str, replacements: Dict[str, str]) -> int:
+        """Apply replacements to one file's specifiers in a single write; return the count"""
+        text = self.read(relpath)
+        if text is None:
+            return 0
+
+        pieces = []
+        position = 0
+        count = 0
+        for match in iter_specifiers(text):
+            replacement = replacements.get(match.group('specifier'))
+            if replacement is None:
+                continue
+            start, end = match.span('specifier')
+            pieces.append(text[position:start])
+            pieces.append(replacement)
+            position = end
+            count += 1
+        if count and not self.dry_run:
+            pieces.append(text[position:])
+            if self.before_write is not None:
+                self.before_write(relpath)
+            (self.project_root / relpath).write_bytes(''.join(pieces).encode('utf-8'))
+        return count
+
+    def flush(self) -> Dict[str, int]:
+        """Rewrite every affected file once and bring the import graph up to date.
+
+        Returns {root-relative path: specifiers rewritten}.
+        """
+        if not self.moves:
+            return {}
+        rewritten = {}
+        for relpath, replacements in self.plan().items():
+            count = self.rewrite(relpath, replacements)
+            if count:
+                rewritten[relpath] = count
+                verb = "Would update" if self.dry_run else "Updated"
+                print(f"🔗 {verb} {count} import(s) in {relpath}")
+
+        if not self.dry_run:
+            self.graph.update(list(self.moves) + list(self.moves.values()) + list(rewritten))
+            self.graph.save()
+        self.moves = {}
+        return rewritten
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Move a file and update every import of it')
+    parser.add_argument('source', help='File to move')
+    parser.add_argument('destination', help='New path for the file')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--dry-run', action='store_true', help='Show the import rewrites without moving anything')
+
+    args = parser.parse_args()
+
+    root = Path(args.project_root).resolve()
+    source = (root / args.source).resolve()
+    destination = (root / args.destination).resolve()
+    if not source.is_file():
+        print(f"❌ File not found: {args.source}")
+        sys.exit(1)
+    if destination.exists():
+        print(f"❌ Destination already exists: {args.destination}")
+        sys.exit(1)
+
+    propagator = RenamePropagator(str(root), dry_run=args.dry_run)
+    propagator.record_move(source, destination)
+    if not args.dry_run:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        source.rename(destination)
+    print(f"{'🔍 Would move' if args.dry_run else '✅ Moved'}: {args.source} → {args.destination}")
+    rewritten = propagator.flush()
+    print(f"📊 {sum(rewritten.values())} imports in {len(rewritten)} files")
+
+if __name__ == "__main__":
+    main()
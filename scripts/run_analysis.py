@@ -13,8 +13,8 @@ from pathlib import Path
 scripts_dir = Path(__file__).parent
 sys.path.insert(0, str(scripts_dir))
 
-from project_analyzer import ProjectAnalyzer
 from smart_file_organizer import SmartFileOrganizer
+from analysis_session import AnalysisSession
 
 def main():
     print("🎯 LESSON PLAN APP - SMART FILE ANALYZER")
@@ -29,9 +29,10 @@ def main():
     
     # Step 1: Analyze the project
     print("\n1️⃣ ANALYZING PROJECT...")
-    analyzer = ProjectAnalyzer()
-    report = analyzer.generate_report()
-    analyzer.print_report(report)
+    # One analysis for the whole invocation: the organizer reuses this report
+    session = AnalysisSession()
+    report = session.report()
+    session.analyzer.print_report(report)
     
     # Step 2: Ask user what to do
     print("\n2️⃣ WHAT WOULD YOU LIKE TO DO?")
@@ -62,7 +63,7 @@ def main():
         elif choice == "2":
             # Dry run
             print("\n🔍 DRY RUN - Showing what would be changed:")
-            organizer = SmartFileOrganizer()
+            organizer = SmartFileOrganizer(session=session)
             organizer.organize_project(dry_run=True)
             break
             
@@ -71,7 +72,7 @@ def main():
             print("\n🔧 FIXING ISSUES AUTOMATICALLY...")
             confirm = input("Are you sure? This will move files and commit to git (y/N): ").strip().lower()
             if confirm == 'y':
-                organizer = SmartFileOrganizer()
+                organizer = SmartFileOrganizer(session=session)
                 organizer.organize_project(dry_run=False)
             else:
                 print("Operation cancelled")
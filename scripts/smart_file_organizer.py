@@ -6,132 +6,149 @@ Purpose: Automatically organize files based on project_analyzer.py results
 """
 
 import os
-import shutil
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
 import subprocess
 from datetime import datetime
-from project_analyzer import ProjectAnalyzer
+from analysis_session import AnalysisSession, open_session
+from rename_propagator import RenamePropagator
+from tree_snapshot import TreeSnapshot
+from move_plan import MoveJournal, MovePlan, apply_plan, rollback
+from git_staging import commit_paths, relative_paths
+import type_check
 
 class SmartFileOrganizer:
     """Intelligent file organizer that uses analysis results"""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", use_cache: bool = True, use_daemon: bool = True,
+                 use_snapshot: bool = False, trust_dir_mtime: bool = False,
+                 session: Optional[AnalysisSession] = None, scoped_typecheck: bool = False):
         self.project_root = Path(project_root).resolve()
-        self.analyzer = ProjectAnalyzer(project_root)
+        # The organizer's own snapshot: what changed since the last organize run
+        self.snapshot = TreeSnapshot(project_root, 'organizer', trust_dir_mtime=trust_dir_mtime) if use_snapshot else None
+        # Shared with the caller (run_analysis) so the project is analyzed once per invocation
+        self.session = session if session is not None else AnalysisSession(
+            project_root, use_daemon=use_daemon, use_cache=use_cache, snapshot=self.snapshot)
         self.dry_run = False
+        # Type-check only the tsconfig projects (root, my-app, ...) whose files this run touched
+        self.scoped_typecheck = scoped_typecheck
         self.changes_made = []
+        self.propagator = None
+        self.plan = MovePlan(project_root)
+        self.journal: Optional[MoveJournal] = None
+        self.edited: List[str] = []
         
     def create_directories(self, directories: List[str]) -> None:
-        """Create necessary directories"""
+        """Plan the necessary directories"""
         for dir_path in directories:
-            full_path = self.project_root / dir_path
-            if not full_path.exists():
-                if not self.dry_run:
-                    full_path.mkdir(parents=True, exist_ok=True)
-                print(f"📁 Created directory: {dir_path}")
-                self.changes_made.append(f"Created directory: {dir_path}")
+            self.plan.mkdir(dir_path)
     
     def move_and_rename_file(self, source: Path, destination: str) -> bool:
-        """Move and rename a file, handling extension changes"""
-        dest_path = self.project_root / destination
-        
-        # Create destination directory if it doesn't exist
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        try:
-            if not self.dry_run:
-                if dest_path.exists():
-                    backup_path = dest_path.with_suffix(dest_path.suffix + '.backup')
-                    shutil.move(str(dest_path), str(backup_path))
-                    print(f"⚠️  Backed up existing file: {destination} → {destination}.backup")
-                
-                shutil.move(str(source), str(dest_path))
-            
-            print(f"✅ Moved: {source.name} → {destination}")
-            self.changes_made.append(f"Moved: {source.name} → {destination}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error moving {source.name}: {e}")
-            return False
+        """Plan a move and rename; an existing destination is moved aside to .backup first"""
+        return self.plan.move(source, self.project_root / destination)
     
     def fix_extension(self, filepath: Path, new_extension: str) -> bool:
-        """Rename file with correct extension"""
-        new_path = filepath.with_suffix(new_extension)
-        
-        try:
-            if not self.dry_run:
-                filepath.rename(new_path)
-            
-            print(f"🔧 Fixed extension: {filepath.name} → {new_path.name}")
-            self.changes_made.append(f"Fixed extension: {filepath.name} → {new_path.name}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error fixing extension for {filepath.name}: {e}")
-            return False
+        """Plan a rename to the correct extension"""
+        return self.plan.move(filepath, filepath.with_suffix(new_extension), reason='extension')
+    
+    def record_moves(self) -> None:
+        """Queue the plan's moves so imports of the files are rewritten in update_imports()"""
+        if self.propagator is None:
+            return
+        for step in self.plan.relocations():
+            self.propagator.record_move(self.project_root / step.source, self.project_root / step.target)
+    
+    def update_imports(self) -> None:
+        """Rewrite the imports affected by this run's moves, one write per file"""
+        if self.propagator is None:
+            return
+        rewritten = self.propagator.flush()
+        for relpath, count in rewritten.items():
+            self.edited.append(relpath)
+            self.changes_made.append(f"Updated {count} import(s) in {relpath}")
     
     def organize_downloads(self, destination_suggestions: Dict[str, str]) -> None:
-        """Organize files from downloads directory"""
+        """Plan the moves out of the downloads directory"""
         downloads_dir = self.project_root / "downloads"
         
         if not downloads_dir.exists():
             print("📂 No downloads directory found")
             return
         
-        print(f"\n🔄 Organizing downloads directory...")
-        
         for filename, destination in destination_suggestions.items():
             source_path = downloads_dir / filename
             
-            if source_path.exists():
+            if self.plan.exists(self.plan.relative(source_path)):
                 success = self.move_and_rename_file(source_path, destination)
                 
                 # Make shell scripts executable
-                if destination.endswith('.sh') and success and not self.dry_run:
-                    dest_path = self.project_root / destination
-                    dest_path.chmod(0o755)
-                    print(f"🔧 Made executable: {destination}")
+                if destination.endswith('.sh') and success:
+                    previous_mode = source_path.stat().st_mode & 0o7777
+                    self.plan.chmod(self.project_root / destination, 0o755, previous_mode)
             else:
                 print(f"⚠️  File not found: {filename}")
     
     def fix_extensions(self, extension_issues: List[Dict]) -> None:
-        """Fix file extensions based on analysis"""
-        print(f"\n🔧 Fixing file extensions...")
-        
+        """Plan extension fixes based on analysis"""
         for issue in extension_issues:
             if issue['confidence'] > 0.6:  # Only fix high-confidence issues
                 filepath = Path(issue['file'])
-                if filepath.exists():
+                if self.plan.exists(self.plan.relative(filepath)):
                     self.fix_extension(filepath, issue['suggested'])
     
+    def print_plan(self) -> None:
+        """Show the whole plan once, before anything is applied"""
+        if not self.plan.steps:
+            print("\n✨ Nothing to move")
+            return
+        print(f"\n📋 Plan: {len(self.plan.steps)} steps")
+        for step in self.plan.steps:
+            print(f"  {step.describe()}")
+    
+    def apply_plan(self) -> bool:
+        """Apply the plan as one journaled batch; False (with nothing changed) if it failed"""
+        self.journal = MoveJournal.create(self.project_root)
+        try:
+            counts = apply_plan(self.plan, self.journal)
+        except (OSError, RuntimeError) as e:
+            print(f"❌ Organization aborted, tree left as it was: {e}")
+            return False
+        fallback = f", {counts['copied']} copied across filesystems" if counts['copied'] else ""
+        print(f"\n✅ Applied {len(self.plan.steps)} steps: {counts['renamed']} renamed{fallback}, "
+              f"{counts['mkdir']} directories, {counts['chmod']} chmods (journal {self.journal.journal_id})")
+        return True
+    
+    def plan_changes(self) -> None:
+        """Describe the plan's steps in the run summary"""
+        for step in self.plan.steps:
+            if step.op == 'mkdir':
+                self.changes_made.append(f"Created directory: {step.target}")
+            elif step.op == 'chmod':
+                self.changes_made.append(f"Made executable: {step.target}")
+            elif step.reason == 'backup':
+                self.changes_made.append(f"Backed up: {step.source} → {step.target}")
+            elif step.reason == 'extension':
+                self.changes_made.append(f"Fixed extension: {Path(step.source).name} → {Path(step.target).name}")
+            else:
+                self.changes_made.append(f"Moved: {Path(step.source).name} → {step.target}")
+    
     def run_git_operations(self) -> None:
         """Run git operations to commit changes"""
         if self.dry_run:
-            print("\n🔄 Would run git operations (dry run)")
+            paths = relative_paths(self.project_root, self.touched_paths())
+            print(f"\n🔄 Would stage and commit {len(paths)} paths (dry run)")
             return
         
         try:
-            # Check if we're in a git repository
-            subprocess.run(['git', 'status'], 
-                         cwd=self.project_root, 
-                         capture_output=True, 
-                         check=True)
-            
-            # Stage all changes
-            subprocess.run(['git', 'add', '.'], 
-                         cwd=self.project_root, 
-                         check=True)
-            
-            # Commit changes
+            # Stage and commit exactly the paths this run moved or rewrote
             commit_message = f"Auto-organize files - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            subprocess.run(['git', 'commit', '-m', commit_message], 
-                         cwd=self.project_root, 
-                         check=True)
+            committed = commit_paths(self.project_root, self.touched_paths(), commit_message)
+            if not committed:
+                print("📭 Nothing to commit")
+                return
             
-            print(f"✅ Git commit successful: {commit_message}")
+            print(f"✅ Git commit successful: {commit_message} ({len(committed)} paths)")
             self.changes_made.append(f"Git commit: {commit_message}")
             
             # Push to origin (optional)
@@ -145,42 +162,57 @@ class SmartFileOrganizer:
                 print("⚠️  Push failed - check remote configuration")
                 
         except subprocess.CalledProcessError as e:
-            print(f"❌ Git operation failed: {e}")
+            print(f"❌ Git operation failed: {e.stderr.decode(errors='replace').strip() if e.stderr else e}")
         except FileNotFoundError:
             print("⚠️  Git not found - skipping git operations")
     
+    def touched_paths(self) -> List[str]:
+        """Root-relative paths this run moved (both ends) or rewrote"""
+        touched = list(self.edited)
+        for step in self.plan.moves(include_backups=True):
+            touched.extend((step.source, step.target))
+        return touched
+    
     def validate_typescript(self) -> bool:
-        """Validate TypeScript compilation"""
+        """Validate TypeScript compilation incrementally, only when this run touched type-relevant files"""
         try:
-            result = subprocess.run(['npx', 'tsc', '--noEmit'], 
-                                  cwd=self.project_root,
-                                  capture_output=True,
-                                  text=True)
-            
-            if result.returncode == 0:
-                print("✅ TypeScript validation passed")
-                return True
-            else:
-                print(f"❌ TypeScript validation failed:")
-                print(result.stdout)
-                print(result.stderr)
-                return False
-                
+            results = type_check.validate(self.project_root, self.touched_paths(), scoped=self.scoped_typecheck)
         except FileNotFoundError:
             print("⚠️  TypeScript not found - skipping validation")
             return False
+        
+        if results is None:
+            print("✨ No type-relevant files changed - skipping TypeScript validation")
+            return True
+        print(f"🔎 TypeScript validation ({len(results)} projects):")
+        if type_check.print_results(results):
+            print("✅ TypeScript validation passed")
+            return True
+        print(f"❌ TypeScript validation failed")
+        return False
     
-    def organize_project(self, dry_run: bool = False) -> Dict:
-        """Main organization function"""
+    def organize_project(self, dry_run: bool = False, plan_out: Optional[str] = None) -> Dict:
+        """Main organization function; plan_out (dry runs only) saves the plan for a later apply_saved_plan()"""
         self.dry_run = dry_run
         self.changes_made = []
+        self.journal = None
+        self.edited = []
         
         print("🚀 Starting smart file organization...")
         if dry_run:
             print("🔍 DRY RUN MODE - No changes will be made")
         
-        # Get analysis report
-        report = self.analyzer.generate_report()
+        if self.snapshot is not None:
+            diff = self.snapshot.scan()
+            if self.snapshot.previous is not None and diff.empty:
+                print("✨ Nothing changed since the last organize run")
+                return {'timestamp': datetime.now().isoformat(), 'dry_run': dry_run,
+                        'changes_made': [], 'total_changes': 0}
+            print(f"📸 Since last run: {len(diff.added)} added, {len(diff.modified)} modified, "
+                  f"{len(diff.removed)} removed")
+        
+        # Get analysis report: the session's, computed at most once per invocation
+        report = self.session.report()
         
         # Create necessary directories
         required_dirs = [
@@ -200,30 +232,89 @@ class SmartFileOrganizer:
             'tests'
         ]
         
+        # Phase one: the whole plan, computed without touching the tree
+        self.plan = MovePlan(str(self.project_root))
         self.create_directories(required_dirs)
-        
-        # Organize downloads
         if report['destination_suggestions']:
             self.organize_downloads(report['destination_suggestions'])
-        
-        # Fix extensions
         if report['extension_issues']:
             self.fix_extensions(report['extension_issues'])
+        self.print_plan()
+        if plan_out:
+            self.plan.save(plan_out)
+            print(f"💾 Plan saved to: {plan_out} ({len(self.plan.preconditions)} input files hashed)")
+        
+        return self.execute_plan()
+    
+    def apply_saved_plan(self, plan_path: str) -> Dict:
+        """Apply a plan saved by organize_project(plan_out=...) without analyzing the project again"""
+        self.dry_run = False
+        self.changes_made = []
+        self.journal = None
+        self.edited = []
+        
+        print(f"🚀 Applying saved plan: {plan_path}")
+        try:
+            self.plan = MovePlan.load(plan_path, 'organizer', str(self.project_root))
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot use plan: {e}")
+            return {'timestamp': datetime.now().isoformat(), 'dry_run': False,
+                    'changes_made': [], 'total_changes': 0, 'error': str(e)}
+        stale = self.plan.stale_inputs()
+        if stale:
+            print(f"❌ {len(stale)} files changed since the plan was made; create a new plan:")
+            for relpath in stale[:10]:
+                print(f"    {relpath}")
+            return {'timestamp': datetime.now().isoformat(), 'dry_run': False,
+                    'changes_made': [], 'total_changes': 0, 'error': 'plan is stale'}
+        print(f"✅ All {len(self.plan.preconditions)} input files match the plan")
+        self.print_plan()
+        return self.execute_plan()
+    
+    def execute_plan(self) -> Dict:
+        """Phase two and everything after it: apply, update imports, validate, commit, summarize"""
+        dry_run = self.dry_run
+        
+        # Snapshot the import graph before anything moves
+        self.propagator = RenamePropagator(str(self.project_root), dry_run=dry_run)
+        
+        # Phase two: apply it in one journaled batch
+        if not dry_run and self.plan.steps:
+            if not self.apply_plan():
+                return {'timestamp': datetime.now().isoformat(), 'dry_run': dry_run,
+                        'changes_made': [], 'total_changes': 0, 'error': 'plan could not be applied'}
+            # The report describes the tree before the moves
+            self.session.invalidate()
+        self.plan_changes()
+        
+        # Point importers at the new locations, keeping the originals in the journal
+        self.record_moves()
+        if self.journal is not None:
+            self.propagator.before_write = self.journal.save_original
+        self.update_imports()
+        if self.journal is not None:
+            self.journal.commit(self.plan, self.edited)
         
         # Validate TypeScript (if not dry run)
         if not dry_run:
             self.validate_typescript()
         
-        # Git operations
-        if not dry_run and self.changes_made:
+        # Git operations (described only, in a dry run)
+        if self.changes_made:
             self.run_git_operations()
         
+        # Baseline for the next run is the tree as this run left it
+        if self.snapshot is not None and not dry_run:
+            self.snapshot.scan()
+            self.snapshot.save()
+        
         # Generate summary
         summary = {
             'timestamp': datetime.now().isoformat(),
             'dry_run': dry_run,
             'changes_made': self.changes_made,
-            'total_changes': len(self.changes_made)
+            'total_changes': len(self.changes_made),
+            'journal': self.journal.journal_id if self.journal is not None else None
         }
         
         print(f"\n🎉 Organization complete!")
@@ -239,11 +330,42 @@ def main():
     parser.add_argument('--project-root', default='.', help='Project root directory')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
     parser.add_argument('--output', help='Save summary to JSON file')
+    parser.add_argument('--no-cache', action='store_true', help='Re-analyze every file instead of using the analysis cache')
+    parser.add_argument('--no-daemon', action='store_true', help='Analyze in-process even if the analyzer daemon is running')
+    parser.add_argument('--snapshot', action='store_true',
+                        help='Skip the run when nothing changed since the last one (Merkle tree snapshot)')
+    parser.add_argument('--trust-dir-mtime', action='store_true',
+                        help='With --snapshot, skip listing directories whose mtime is unchanged (misses in-place edits)')
+    parser.add_argument('--session', metavar='FILE',
+                        help='Use an analysis saved by analysis_session.py instead of analyzing again')
+    parser.add_argument('--scoped-typecheck', action='store_true',
+                        help='Type-check the tsconfig projects whose files were moved or rewritten, not just the root one')
+    parser.add_argument('--plan-out', metavar='FILE',
+                        help='With --dry-run, save the plan with content hashes of its inputs, to apply later with --apply')
+    parser.add_argument('--apply', metavar='FILE', help='Apply a saved plan without analyzing the project again')
+    parser.add_argument('--rollback', nargs='?', const='', metavar='JOURNAL',
+                        help='Undo an organize run from its journal (default: the newest not rolled back)')
     
     args = parser.parse_args()
+    if args.apply and (args.dry_run or args.plan_out):
+        parser.error("--apply cannot be combined with --dry-run or --plan-out")
+    if args.plan_out and not args.dry_run:
+        # Applying the plan right away would change the very inputs it hashed
+        parser.error("--plan-out requires --dry-run")
+    
+    if args.rollback is not None:
+        rollback(args.project_root, args.rollback or None)
+        return
     
-    organizer = SmartFileOrganizer(args.project_root)
-    summary = organizer.organize_project(dry_run=args.dry_run)
+    session = open_session(args.session, args.project_root) if args.session else None
+    organizer = SmartFileOrganizer(args.project_root, use_cache=not args.no_cache,
+                                   use_daemon=not args.no_daemon, use_snapshot=args.snapshot,
+                                   trust_dir_mtime=args.trust_dir_mtime, session=session,
+                                   scoped_typecheck=args.scoped_typecheck)
+    if args.apply:
+        summary = organizer.apply_saved_plan(args.apply)
+    else:
+        summary = organizer.organize_project(dry_run=args.dry_run, plan_out=args.plan_out)
     
     if args.output:
         with open(args.output, 'w') as f:
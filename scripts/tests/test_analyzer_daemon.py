@@ -0,0 +1,38 @@
+"""
+Analyzer Daemon Tests
+Path: scripts/tests/test_analyzer_daemon.py
+Purpose: When a session may use the daemon's report instead of analyzing in-process
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+import analyzer_daemon
+from analysis_session import AnalysisSession
+from analyzer_daemon import AnalyzerDaemon
+from project_analyzer import json_default
+
+def serve_in_process(monkeypatch, daemon: AnalyzerDaemon) -> None:
+    """Answer daemon requests from daemon directly, through the same JSON round trip as the socket"""
+    def request(project_root, op, timeout=60.0, **params):
+        return json.loads(json.dumps(daemon.handle(dict(params, op=op)), default=json_default))
+    monkeypatch.setattr(analyzer_daemon, 'daemon_request', request)
+
+def test_session_uses_daemon_report_only_with_matching_options(tmp_path, monkeypatch):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'App.ts').write_text('export const App = () => <div/>;\n')
+    serve_in_process(monkeypatch, AnalyzerDaemon(str(tmp_path), use_cache=False))
+
+    same = AnalysisSession(str(tmp_path), use_cache=False)
+    same.report()
+    assert same.source == 'daemon'
+
+    for options in ({'detector': 'regex'}, {'byte_budget': 1024}, {'find_duplicates': True}):
+        other = AnalysisSession(str(tmp_path), use_cache=False, **options)
+        other.report()
+        assert other.source == 'analyzer', options
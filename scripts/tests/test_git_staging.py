@@ -0,0 +1,65 @@
+"""
+Git Staging Tests
+Path: scripts/tests/test_git_staging.py
+Purpose: Path-scoped staging and commits, checked in a temporary git repository
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from git_staging import commit_paths, stage_paths
+
+def git(root: Path, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=root, capture_output=True, text=True, check=True).stdout
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.name', 'Test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    (tmp_path / 'src').mkdir()
+    for name in ('a.ts', 'b.ts', 'other.ts'):
+        (tmp_path / 'src' / name).write_text(f'export const {name[0]} = 1;\n')
+    git(tmp_path, 'add', '-A')
+    git(tmp_path, 'commit', '-q', '-m', 'initial')
+    return tmp_path
+
+def last_commit(root: Path) -> list:
+    return git(root, 'show', '--name-status', '-M', '--format=', 'HEAD').split('\n')[:-1]
+
+def test_commit_adds_deletes_and_renames_only_given_paths(repo):
+    (repo / 'src' / 'new.ts').write_text('export const n = 1;\n')
+    (repo / 'src' / 'b.ts').unlink()
+    (repo / 'src' / 'a.ts').rename(repo / 'src' / 'a.tsx')
+    # Changes the run did not make stay out of the commit, staged or not
+    (repo / 'src' / 'other.ts').write_text('export const o = 2;\n')
+    (repo / 'notes.md').write_text('mine\n')
+    git(repo, 'add', 'notes.md')
+
+    committed = commit_paths(repo, ['src/new.ts', 'src/b.ts', 'src/a.ts', repo / 'src' / 'a.tsx'], 'organize')
+
+    assert sorted(committed) == ['src/a.ts', 'src/a.tsx', 'src/b.ts', 'src/new.ts']
+    assert sorted(last_commit(repo)) == ['A\tsrc/new.ts', 'D\tsrc/b.ts', 'R100\tsrc/a.ts\tsrc/a.tsx']
+    assert git(repo, 'status', '--porcelain').splitlines() == ['A  notes.md', ' M src/other.ts']
+
+def test_untracked_vanished_and_outside_paths_are_skipped(repo, tmp_path_factory):
+    outside = tmp_path_factory.mktemp('outside') / 'x.ts'
+    staged = stage_paths(repo, ['downloads/gone.ts', outside, 'src/../src/a.ts'])
+    assert set(staged) <= {'src/a.ts'}
+    assert git(repo, 'diff', '--cached', '--name-only') == ''
+
+def test_nothing_to_commit(repo):
+    assert commit_paths(repo, ['src/a.ts'], 'no-op') == []
+    assert git(repo, 'rev-list', '--count', 'HEAD') == '1\n'
+
+def test_paths_are_taken_literally(repo):
+    (repo / 'src' / '*.ts').write_text('export const star = 1;\n')
+    assert commit_paths(repo, ['src/*.ts'], 'literal') == ['src/*.ts']
+    assert last_commit(repo) == ['A\tsrc/*.ts']
@@ -0,0 +1,99 @@
+"""
+Move Plan Tests
+Path: scripts/tests/test_move_plan.py
+Purpose: Planning, apply and rollback behavior of move_plan.MovePlan
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from move_plan import MoveJournal, MovePlan, apply_plan, rollback
+
+def test_final_location_after_backup_then_replace(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'downloads').mkdir()
+    (tmp_path / 'src' / 'a.ts').write_text('old')
+    (tmp_path / 'downloads' / 'a.ts').write_text('new')
+
+    plan = MovePlan(str(tmp_path))
+    plan.move('src/a.ts', 'src/a.ts.bak', reason='backup')
+    plan.move('downloads/a.ts', 'src/a.ts')
+    plan.move('src/a.ts', 'src/a.tsx', reason='extension')
+
+    assert plan.final_location('src/a.ts') == 'src/a.ts.bak'
+    assert plan.final_location('src/a.ts', start=2) == 'src/a.tsx'
+    assert plan.final_location('downloads/a.ts') == 'src/a.tsx'
+
+def test_fixer_fixes_imports_in_replacing_download_not_backup(tmp_path):
+    from enhanced_auto_fix import EnhancedAutoFixer
+
+    (tmp_path / 'downloads').mkdir()
+    (tmp_path / 'src' / 'services').mkdir(parents=True)
+    existing = tmp_path / 'src' / 'services' / 'auth.ts'
+    download = tmp_path / 'downloads' / 'authService.ts'
+    existing.write_text('export const a = 1;\n')
+    download.write_text('export const a = 2;\n')
+    os.utime(existing, (1_000_000, 1_000_000))  # the download is newer: "update"
+
+    fixer = EnhancedAutoFixer(str(tmp_path))
+    fixer.move_file_to_destination(download, 'src/services/auth.ts')
+    assert [step.reason for step in fixer.plan.steps] == ['backup', 'file_update']
+
+    fixed = []
+    fixer.fix_imports_in_file = fixed.append
+    fixer.fix_downloaded_imports()
+    assert fixed == [existing]
+
+def test_apply_skips_directory_made_since_planning_and_rollback_keeps_it(tmp_path):
+    (tmp_path / 'downloads').mkdir()
+    (tmp_path / 'downloads' / 'guide.md').write_text('# Guide\n')
+
+    plan = MovePlan(str(tmp_path))
+    plan.mkdir('docs')
+    plan.move('downloads/guide.md', 'docs/guide.md')
+    plan_path = tmp_path / 'plan.json'
+    plan.save(plan_path)
+
+    # The user makes the directory by hand before applying the saved plan
+    (tmp_path / 'docs').mkdir()
+    plan = MovePlan.load(plan_path, 'organizer', str(tmp_path))
+    assert plan.check() == []
+    journal = MoveJournal.create(tmp_path)
+    counts = apply_plan(plan, journal)
+    journal.commit(plan)
+
+    assert counts['mkdir'] == 0
+    assert (tmp_path / 'docs' / 'guide.md').read_text() == '# Guide\n'
+
+    assert rollback(tmp_path, journal.journal_id)
+    assert (tmp_path / 'downloads' / 'guide.md').exists()
+    assert (tmp_path / 'docs').is_dir()
+
+def test_fixer_refuses_plan_from_another_tool(tmp_path, capsys):
+    from enhanced_auto_fix import EnhancedAutoFixer
+
+    plan = MovePlan(str(tmp_path))
+    plan.mkdir('docs')
+    plan.save(tmp_path / 'plan.json')
+
+    fixer = EnhancedAutoFixer(str(tmp_path))
+    assert fixer.apply_saved_plan(str(tmp_path / 'plan.json'), commit=False) is False
+    assert "❌ Cannot use plan" in capsys.readouterr().out
+    assert not (tmp_path / 'docs').exists()
+
+def test_fixer_dry_run_says_what_would_happen(tmp_path, capsys):
+    from enhanced_auto_fix import EnhancedAutoFixer
+
+    (tmp_path / 'downloads').mkdir()
+    (tmp_path / 'downloads' / 'authService.ts').write_text('export const a = 2;\n')
+
+    EnhancedAutoFixer(str(tmp_path)).run(commit=False, dry_run=True)
+    out = capsys.readouterr().out
+    assert "📁 Would move: authService.ts" in out
+    assert "Moved" not in out
+    assert (tmp_path / 'downloads' / 'authService.ts').exists()
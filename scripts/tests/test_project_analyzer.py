@@ -0,0 +1,42 @@
+"""
+Project Analyzer Tests
+Path: scripts/tests/test_project_analyzer.py
+Purpose: Streamed (window by window) analysis agrees with reading the file whole
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from project_analyzer import ProjectAnalyzer
+from source_reader import WINDOW_SIZE
+
+def straddling_source(opening: str, closing: str) -> str:
+    """A source whose literal opens in the first window and holds JSX-like text in the second"""
+    filler = '// padding\n' * (WINDOW_SIZE // len('// padding\n') - 10)
+    body = "  const row = 1;\n" * 200 + "  <div className='x'>not code</div>\n"
+    return filler + f"const html = {opening}\n" + body + f"{closing};\nexport const size = 1;\n"
+
+def test_literals_straddling_window_boundary_stay_literals(tmp_path):
+    analyzer = ProjectAnalyzer(str(tmp_path), use_cache=False)
+    for opening, closing in (('`', '`'), ('/*', '*/ null')):
+        source = straddling_source(opening, closing)
+        large = tmp_path / 'large.js'
+        large.write_text(source)
+        assert large.stat().st_size > WINDOW_SIZE
+        assert source.index(opening) < WINDOW_SIZE < source.index("<div")
+
+        streamed = analyzer.analyze_file_content(large)
+        whole = analyzer.classify(large, *analyzer.detect(source))
+        assert streamed.suggested_extension == whole.suggested_extension == '.js'
+
+def test_jsx_after_window_boundary_is_still_found(tmp_path):
+    source = '// padding\n' * (WINDOW_SIZE // len('// padding\n') + 10)
+    source += "export const App = () => {\n  return (\n    <div>hi</div>\n  );\n};\n"
+    large = tmp_path / 'App.js'
+    large.write_text(source)
+    analysis = ProjectAnalyzer(str(tmp_path), use_cache=False).analyze_file_content(large)
+    assert analysis.suggested_extension == '.tsx'
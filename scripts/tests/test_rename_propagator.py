@@ -0,0 +1,103 @@
+"""
+Rename Propagator Tests
+Path: scripts/tests/test_rename_propagator.py
+Purpose: Import rewrites after file moves, checked against a temporary project tree
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from import_graph import load_graph
+from rename_propagator import RenamePropagator
+
+FILES = {
+    'tsconfig.json': json.dumps({'compilerOptions': {'baseUrl': '.', 'paths': {'@/*': ['src/*']}}}),
+    'src/App.tsx': ("import { fmt } from '@/utils/format';\n"
+                    "import { add } from './helpers/math.js';\n"
+                    "import { Card } from './widgets';\n"
+                    "export const App = () => fmt(add(1, 2));\n"),
+    'src/pages/Home.tsx': ("import { fmt } from '../utils/format';\n"
+                           "import { Card } from '../widgets/index';\n"
+                           "export const Home = () => fmt(Card);\n"),
+    'src/utils/format.ts': "export const fmt = (value: unknown) => String(value);\n",
+    'src/helpers/math.js': "export const add = (a, b) => a + b;\n",
+    'src/widgets/index.ts': "export const Card = 'card';\n",
+}
+
+def make_tree(root: Path) -> None:
+    for relpath, text in FILES.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+def move(root: Path, old: str, new: str) -> None:
+    (root / new).parent.mkdir(parents=True, exist_ok=True)
+    (root / old).rename(root / new)
+
+def test_rewrites_keep_alias_extension_and_directory_style(tmp_path):
+    make_tree(tmp_path)
+    propagator = RenamePropagator(str(tmp_path))
+    for old, new in (('src/utils/format.ts', 'src/lib/format.ts'),
+                     ('src/helpers/math.js', 'src/shared/math.js'),
+                     ('src/widgets/index.ts', 'src/ui/cards/index.ts')):
+        move(tmp_path, old, new)
+        propagator.record_move(tmp_path / old, tmp_path / new)
+
+    rewritten = propagator.flush()
+
+    assert rewritten == {'src/App.tsx': 3, 'src/pages/Home.tsx': 2}
+    assert (tmp_path / 'src/App.tsx').read_text() == (
+        "import { fmt } from '@/lib/format';\n"
+        "import { add } from './shared/math.js';\n"
+        "import { Card } from './ui/cards';\n"
+        "export const App = () => fmt(add(1, 2));\n")
+    assert (tmp_path / 'src/pages/Home.tsx').read_text() == (
+        "import { fmt } from '../lib/format';\n"
+        "import { Card } from '../ui/cards/index';\n"
+        "export const Home = () => fmt(Card);\n")
+
+def test_moved_file_own_imports_and_chained_moves(tmp_path):
+    make_tree(tmp_path)
+    propagator = RenamePropagator(str(tmp_path))
+    move(tmp_path, 'src/pages/Home.tsx', 'src/screens/Home.tsx')
+    propagator.record_move('src/pages/Home.tsx', 'src/screens/Home.tsx')
+    move(tmp_path, 'src/screens/Home.tsx', 'src/screens/main/Home.tsx')
+    propagator.record_move('src/screens/Home.tsx', 'src/screens/main/Home.tsx')
+
+    # Two hops collapse into one move from the original location
+    assert propagator.moves == {'src/pages/Home.tsx': 'src/screens/main/Home.tsx'}
+    written = []
+    propagator.before_write = written.append
+    assert propagator.flush() == {'src/screens/main/Home.tsx': 2}
+    assert written == ['src/screens/main/Home.tsx']
+    assert (tmp_path / 'src/screens/main/Home.tsx').read_text().startswith(
+        "import { fmt } from '../../utils/format';\n"
+        "import { Card } from '../../widgets/index';\n")
+    # Files that do not import the moved file are not touched
+    assert (tmp_path / 'src/App.tsx').read_text() == FILES['src/App.tsx']
+
+def test_flush_updates_and_saves_the_graph(tmp_path):
+    make_tree(tmp_path)
+    propagator = RenamePropagator(str(tmp_path))
+    move(tmp_path, 'src/utils/format.ts', 'src/lib/format.ts')
+    propagator.record_move('src/utils/format.ts', 'src/lib/format.ts')
+    propagator.flush()
+
+    for graph in (propagator.graph, load_graph(str(tmp_path))):
+        assert graph.importers('src/lib/format.ts') == ['src/App.tsx', 'src/pages/Home.tsx']
+        assert graph.importers('src/utils/format.ts') == []
+        assert graph.unresolved() == {}
+
+def test_dry_run_reports_without_writing(tmp_path):
+    make_tree(tmp_path)
+    propagator = RenamePropagator(str(tmp_path), dry_run=True)
+    propagator.record_move('src/utils/format.ts', 'src/lib/format.ts')
+
+    assert propagator.flush() == {'src/App.tsx': 1, 'src/pages/Home.tsx': 1}
+    for relpath, text in FILES.items():
+        assert (tmp_path / relpath).read_text() == text
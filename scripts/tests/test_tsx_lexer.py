@@ -0,0 +1,35 @@
+"""
+TSX Lexer Regression Tests
+Path: scripts/tests/test_tsx_lexer.py
+Purpose: Inputs that once broke tsx_lexer.scan_source
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+from tsx_lexer import LiteralStripper, scan_source, strip_literals
+
+def test_open_template_ending_in_backslash():
+    assert scan_source('const s = `abc\\') == (False, False, False)
+
+def test_escaped_backtick_keeps_template_open():
+    signals = scan_source('const s = `a\\`b${x}`; const j = <div className="a"/>;')
+    assert signals.jsx
+
+def test_deeply_indented_tag_after_return_or_arrow():
+    indent = '\n' + ' ' * 40
+    assert scan_source(f"function View() {{\n  return ({indent}<Item value={{1}} />\n  );\n}}\n").jsx
+    assert scan_source(f"const view = () =>\n\n{indent}<Item />;\n").jsx
+    assert not scan_source(f"const less = count{indent}<Item;\n").jsx
+
+def test_stripping_in_pieces_matches_stripping_whole():
+    source = ("const a = `x\n${b + `in\n${c}`}\ny`;\n/* long\ncomment */ let s = 'one\\\ntwo';\n"
+              "const r = x /\n2;\nconst re = /a\\/b/g; // tail\nconst j = <div/>;\n")
+    whole = strip_literals(source)
+    for cut in (index + 1 for index, char in enumerate(source) if char == '\n'):
+        stripper = LiteralStripper()
+        assert stripper.feed(source[:cut]) + stripper.feed(source[cut:]) == whole, source[:cut]
@@ -0,0 +1,45 @@
+"""
+Type Check Tests
+Path: scripts/tests/test_type_check.py
+Purpose: Which tsconfig projects type_check.validate runs tsc for
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path so we can import our modules
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+import type_check
+
+def make_workspace(root: Path) -> None:
+    (root / 'tsconfig.json').write_text('{}')
+    (root / 'my-app').mkdir()
+    (root / 'my-app' / 'tsconfig.json').write_text('{}')
+
+def checked_projects(monkeypatch, root: Path, *args, **kwargs):
+    checked = []
+    def fake_check(project_root, project):
+        checked.append(project)
+        return type_check.TypeCheckResult(project, True, 0.0, '')
+    monkeypatch.setattr(type_check, 'check_project', fake_check)
+    type_check.validate(root, *args, **kwargs)
+    return sorted(checked)
+
+def test_unscoped_checks_only_root_project(tmp_path, monkeypatch):
+    make_workspace(tmp_path)
+    assert checked_projects(monkeypatch, tmp_path) == ['.']
+    assert checked_projects(monkeypatch, tmp_path, ['my-app/src/a.ts']) == ['.']
+
+def test_scoped_and_all_projects(tmp_path, monkeypatch):
+    make_workspace(tmp_path)
+    assert checked_projects(monkeypatch, tmp_path, ['my-app/src/a.ts'], scoped=True) == ['my-app']
+    assert checked_projects(monkeypatch, tmp_path, all_projects=True) == ['.', 'my-app']
+
+def test_unscoped_never_falls_back_to_a_sub_project(tmp_path, monkeypatch):
+    make_workspace(tmp_path)
+    (tmp_path / 'tsconfig.json').unlink()
+    assert type_check.discover_projects(tmp_path) == ['my-app']
+    assert checked_projects(monkeypatch, tmp_path) == ['.']
+    assert checked_projects(monkeypatch, tmp_path, all_projects=True) == ['my-app']
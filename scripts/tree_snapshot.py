@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Tree Snapshot - Merkle Snapshot of the Project Tree
+Path: scripts/tree_snapshot.py
+Purpose: Persist (name, size, mtime) hashes per directory so repeated runs get an exact added/modified/removed set
+"""
+
+import os
+import json
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from analysis_cache import DEFAULT_CACHE_DIR
+from project_analyzer import PRUNE_DIRS
+
+# Bump when the node layout or hashing changes
+SNAPSHOT_VERSION = 1
+
+# One snapshot per consumer, so each tool diffs against its own last run
+SNAPSHOT_DIR = DEFAULT_CACHE_DIR / "snapshots"
+
+class FileStat(NamedTuple):
+    """The stat fields the snapshot records, usable where an os.stat_result is expected"""
+    st_size: int
+    st_mtime_ns: int
+
+@dataclass
+class SnapshotDiff:
+    """Root-relative paths that changed between two snapshots"""
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[str]:
+        """Paths with contents worth looking at again"""
+        return self.added + self.modified
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.modified or self.removed)
+
+    def summary(self, limit: Optional[int] = None) -> Dict:
+        """Counts plus (optionally capped) path lists for reports"""
+        return {
+            'added': len(self.added), 'modified': len(self.modified), 'removed': len(self.removed),
+            'paths': {
+                'added': self.added[:limit], 'modified': self.modified[:limit], 'removed': self.removed[:limit],
+            },
+        }
+
+def node_hash(children: Dict) -> str:
+    """Merkle hash of a directory over its children's names and (size, mtime) or subtree hash"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(children):
+        node = children[name]
+        if isinstance(node, dict):
+            entry = f"d{name}\0{node['h']}\0"
+        else:
+            entry = f"f{name}\0{node[0]}:{node[1]}\0"
+        digest.update(entry.encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+def iter_tree_files(node: Dict, prefix: str = '') -> Iterator[Tuple[str, list]]:
+    """(relpath, [size, mtime_ns]) for every file under a directory node"""
+    for name, child in node['c'].items():
+        if isinstance(child, dict):
+            yield from iter_tree_files(child, f"{prefix}{name}/")
+        else:
+            yield prefix + name, child
+
+def diff_trees(old: Optional[Dict], new: Dict, diff: SnapshotDiff, prefix: str = '') -> None:
+    """Compare two directory nodes, skipping every subtree whose hash did not change"""
+    if old is not None and old['h'] == new['h']:
+        return
+    old_children = old['c'] if old is not None else {}
+    for name, node in new['c'].items():
+        relpath = prefix + name
+        before = old_children.get(name)
+        if isinstance(node, dict):
+            if isinstance(before, list):
+                diff.removed.append(relpath)
+                before = None
+            diff_trees(before, node, diff, relpath + '/')
+        else:
+            if isinstance(before, dict):
+                diff.removed.extend(path for path, _ in iter_tree_files(before, relpath + '/'))
+                before = None
+            if before is None:
+                diff.added.append(relpath)
+            elif list(before) != list(node):
+                diff.modified.append(relpath)
+    for name, before in old_children.items():
+        if name not in new['c']:
+            if isinstance(before, dict):
+                diff.removed.extend(path for path, _ in iter_tree_files(before, f"{prefix}{name}/"))
+            else:
+                diff.removed.append(prefix + name)
+
+class TreeSnapshot:
+    """A persisted Merkle tree of the project, one node per directory.
+
+    Each directory node stores its own mtime, its children (files as
+    [size, mtime_ns]) and a hash over them, so diffing two snapshots only
+    descends into directories whose hash changed.
+
+    By default every file is stat'ed on scan, which catches every change.
+    With trust_dir_mtime a directory whose own mtime is unchanged keeps its
+    file records from the previous snapshot without being listed, so a scan
+    costs one stat per directory. A directory's mtime only changes when
+    entries are added, removed or renamed in it, though: a file edited in
+    place is missed until something else touches its directory.
+    """
+
+    def __init__(self, project_root: str = ".", name: str = 'default', prune_dirs=PRUNE_DIRS,
+                 trust_dir_mtime: bool = False):
+        self.project_root = Path(project_root).resolve()
+        self.name = name
+        self.prune_dirs = set(prune_dirs)
+        self.trust_dir_mtime = trust_dir_mtime
+        self.path = self.project_root / SNAPSHOT_DIR / f"{name}.json"
+        self.previous: Optional[Dict] = None
+        self.tree: Optional[Dict] = None
+        self.diff: Optional[SnapshotDiff] = None
+        self.stats = {'dirs_listed': 0, 'dirs_reused': 0, 'files_stated': 0}
+
+    def fingerprint(self) -> Dict:
+        return {'version': SNAPSHOT_VERSION, 'prune_dirs': sorted(self.prune_dirs)}
+
+    def load(self) -> Optional[Dict]:
+        """The last saved tree, or None if there is none (or it was made with other settings)"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('meta') != self.fingerprint():
+            return None
+        return data.get('tree')
+
+    def scan_dir(self, path: str, old: Optional[Dict]) -> Dict:
+        mtime_ns = os.stat(path).st_mtime_ns
+        if self.trust_dir_mtime and old is not None and old['m'] == mtime_ns:
+            # Same entries as last time: keep the file records, but subdirectories
+            # have mtimes of their own and still need their one stat each
+            self.stats['dirs_reused'] += 1
+            children = dict(old['c'])
+            for name, child in old['c'].items():
+                if isinstance(child, dict):
+                    try:
+                        children[name] = self.scan_dir(os.path.join(path, name), child)
+                    except OSError:
+                        del children[name]
+            if all(children.get(name) is child for name, child in old['c'].items()):
+                return old
+            return {'m': mtime_ns, 'h': node_hash(children), 'c': children}
+
+        self.stats['dirs_listed'] += 1
+        old_children = old['c'] if old is not None else {}
+        children = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in self.prune_dirs:
+                                before = old_children.get(name)
+                                children[name] = self.scan_dir(entry.path, before if isinstance(before, dict) else None)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            self.stats['files_stated'] += 1
+                            children[name] = [stat.st_size, stat.st_mtime_ns]
+                    except OSError:
+                        # Vanished or unreadable between listing and stat
+                        continue
+        except PermissionError:
+            pass
+        return {'m': mtime_ns, 'h': node_hash(children), 'c': children}
+
+    def scan(self) -> SnapshotDiff:
+        """Scan the tree and diff it against the last saved snapshot (everything is 'added' the first time)"""
+        self.previous = self.load()
+        self.tree = self.scan_dir(str(self.project_root), self.previous)
+        self.diff = SnapshotDiff()
+        diff_trees(self.previous, self.tree, self.diff)
+        for paths in (self.diff.added, self.diff.modified, self.diff.removed):
+            paths.sort()
+        return self.diff
+
+    @property
+    def root_hash(self) -> Optional[str]:
+        return self.tree['h'] if self.tree is not None else None
+
+    def files(self) -> Iterator[Tuple[str, FileStat]]:
+        """(root-relative path, FileStat) for every file in the scanned tree"""
+        for relpath, (size, mtime_ns) in iter_tree_files(self.tree):
+            yield relpath, FileStat(size, mtime_ns)
+
+    def save(self) -> None:
+        """Persist the scanned tree as the baseline for the next run"""
+        if self.tree is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'meta': self.fingerprint(), 'tree': self.tree}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Show what changed in the project tree since the last snapshot')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--name', default='default', help='Snapshot name (each tool keeps its own)')
+    parser.add_argument('--trust-dir-mtime', action='store_true',
+                        help='Skip directories whose mtime is unchanged (misses files edited in place)')
+    parser.add_argument('--no-save', action='store_true', help='Do not update the stored snapshot')
+    parser.add_argument('--limit', type=int, default=20, help='Paths to print per change type')
+
+    args = parser.parse_args()
+
+    snapshot = TreeSnapshot(args.project_root, args.name, trust_dir_mtime=args.trust_dir_mtime)
+    diff = snapshot.scan()
+    if snapshot.previous is None:
+        print(f"📸 First snapshot: {len(diff.added)} files")
+    elif diff.empty:
+        print("✨ No changes since the last snapshot")
+    else:
+        for label, emoji, paths in (('added', '➕', diff.added), ('modified', '✏️ ', diff.modified),
+                                    ('removed', '➖', diff.removed)):
+            if paths:
+                print(f"{emoji} {len(paths)} {label}")
+                for path in paths[:args.limit]:
+                    print(f"    {path}")
+    stats = snapshot.stats
+    print(f"📊 {stats['dirs_listed']} directories listed, {stats['dirs_reused']} reused, "
+          f"{stats['files_stated']} files stat'ed")
+    if not args.no_save:
+        snapshot.save()
+
+if __name__ == "__main__":
+    main()
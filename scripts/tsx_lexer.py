@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+TSX Lexer - JSX/React Signal Scanner
+Path: scripts/tsx_lexer.py
+Purpose: Detect JSX, React imports and components without being fooled by strings, comments or generics
+"""
+
+import re
+import time
+from typing import NamedTuple
+
+# Bump when detection rules change so cached analyses are invalidated
+LEXER_VERSION = 3
+
+class SourceSignals(NamedTuple):
+    """What a TS/JS source file contains"""
+    jsx: bool
+    react_imports: bool
+    components: bool
+
+# Things that hide code: comments and string/template/regex literals. A plain
+# character class finds the next candidate much faster than the alternation
+# itself (sre tries every branch at every position), so search with the class
+# and match the alternation only where it can start.
+_LITERAL_CHAR = re.compile(r"[/\"'`]")
+_LITERAL_CHAR_IN_TEMPLATE = re.compile(r"[/\"'`{}]")
+
+_LITERAL_START = re.compile(r"""
+    (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?(?:\*/|\Z))
+  | (?P<string>"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?)
+  | (?P<template>`)
+  | (?P<slash>/)
+""", re.VERBOSE | re.DOTALL)
+
+# Inside a ${...} substitution braces must be counted to find its end
+_LITERAL_START_IN_TEMPLATE = re.compile(_LITERAL_START.pattern + r"| (?P<brace>[{}])", re.VERBOSE | re.DOTALL)
+
+_TEMPLATE_BODY = re.compile(r"(?:[^`\\$]|\\(?:.|\Z)|\$(?!\{))*(`|\$\{|\Z)", re.DOTALL)
+
+# How a comment or string left open at the end of one piece continues in the next
+_LINE_COMMENT_REST = re.compile(r"[^\n]*")
+_BLOCK_COMMENT_REST = re.compile(r".*?(?:\*/|\Z)", re.DOTALL)
+_STRING_REST = {quote: re.compile(rf"(?:[^{quote}\\\n]|\\.)*{quote}?", re.DOTALL) for quote in "\"'"}
+
+# Code kept from the end of one piece as context for the next
+_TAIL_SIZE = 64
+
+_REGEX_LITERAL = re.compile(r"/(?:[^/\\\n\[]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*")
+
+# A '/' starts a regex literal (not a division) after these characters/keywords
+_REGEX_AFTER_CHARS = set("(,=:[!&|?{};+-*%>~^")
+_REGEX_AFTER_WORDS = re.compile(r"(?:^|[^\w$])(?:return|typeof|case|do|else|in|of|new|delete|void|throw|yield|await)$")
+
+# String contents that must survive sanitizing for import detection
+_KEPT_STRING = re.compile(r"""(['"])react(?:/[\w./-]*)?\1$""")
+
+# Unambiguous JSX markers, each starting with a literal so sre searches fast
+_JSX_MARKERS = [re.compile(pattern) for pattern in (
+    r"</(?:[A-Za-z_$][\w$]*(?:[.:-][\w$]+)*)?\s*>",
+    r"React\s*\.\s*createElement\b",
+    r"jsxs?\s*\(",
+)]
+
+# A candidate opening tag: <>, <Name />, <Name attr...> or <Name>
+_TAG_OPEN = re.compile(r"""
+    <(?: >
+      | (?P<name>[A-Za-z_$][\w$]*(?:[.:-][\w$]+)*)\s*
+        (?: /> | (?!extends\b)[A-Za-z_${] | (?P<close>>)\s*(?P<paren>\()? )
+    )
+""", re.VERBOSE)
+
+# A tag can only start where an expression can: after an operator/opening
+# punctuation or an expression keyword, never after an identifier or ')'
+# (that is a comparison or generic arguments such as Array<Foo>).
+_EXPRESSION_START = re.compile(r"(?:^|[(,=:\[!&|?{};>]|(?<![\w$.])(?:return|yield|default|case|await|in|of))\s*$")
+
+# Each signal is a list of patterns that begin with a literal keyword, so sre
+# can use its fast prefix search; one alternation of them would not.
+_REACT_IMPORT_PATTERNS = [re.compile(pattern) for pattern in (
+    r"import\s+(?:type\s+)?React\b",
+    r"import\s+(?:type\s+)?[\w$\s{},*]*?\b(?:useState|useEffect|useContext)\b",
+    r"import\s+(?:type\s+)?[\w$\s{},*]*?\bfrom\s*(['\"])react\1",
+    r"require\s*\(\s*(['\"])react\1\s*\)",
+)]
+
+_COMPONENT_PATTERNS = [re.compile(pattern) for pattern in (
+    r"function\s*\*?\s*[A-Z][\w$]*\s*[<(]",
+    r"(?:const|let|var)\s+[A-Z][\w$]*\s*(?::[^=;\n]*)?=\s*"
+    r"(?:\(|async\b|function\b|(?:React\s*\.\s*)?(?:memo|forwardRef)\b)",
+    r"export\s+default\s+[A-Z]",
+    r"class\s+[A-Z][\w$]*(?:<[^>{]*>)?\s+extends\s+(?:React\s*\.\s*)?(?:Pure)?Component\b",
+)]
+
+# `<string>value` is a TypeScript type assertion, not an element
+_TYPE_ASSERTION_NAMES = {
+    'any', 'unknown', 'never', 'string', 'number', 'boolean', 'bigint',
+    'symbol', 'object', 'void', 'null', 'undefined', 'const',
+}
+
+def _regex_allowed(code_so_far: str) -> bool:
+    """True if a '/' at the end of code_so_far starts a regex literal"""
+    stripped = code_so_far.rstrip()
+    if not stripped:
+        return True
+    if stripped[-1] in _REGEX_AFTER_CHARS:
+        return True
+    return bool(_REGEX_AFTER_WORDS.search(stripped[-12:]))
+
+def _string_closed(literal: str) -> bool:
+    """True if a string literal ends with its quote, not with an escaped one"""
+    body = literal[1:]
+    if not body.endswith(literal[0]):
+        return False
+    return (len(body) - 1 - len(body[:-1].rstrip('\\'))) % 2 == 0
+
+class LiteralStripper:
+    """strip_literals() over a text fed in consecutive pieces, such as the windows of a large file.
+
+    A comment, string or template literal still open at the end of one
+    piece is continued at the start of the next, so a piece boundary never
+    turns literal text into code. tail keeps the end of the code emitted so
+    far, the context a '/' or a tag at the start of the next piece needs.
+    Pieces should end at line breaks, as WindowReader windows do; a token
+    cut in the middle of a line is not rejoined.
+    """
+
+    def __init__(self):
+        self.template_depths = []
+        # What the last piece left open: 'line_comment', 'block_comment', 'template', a quote or None
+        self.open = None
+        self.tail = ''
+
+    def feed(self, text: str) -> str:
+        """Return the code of the next piece with comments removed and literal contents blanked.
+
+        One left-to-right pass: the scanner jumps between literal starts and
+        copies the code in between. Strings become "" (except 'react' module
+        specifiers, which import detection needs), template literals keep only
+        their ${...} code, and regex literals become a placeholder.
+        """
+        pieces = []
+        pos = self._continue_open(text, pieces)
+        length = len(text)
+        template_depths = self.template_depths
+        while pos < length:
+            if template_depths:
+                char_re, token_re = _LITERAL_CHAR_IN_TEMPLATE, _LITERAL_START_IN_TEMPLATE
+            else:
+                char_re, token_re = _LITERAL_CHAR, _LITERAL_START
+            candidate = char_re.search(text, pos)
+            if candidate is None:
+                pieces.append(text[pos:])
+                break
+            start = candidate.start()
+            match = token_re.match(text, start)
+            pieces.append(text[pos:start])
+            pos = match.end()
+            kind = match.lastgroup
+
+            if kind == 'string':
+                literal = match.group()
+                if pos == length and not _string_closed(literal):
+                    self.open = literal[0]
+                pieces.append(literal if _KEPT_STRING.match(literal) else '""')
+            elif kind == 'line_comment':
+                if pos == length:
+                    self.open = kind
+                pieces.append(' ')
+            elif kind == 'block_comment':
+                comment = match.group()
+                if len(comment) < 4 or not comment.endswith('*/'):
+                    self.open = kind
+                pieces.append(' ')
+            elif kind == 'slash':
+                context = ''.join(pieces[-3:]) if len(pieces) >= 3 else self.tail + ''.join(pieces)
+                regex = _REGEX_LITERAL.match(text, start) if _regex_allowed(context) else None
+                if regex:
+                    pieces.append('/_/')
+                    pos = regex.end()
+                else:
+                    pieces.append('/')
+            elif kind == 'template':
+                pieces.append('`')
+                pos = self._skip_template_body(text, pos, pieces)
+            else:  # brace inside a template substitution
+                if match.group() == '{':
+                    template_depths[-1] += 1
+                    pieces.append('{')
+                elif template_depths[-1]:
+                    template_depths[-1] -= 1
+                    pieces.append('}')
+                else:
+                    template_depths.pop()
+                    pieces.append('}')
+                    pos = self._skip_template_body(text, pos, pieces)
+
+        code = ''.join(pieces)
+        last = code.rstrip()
+        if len(last) >= _TAIL_SIZE:
+            code_so_far = last
+        else:
+            code_so_far = self.tail + last if last else self.tail.rstrip()
+        # Keep one separator so the next piece's first token does not join the last one
+        trailing_space = len(last) < len(code) if code else code_so_far != self.tail
+        self.tail = code_so_far[-_TAIL_SIZE:] + (' ' if trailing_space else '')
+        return code
+
+    def _continue_open(self, text: str, pieces: list) -> int:
+        """Skip the rest of the literal the previous piece left open; returns where code resumes"""
+        kind, self.open = self.open, None
+        if kind is None:
+            return 0
+        if kind == 'template':
+            return self._skip_template_body(text, 0, pieces)
+        if kind == 'line_comment':
+            end = _LINE_COMMENT_REST.match(text).end()
+            if end == len(text):
+                self.open = kind
+            return end
+        if kind == 'block_comment':
+            rest = _BLOCK_COMMENT_REST.match(text)
+            if not rest.group().endswith('*/'):
+                self.open = kind
+            return rest.end()
+        rest = _STRING_REST[kind].match(text)
+        if rest.end() == len(text) and not _string_closed(kind + rest.group()):
+            self.open = kind
+        return rest.end()
+
+    def _skip_template_body(self, text: str, pos: int, pieces: list) -> int:
+        """Skip template literal text up to its end or the next ${"""
+        body = _TEMPLATE_BODY.match(text, pos)
+        end = body.group(1)
+        if end == '${':
+            self.template_depths.append(0)
+            pieces.append('${')
+        elif end == '`':
+            pieces.append('`')
+        else:
+            self.open = 'template'
+        return body.end()
+
+def strip_literals(text: str) -> str:
+    """Return the code with comments removed and string/template/regex contents blanked"""
+    return LiteralStripper().feed(text)
+
+def _has_jsx(code: str) -> bool:
+    if _has_any(_JSX_MARKERS, code):
+        return True
+    for match in _TAG_OPEN.finditer(code):
+        # Judge the token before the tag, however much whitespace separates them
+        end = match.start()
+        while end and code[end - 1].isspace():
+            end -= 1
+        if not _EXPRESSION_START.search(code, max(0, end - 16), end):
+            continue
+        name = match.group('name')
+        if not match.group('close'):
+            return True
+        if name in _TYPE_ASSERTION_NAMES:
+            continue
+        # `<T>(x) => ...` is a generic arrow function in .ts files
+        if match.group('paren') and len(name) <= 2 and name[0].isupper():
+            continue
+        return True
+    return False
+
+def _has_any(patterns: list, code: str) -> bool:
+    return any(pattern.search(code) for pattern in patterns)
+
+def scan_source(text: str, profile=None, stripper: LiteralStripper = None) -> SourceSignals:
+    """Return the JSX, React-import and component signals for a source file.
+
+    `profile`, if given, needs an add_pattern(category, label, seconds, hit)
+    method (see AnalyzerProfile) and receives the cost of each stage. To scan
+    a large file window by window, pass the same `stripper` for every window
+    so literals and comments carry over; signals then cover that window.
+    """
+    def strip(text):
+        if stripper is None:
+            return strip_literals(text)
+        context = stripper.tail
+        return context + stripper.feed(text)
+
+    if profile is None:
+        code = strip(text)
+        return SourceSignals(
+            jsx=_has_jsx(code),
+            react_imports=_has_any(_REACT_IMPORT_PATTERNS, code),
+            components=_has_any(_COMPONENT_PATTERNS, code),
+        )
+
+    start = time.perf_counter()
+    code = strip(text)
+    profile.add_pattern('lexer', 'strip_literals', time.perf_counter() - start, True)
+    results = []
+    for category, detect in (('jsx', _has_jsx),
+                             ('react_imports', lambda c: _has_any(_REACT_IMPORT_PATTERNS, c)),
+                             ('components', lambda c: _has_any(_COMPONENT_PATTERNS, c))):
+        start = time.perf_counter()
+        hit = detect(code)
+        profile.add_pattern(category, f'tsx_lexer.{category}', time.perf_counter() - start, hit)
+        results.append(hit)
+    return SourceSignals(*results)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Type Check - Incremental, Scoped TypeScript Validation
+Path: scripts/type_check.py
+Purpose: Run tsc --noEmit per tsconfig project with a persistent build-info cache, only where files changed
+"""
+
+import sys
+import time
+import subprocess
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional
+from analysis_cache import DEFAULT_CACHE_DIR
+from workspace_analyzer import discover_package_roots
+
+# tsc's incremental state, one .tsbuildinfo per project, kept between runs
+BUILD_INFO_DIR = DEFAULT_CACHE_DIR / "tsbuildinfo"
+
+# Files whose move or edit can change what tsc reports (JSON via resolveJsonModule and tsconfig itself)
+TYPE_RELEVANT_SUFFIXES = {'.ts', '.tsx', '.mts', '.cts', '.js', '.jsx', '.mjs', '.cjs', '.json'}
+
+class TypeCheckResult(NamedTuple):
+    """Outcome of one project's tsc run"""
+    project: str
+    passed: bool
+    seconds: float
+    output: str
+
+def discover_projects(project_root) -> List[str]:
+    """Root-relative directories with a tsconfig.json ('.' first); ['.'] when there is none"""
+    return discover_package_roots(project_root, marker='tsconfig.json') or ['.']
+
+def is_type_relevant(relpath: str) -> bool:
+    return posixpath.splitext(relpath)[1].lower() in TYPE_RELEVANT_SUFFIXES
+
+def project_of(relpath: str, projects: List[str]) -> str:
+    """Deepest project containing a root-relative path"""
+    best = '.'
+    for name in projects:
+        if name != '.' and relpath.startswith(name + '/') and len(name) > len(best):
+            best = name
+    return best
+
+def affected_projects(touched: Iterable[str], projects: List[str]) -> List[str]:
+    """Projects owning at least one type-relevant touched path, in project order"""
+    owners = {project_of(relpath, projects) for relpath in touched if is_type_relevant(relpath)}
+    return [name for name in projects if name in owners]
+
+def build_info_path(project_root: Path, project: str) -> Path:
+    name = 'root' if project == '.' else project.replace('/', '__')
+    return project_root / BUILD_INFO_DIR / f"{name}.tsbuildinfo"
+
+def tsc_command(project_root: Path, project: str) -> List[str]:
+    return ['npx', 'tsc', '--noEmit', '--incremental',
+            '--tsBuildInfoFile', str(build_info_path(project_root, project)),
+            '--project', str(project_root / project / 'tsconfig.json')]
+
+def check_project(project_root: Path, project: str) -> TypeCheckResult:
+    """Run tsc for one project; raises FileNotFoundError when npx is missing"""
+    build_info_path(project_root, project).parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    result = subprocess.run(tsc_command(project_root, project), cwd=project_root / project,
+                            capture_output=True, text=True)
+    return TypeCheckResult(project, result.returncode == 0, time.perf_counter() - start,
+                           (result.stdout + result.stderr).strip())
+
+def validate(project_root, touched: Optional[Iterable[str]] = None, scoped: bool = False,
+             all_projects: bool = False, jobs: int = 0) -> Optional[List[TypeCheckResult]]:
+    """Type-check the project after a change set.
+
+    touched is the root-relative paths a run moved (both ends) or rewrote,
+    or None when unknown. Returns None when nothing type-relevant was
+    touched and no check ran. By default only the root project is checked,
+    like a plain `tsc --noEmit`; with scoped, the tsconfig projects owning
+    a touched path (every project when touched is unknown); with
+    all_projects, every project. Projects run in parallel, up to jobs at a
+    time (0 = all of them).
+    """
+    project_root = Path(project_root).resolve()
+    projects = discover_projects(project_root)
+    if touched is not None:
+        touched = list(touched)
+        affected = affected_projects(touched, projects)
+        if not affected:
+            return None
+        if scoped:
+            projects = affected
+    if not (scoped or all_projects):
+        # The root project, as the plain `tsc --noEmit` this replaces; never a sub-package in its place
+        projects = ['.']
+
+    with ThreadPoolExecutor(max_workers=jobs or len(projects)) as pool:
+        return list(pool.map(lambda project: check_project(project_root, project), projects))
+
+def print_results(results: List[TypeCheckResult]) -> bool:
+    """Per-project timing and failures; True if every project passed"""
+    for result in results:
+        emoji = "✅" if result.passed else "❌"
+        print(f"  {emoji} {result.project}: {result.seconds:.1f}s")
+    for result in results:
+        if not result.passed and result.output:
+            print(f"\n❌ TypeScript errors in {result.project}:")
+            print(result.output)
+    return all(result.passed for result in results)
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Incremental TypeScript validation per tsconfig project')
+    parser.add_argument('--project-root', default='.', help='Project root directory')
+    parser.add_argument('--changed', nargs='+', metavar='PATH',
+                        help='Root-relative paths that changed (default: unknown, always check)')
+    parser.add_argument('--scoped', action='store_true', help='With --changed, check the projects owning them')
+    parser.add_argument('--all-projects', action='store_true', help='Check every tsconfig project, not only the root one')
+    parser.add_argument('--jobs', type=int, default=0, help='Projects checked at once (0 = all)')
+
+    args = parser.parse_args()
+
+    try:
+        results = validate(args.project_root, args.changed, scoped=args.scoped,
+                           all_projects=args.all_projects, jobs=args.jobs)
+    except FileNotFoundError:
+        print("⚠️  TypeScript not found - skipping validation")
+        sys.exit(1)
+    if results is None:
+        print("✨ No type-relevant files changed - skipping validation")
+        return
+    print(f"🔎 TypeScript validation ({len(results)} projects):")
+    sys.exit(0 if print_results(results) else 1)
+
+if __name__ == "__main__":
+    main()
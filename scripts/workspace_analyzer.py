@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Workspace Analyzer - Multi-Package Project Analysis
+Path: scripts/workspace_analyzer.py
+Purpose: Analyze every package.json root (root app, my-app, website) in one run and merge the results by package
+"""
+
+import os
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from project_analyzer import (
+    PRUNE_DIRS, AnalysisStore, ProjectAnalyzer, json_default, scan_source_tree,
+)
+
+def discover_package_roots(workspace_root, prune_dirs=PRUNE_DIRS, marker: str = 'package.json') -> List[str]:
+    """Root-relative paths of every directory holding a marker file ('.' for the workspace itself)"""
+    root = Path(workspace_root).resolve()
+    roots = []
+    for path in scan_source_tree(str(root), {'.json'}, prune_dirs):
+        if os.path.basename(path) == marker:
+            roots.append(Path(path).parent.relative_to(root).as_posix())
+    return sorted(roots, key=lambda name: (name != '.', name))
+
+def package_categories(package_root: Path, nested: List[Path], prune_dirs=PRUNE_DIRS) -> Dict[str, str]:
+    """Report buckets for a package: each top-level directory except pruned, hidden and nested-package ones"""
+    categories = {}
+    with os.scandir(package_root) as entries:
+        for entry in entries:
+            if (entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')
+                    and entry.name not in prune_dirs and Path(entry.path) not in nested):
+                categories[entry.name] = entry.name
+    return dict(sorted(categories.items()))
+
+class WorkspaceAnalyzer:
+    """Analyze several package roots as one crawl.
+
+    Candidates from every package are fed through a single ProjectAnalyzer
+    at the workspace root, so all packages share one --jobs process pool and
+    one analysis cache. A per-package ProjectAnalyzer supplies the bucketing
+    (every top-level directory of the package) and builds that package's
+    section of the merged report. A file belongs to the deepest package that
+    contains it.
+    """
+
+    def __init__(self, workspace_root: str = ".", packages: Optional[List[str]] = None,
+                 find_duplicates: bool = False, **analyzer_options):
+        self.workspace_root = Path(workspace_root).resolve()
+        self.find_duplicates = find_duplicates
+        names = packages if packages is not None else discover_package_roots(self.workspace_root)
+        self.package_names = list(names) or ['.']
+
+        # Owns the worker pool, the shared cache and (with --profile) the timings
+        self.driver = ProjectAnalyzer(str(self.workspace_root), **analyzer_options)
+        package_options = dict(analyzer_options, profile=False)
+        roots = {name: (self.workspace_root / name).resolve() for name in self.package_names}
+        self.nested = {
+            name: [other for other_name, other in roots.items()
+                   if other_name != name and root in other.parents]
+            for name, root in roots.items()
+        }
+        self.packages = {
+            name: ProjectAnalyzer(str(root), category_dirs=package_categories(root, self.nested[name]),
+                                  **package_options)
+            for name, root in roots.items()
+        }
+
+    def package_of(self, relpath: str) -> str:
+        """Deepest package containing a workspace-relative path"""
+        best = '.'
+        for name in self.package_names:
+            if name != '.' and (relpath == name or relpath.startswith(name + '/')) and len(name) > len(best):
+                best = name
+        return best
+
+    def iter_candidates(self) -> Iterator[Tuple[Tuple[str, str], Path]]:
+        """Yield ((package, category), path) for every package, skipping files of nested packages"""
+        for name, analyzer in self.packages.items():
+            nested = [str(root) + os.sep for root in self.nested[name]]
+            for category, path in analyzer.iter_project_files():
+                if nested and str(path).startswith(tuple(nested)):
+                    continue
+                yield (name, category), path
+
+    def crawl(self) -> Dict[str, AnalysisStore]:
+        """Analyze all packages over the shared pool and cache, bucketed by package"""
+        stores = {name: AnalysisStore() for name in self.package_names}
+        for (name, category), analysis in self.driver.iter_analyses(self.iter_candidates()):
+            stores[name].add(category, analysis)
+        return stores
+
+    def generate_report(self) -> Dict:
+        """Merged report with one section per package"""
+        print(f"🔍 Analyzing {len(self.package_names)} packages: {', '.join(self.package_names)}")
+
+        packages = {}
+        for name, store in self.crawl().items():
+            report = self.packages[name].build_report(store)
+            # The cache is shared; its counts are reported once for the workspace
+            report.pop('cache', None)
+            packages[name] = report
+
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'workspace_root': str(self.workspace_root),
+            'summary': {
+                'packages': len(packages),
+                'total_files_analyzed': sum(p['summary']['total_files_analyzed'] for p in packages.values()),
+                'files_with_extension_issues': sum(p['summary']['files_with_extension_issues'] for p in packages.values()),
+            },
+            'packages': packages,
+            'cache': dict(self.driver.cache_stats or {'hits': 0, 'misses': 0}, enabled=self.driver.use_cache),
+        }
+        if self.find_duplicates:
+            report['duplicates'] = self.duplicates_section()
+        if self.driver.profile is not None:
+            report['profile'] = self.driver.profile.to_dict()
+        return report
+
+    def duplicates_section(self) -> Dict:
+        """Workspace-wide duplicate groups, each tagged with the packages it spans"""
+        section = self.driver.duplicates_section()
+        for group in section['groups']:
+            group['packages'] = sorted({self.package_of(path) for path in group['files']})
+        section['cross_package_groups'] = sum(1 for group in section['groups'] if len(group['packages']) > 1)
+        return section
+
+    def relative(self, filepath: str) -> str:
+        try:
+            return Path(filepath).relative_to(self.workspace_root).as_posix()
+        except ValueError:
+            return filepath
+
+    def print_report(self, report: Dict):
+        """Print the merged report, package by package"""
+        print("\n" + "="*60)
+        print("🎯 WORKSPACE ANALYSIS REPORT")
+        print("="*60)
+
+        summary = report['summary']
+        print(f"\n📊 SUMMARY: {summary['packages']} packages, {summary['total_files_analyzed']} files, "
+              f"{summary['files_with_extension_issues']} with extension issues")
+        cache = report.get('cache')
+        if cache and cache.get('enabled'):
+            print(f"  • Cache: {cache['hits']} hits, {cache['misses']} misses")
+
+        for name, package in report['packages'].items():
+            print(f"\n📦 {name}: {package['summary']['total_files_analyzed']} files")
+            for issue in package['extension_issues']:
+                print(f"  🚨 {self.relative(issue['file'])}: {issue['current']} → {issue['suggested']} ({issue['reason']})")
+            for filename, destination in package['destination_suggestions'].items():
+                print(f"  📁 {filename} → {destination}")
+
+        if report.get('duplicates'):
+            from duplicate_finder import print_duplicates
+            print_duplicates(report['duplicates'])
+            print(f"  • {report['duplicates']['cross_package_groups']} groups span more than one package")
+
+        print(f"\n✅ Report generated at: {report['timestamp']}")
+        print("="*60)
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Analyze every package.json root of the workspace in one run')
+    parser.add_argument('--project-root', default='.', help='Workspace root directory')
+    parser.add_argument('--packages', nargs='+', metavar='DIR',
+                        help='Package roots to analyze, relative to the workspace (default: discover package.json files)')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes shared by all packages (0 = CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-analyze every file instead of using the analysis cache')
+    parser.add_argument('--duplicates', action='store_true', help='Add workspace-wide duplicate groups')
+    parser.add_argument('--output', help='Output JSON file path')
+    parser.add_argument('--quiet', action='store_true', help='Suppress console output')
+
+    args = parser.parse_args()
+
+    analyzer = WorkspaceAnalyzer(args.project_root, packages=args.packages, find_duplicates=args.duplicates,
+                                 jobs=args.jobs, use_cache=not args.no_cache)
+    report = analyzer.generate_report()
+    if not args.quiet:
+        analyzer.print_report(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, default=json_default)
+        print(f"\n💾 Report saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()